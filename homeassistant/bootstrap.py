@@ -33,6 +33,7 @@ from .helpers import (
     issue_registry,
     recorder,
     restore_state,
+    storage,
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
@@ -56,6 +57,15 @@ _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
 
+# Stores which are loaded at once from the storage snapshot
+SNAPSHOT_STORAGE_KEYS = (
+    area_registry.STORAGE_KEY,
+    device_registry.STORAGE_KEY,
+    entity_registry.STORAGE_KEY,
+    issue_registry.STORAGE_KEY,
+    restore_state.STORAGE_KEY,
+)
+
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
 DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
@@ -247,6 +257,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
     # Load the registries and cache the result of platform.uname().processor
     entity.async_setup(hass)
     template.async_setup(hass)
+    await storage.async_load_snapshot(hass, SNAPSHOT_STORAGE_KEYS)
     await asyncio.gather(
         area_registry.async_load(hass),
         device_registry.async_load(hass),
@@ -254,6 +265,8 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_compiled_template_cache(hass),
+        loader.async_load_manifest_index(hass),
         restore_state.async_load(hass),
     )
 
@@ -588,6 +601,12 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations in the background while they are set up
+    hass.async_create_background_task(
+        loader.async_warm_import_integrations(hass, integration_cache.values()),
+        "warm import integrations",
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -690,3 +709,13 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _LOGGER.debug(
+        "Integration import times: %s",
+        {
+            integration: timedelta.total_seconds()
+            for integration, timedelta in sorted(
+                hass.data.get(loader.DATA_IMPORT_TIME, {}).items(),
+                key=lambda item: item[1].total_seconds(),
+            )
+        },
+    )
@@ -76,6 +76,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_disable,
     trace_get,
     trace_path,
 )
@@ -606,19 +607,23 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     return
 
             # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
+            if automation_trace.sampled:
+                automation_trace.set_trace(trace_get())
+            else:
+                trace_disable()
 
             # Set trigger reason
             trigger_description = variables.get("trigger", {}).get("description")
             automation_trace.set_trigger_description(trigger_description)
 
             # Add initial variables as the trigger step
-            if "trigger" in variables and "idx" in variables["trigger"]:
-                trigger_path = f"trigger/{variables['trigger']['idx']}"
-            else:
-                trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if automation_trace.sampled:
+                if "trigger" in variables and "idx" in variables["trigger"]:
+                    trigger_path = f"trigger/{variables['trigger']['idx']}"
+                else:
+                    trigger_path = "trigger"
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -6,9 +6,10 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_sample_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers.typing import ConfigType
@@ -27,9 +28,10 @@ class AutomationTrace(ActionTrace):
         config: ConfigType | None,
         blueprint_inputs: ConfigType | None,
         context: Context,
+        sampled: bool = True,
     ) -> None:
         """Container for automation trace."""
-        super().__init__(item_id, config, blueprint_inputs, context)
+        super().__init__(item_id, config, blueprint_inputs, context, sampled)
         self._trigger_description: str | None = None
 
     def set_trigger_description(self, trigger: str) -> None:
@@ -56,8 +58,9 @@ def trace_automation(
     trace_config: ConfigType,
 ) -> Generator[AutomationTrace, None, None]:
     """Trace action execution of automation with automation_id."""
-    trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    sampled = async_sample_trace(hass, f"{DOMAIN}.{automation_id}", trace_config)
+    trace = AutomationTrace(automation_id, config, blueprint_inputs, context, sampled)
+    async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -68,3 +71,4 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+            async_finish_trace(hass, trace, trace_config)
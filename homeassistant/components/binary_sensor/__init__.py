@@ -190,6 +190,7 @@ class BinarySensorEntity(Entity):
     _attr_device_class: BinarySensorDeviceClass | None
     _attr_is_on: bool | None = None
     _attr_state: None = None
+    _static_attribute_properties = frozenset({"device_class"})
 
     async def async_internal_added_to_hass(self) -> None:
         """Call when the binary sensor entity is added to hass."""
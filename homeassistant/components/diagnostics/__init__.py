@@ -16,6 +16,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, integration_platform
 from homeassistant.helpers.device_registry import DeviceEntry, async_get
+from homeassistant.helpers.entity_platform import async_get_entity_poll_stats
 from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
@@ -171,14 +172,19 @@ async def _async_get_json_file_response(
             "version": cc_obj.version,
             "requirements": cc_obj.requirements,
         }
+    payload: dict[str, Any] = {
+        "home_assistant": hass_sys_info,
+        "custom_components": custom_components,
+        "integration_manifest": integration.manifest,
+        "data": data,
+    }
+    if sub_id is None and (
+        entity_poll_stats := async_get_entity_poll_stats(hass, d_id)
+    ):
+        payload["entity_polling"] = entity_poll_stats
     try:
         json_data = json.dumps(
-            {
-                "home_assistant": hass_sys_info,
-                "custom_components": custom_components,
-                "integration_manifest": integration.manifest,
-                "data": data,
-            },
+            payload,
             indent=2,
             cls=ExtendedJSONEncoder,
         )
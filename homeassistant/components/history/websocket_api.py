@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Awaitable, Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -14,6 +15,11 @@ from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.live_stream import (
+    LiveStreamSubscription,
+    async_get_backfill_cache,
+    async_subscribe_live_stream,
+)
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_LAST_CHANGED,
@@ -38,7 +44,7 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import DOMAIN, EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,10 +54,8 @@ _LOGGER = logging.getLogger(__name__)
 class HistoryLiveStream:
     """Track a history live stream."""
 
-    stream_queue: asyncio.Queue[Event]
-    subscriptions: list[CALLBACK_TYPE]
+    subscription: LiveStreamSubscription | None = None
     end_time_unsub: CALLBACK_TYPE | None = None
-    task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
@@ -62,6 +66,17 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _states_to_json(states: MutableMapping[str, list[dict[str, Any]]]) -> list[str]:
+    """Convert the history of each entity to a JSON object member.
+
+    The history of an entity is removed from states once it is converted.
+    """
+    return [
+        f"{JSON_DUMP(entity_id)}:{JSON_DUMP(states.pop(entity_id))}"
+        for entity_id in list(states)
+    ]
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,24 +87,66 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-) -> str:
+) -> messages.StreamedMessage:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    return messages.streamed_message(
+        messages.result_message(msg_id, messages.STREAMED_ITEMS),
+        _states_to_json(cast(MutableMapping[str, list[dict[str, Any]]], states)),
+        as_object=True,
+    )
+
+
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    max_points: int,
+) -> messages.StreamedMessage:
+    """Fetch downsampled history and convert it to json in the executor.
+
+    Falls back to the significant states if the history is not downsampled.
+    """
+    if (
+        states := history.get_downsampled_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            max_points,
+        )
+    ) is None:
+        return _ws_get_significant_states(
+            hass,
             msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+            True,
         )
+    return messages.streamed_message(
+        messages.result_message(msg_id, messages.STREAMED_ITEMS),
+        _states_to_json(states),
+        as_object=True,
     )
 
 
@@ -103,6 +160,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -155,6 +213,23 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if (max_points := msg.get("max_points")) and minimal_response and no_attributes:
+        # Long periods are served from the downsampled history
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_downsampled_states,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -172,7 +247,7 @@ async def ws_get_history_during_period(
 
 
 def _generate_stream_message(
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: MutableMapping[str, list[dict[str, Any]]] | str,
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -201,18 +276,20 @@ def _generate_websocket_response(
     start_time: dt,
     end_time: dt,
     states: MutableMapping[str, list[dict[str, Any]]],
-) -> str:
+) -> messages.StreamedMessage:
     """Generate a websocket response."""
-    return JSON_DUMP(
+    return messages.streamed_message(
         messages.event_message(
-            msg_id, _generate_stream_message(states, start_time, end_time)
-        )
+            msg_id,
+            _generate_stream_message(messages.STREAMED_ITEMS, start_time, end_time),
+        ),
+        _states_to_json(states),
+        as_object=True,
     )
 
 
 def _generate_historical_response(
     hass: HomeAssistant,
-    msg_id: int,
     start_time: dt,
     end_time: dt,
     entity_ids: list[str] | None,
@@ -221,8 +298,12 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
-) -> tuple[float, dt | None, str | None]:
-    """Generate a historical response."""
+) -> tuple[float, dt | None, list[str] | None]:
+    """Generate a historical response.
+
+    Returns the JSON of the history of each entity, the message is built
+    for each subscription from it.
+    """
     states = cast(
         MutableMapping[str, list[dict[str, Any]]],
         history.get_significant_states(
@@ -257,11 +338,7 @@ def _generate_historical_response(
     else:
         last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
 
-    return (
-        last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
-    )
+    return last_time_ts, last_time_dt, _states_to_json(states)
 
 
 async def _async_send_historical_states(
@@ -276,13 +353,14 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    cache: bool = False,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
+    """Fetch history significant_states and send them to the client.
+
+    If cache is set, the history is shared with the streams of the same
+    period which start shortly after.
+    """
+    args = (
         start_time,
         end_time,
         entity_ids,
@@ -292,8 +370,34 @@ async def _async_send_historical_states(
         no_attributes,
         send_empty,
     )
-    if payload:
-        connection.send_message(payload)
+
+    def _async_query() -> Awaitable[tuple[float, dt | None, list[str] | None]]:
+        return get_instance(hass).async_add_executor_job(
+            _generate_historical_response, hass, *args
+        )
+
+    if cache:
+        last_time_ts, last_time_dt, states_json = await async_get_backfill_cache(
+            hass
+        ).async_get(
+            (DOMAIN, *args[:2], tuple(entity_ids or ()), *args[3:]), _async_query
+        )
+    else:
+        last_time_ts, last_time_dt, states_json = await _async_query()
+    if states_json is not None:
+        assert last_time_dt is not None
+        connection.send_message(
+            messages.streamed_message(
+                messages.event_message(
+                    msg_id,
+                    _generate_stream_message(
+                        messages.STREAMED_ITEMS, start_time, last_time_dt
+                    ),
+                ),
+                states_json,
+                as_object=True,
+            )
+        )
     return last_time_dt if last_time_ts != 0 else None
 
 
@@ -326,37 +430,13 @@ def _events_to_compressed_states(
     return states_by_entity_ids
 
 
-async def _async_events_consumer(
-    subscriptions_setup_complete_time: dt,
-    connection: ActiveConnection,
-    msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    no_attributes: bool,
-) -> None:
-    """Stream events from the queue."""
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired <= subscriptions_setup_complete_time:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                JSON_DUMP(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
-                )
-            )
+def _events_to_stream_event(
+    events: list[Event], no_attributes: bool
+) -> dict[str, Any] | None:
+    """Convert a batch of live events to the event of a stream message."""
+    if history_states := _events_to_compressed_states(events, no_attributes):
+        return {"states": history_states}
+    return None
 
 
 @callback
@@ -470,23 +550,18 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            cache=True,
         )
         return
 
-    subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
-    live_stream = HistoryLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
-    )
+    live_stream = HistoryLiveStream()
 
     @callback
     def _unsub(*_utc_time: Any) -> None:
         """Unsubscribe from all events."""
-        for subscription in subscriptions:
-            subscription()
-        subscriptions.clear()
-        if live_stream.task:
-            live_stream.task.cancel()
+        if live_stream.subscription:
+            live_stream.subscription.async_unsubscribe()
+            live_stream.subscription = None
         if live_stream.wait_sync_task:
             live_stream.wait_sync_task.cancel()
         if live_stream.end_time_unsub:
@@ -499,26 +574,34 @@ async def ws_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_HISTORY_STATES,
-            )
-            _unsub()
+    def _cancel() -> None:
+        """Cancel the stream of a client which fell behind."""
+        _LOGGER.debug(
+            "Client exceeded max pending messages of %s",
+            MAX_PENDING_HISTORY_STATES,
+        )
+        _unsub()
 
-    _async_subscribe_events(
+    # Streams of the same entities share the events they listen to
+    significant_only = significant_changes_only or minimal_response
+    live_stream.subscription = subscription = async_subscribe_live_stream(
         hass,
-        subscriptions,
-        _queue_or_cancel,
-        entity_ids,
-        significant_changes_only=significant_changes_only,
-        minimal_response=minimal_response,
+        (DOMAIN, tuple(sorted(set(entity_ids))), significant_only, no_attributes),
+        partial(
+            _async_subscribe_events,
+            hass,
+            entity_ids=entity_ids,
+            significant_changes_only=significant_changes_only,
+            minimal_response=minimal_response,
+        ),
+        partial(_events_to_stream_event, no_attributes=no_attributes),
+        connection,
+        msg_id,
+        _cancel,
+        EVENT_COALESCE_TIME,
+        MAX_PENDING_HISTORY_STATES,
     )
-    subscriptions_setup_complete_time = dt_util.utcnow()
+    subscriptions_setup_complete_time = subscription.start_time
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
@@ -540,15 +623,7 @@ async def ws_stream(
         # Unsubscribe happened while sending historical states
         return
 
-    live_stream.task = asyncio.create_task(
-        _async_events_consumer(
-            subscriptions_setup_complete_time,
-            connection,
-            msg_id,
-            stream_queue,
-            no_attributes,
-        )
-    )
+    subscription.async_go_live()
 
     live_stream.wait_sync_task = asyncio.create_task(
         get_instance(hass).async_block_till_done()
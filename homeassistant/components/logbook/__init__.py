@@ -17,9 +17,10 @@ from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_NAME,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -28,10 +29,12 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
 from . import rest_api, websocket_api
+from .cache import LogbookCache
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
     DOMAIN,
@@ -135,13 +138,29 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     external_events: dict[
         str, tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]]
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    hass.data[DOMAIN] = logbook_config = LogbookConfig(
+        external_events, filters, entities_filter
+    )
+    logbook_config.cache = cache = LogbookCache(hass, logbook_config)
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
     await async_process_integration_platforms(hass, DOMAIN, _process_logbook_platform)
 
+    @callback
+    def _async_start_cache(hass: HomeAssistant) -> None:
+        """Start caching the entries once every logbook platform is set up."""
+        cache.async_start()
+
+    @callback
+    def _async_stop_cache(event: Event) -> None:
+        """Stop caching the entries."""
+        cache.async_stop()
+
+    async_at_started(hass, _async_start_cache)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_cache)
+
     return True
 
 
@@ -161,4 +180,13 @@ async def _process_logbook_platform(
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
 
+    described_events = len(external_events)
     platform.async_describe_events(hass, _async_describe_event)
+    if (
+        len(external_events) != described_events
+        and (cache := logbook_config.cache)
+        and cache.start_ts is not None
+    ):
+        # The events described from now on were not cached
+        cache.async_stop()
+        cache.async_start()
@@ -0,0 +1,185 @@
+"""A cache of the logbook entries of the recent events."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime as dt
+from typing import cast
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.json import JSON_DUMP
+import homeassistant.util.dt as dt_util
+
+from .const import LOGBOOK_ENTRY_WHEN
+from .helpers import async_determine_event_types, async_event_forwarder
+from .models import LogbookConfig, async_event_to_row
+from .processor import EventProcessor
+
+# The period the entries are cached for, an hour more than the period
+# the logbook panel shows by default
+LOGBOOK_CACHE_HOURS = 25
+LOGBOOK_CACHE_MAX_ENTRIES = 100000
+# Events are humanified in batches of this size or when the cache is read
+LOGBOOK_CACHE_BATCH_SIZE = 1000
+
+
+def _cache_cutoff_ts() -> float:
+    """Return the time the entries are cached from."""
+    return dt_util.utcnow().timestamp() - LOGBOOK_CACHE_HOURS * 3600
+
+
+def get_events_json(
+    event_processor: EventProcessor, start_day: dt, end_day: dt
+) -> tuple[list[float], list[str]]:
+    """Fetch events and convert them to json in the executor."""
+    events = event_processor.get_events(start_day, end_day)
+    return (
+        [event[LOGBOOK_ENTRY_WHEN] for event in events],
+        [JSON_DUMP(event) for event in events],
+    )
+
+
+class LogbookCache:
+    """The logbook entries of the recent events of all entities.
+
+    The events are humanified as they are committed by the recorder, with
+    their context taken from the event which started it instead of looking
+    up the context rows in the database, and the entries are kept as JSON. Requests for
+    the entries of all entities after the start of the cache are answered
+    without querying the database. The entries of a request which starts
+    before the cache are fetched from the database once and added to it.
+    """
+
+    def __init__(self, hass: HomeAssistant, logbook_config: LogbookConfig) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._logbook_config = logbook_config
+        # The entries of events fired after start_ts are cached
+        self.start_ts: float | None = None
+        self._times: list[float] = []
+        self._entries: list[str] = []
+        self._events: list[Event] = []
+        self._event_processor: EventProcessor | None = None
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start caching the entries of the events fired from now on.
+
+        The cache starts once Home Assistant started, so the events of
+        every integration which describes logbook events are cached.
+        """
+        if DATA_INSTANCE not in self.hass.data:
+            # The entries are only cached from the events the recorder commits
+            return
+        event_types = async_determine_event_types(self.hass, None, None)
+        self._event_processor = EventProcessor(
+            self.hass, event_types, timestamp=True, include_entity_name=False
+        )
+        self._event_processor.switch_to_live()
+        self.start_ts = start_ts = dt_util.utcnow().timestamp()
+        event_forwarder = async_event_forwarder(
+            self.hass,
+            self._async_add_event,
+            event_types,
+            self._logbook_config.entity_filter,
+        )
+
+        @callback
+        def _async_add_committed_events(events: list[Event]) -> None:
+            """Add the events the recorder committed to the database."""
+            for event in events:
+                # Events fired before the start are filled in from the database
+                if event.time_fired.timestamp() >= start_ts:
+                    event_forwarder(event)
+
+        self._unsubs.append(
+            get_instance(self.hass).async_listen_committed_events(
+                _async_add_committed_events
+            )
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop caching entries and clear the cache."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self.start_ts = None
+        self._times = []
+        self._entries = []
+        self._events = []
+
+    @callback
+    def _async_add_event(self, event: Event) -> None:
+        """Add an event to the cache."""
+        self._events.append(event)
+        if len(self._events) >= LOGBOOK_CACHE_BATCH_SIZE:
+            self._async_humanify_events()
+
+    @callback
+    def _async_humanify_events(self) -> None:
+        """Humanify the events added since the last batch.
+
+        The oldest entries are removed once they are older than the cached
+        period or there are too many entries.
+        """
+        assert self._event_processor is not None and self.start_ts is not None
+        events, self._events = self._events, []
+        times = self._times
+        entries = self._entries
+        for entry in self._event_processor.humanify(
+            async_event_to_row(event) for event in events
+        ):
+            times.append(cast(float, entry[LOGBOOK_ENTRY_WHEN]))
+            entries.append(JSON_DUMP(entry))
+        expired = max(
+            bisect_left(times, _cache_cutoff_ts()),
+            len(times) - LOGBOOK_CACHE_MAX_ENTRIES,
+        )
+        if expired > 0:
+            self.start_ts = max(self.start_ts, times[expired - 1])
+            del times[:expired]
+            del entries[:expired]
+
+    async def async_get_events(
+        self, event_processor: EventProcessor, start_day: dt, end_day: dt
+    ) -> tuple[list[str], dt | None] | None:
+        """Return the JSON of the entries during a period and the time of the last.
+
+        Returns None if the request can not be answered from the cache.
+        """
+        if (cache_start_ts := self.start_ts) is None or (
+            event_processor.limited_select
+        ):
+            return None
+        start_ts = start_day.timestamp()
+        end_ts = end_day.timestamp()
+        if start_ts < cache_start_ts:
+            if end_ts <= cache_start_ts or start_ts < _cache_cutoff_ts():
+                return None
+            # Fill the cache in from the database
+            times, entries = await get_instance(self.hass).async_add_executor_job(
+                get_events_json,
+                event_processor,
+                start_day,
+                dt_util.utc_from_timestamp(cache_start_ts),
+            )
+            if self.start_ts != cache_start_ts:
+                # Entries were removed from the cache while fetching
+                return None
+            self._times[:0] = times
+            self._entries[:0] = entries
+            self.start_ts = start_ts
+
+        if self._events:
+            self._async_humanify_events()
+        start = bisect_right(self._times, start_ts)
+        end = bisect_left(self._times, end_ts)
+        if start == end:
+            return [], None
+        return (
+            self._entries[start:end],
+            dt_util.utc_from_timestamp(self._times[end - 1]),
+        )
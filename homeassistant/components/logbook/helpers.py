@@ -187,17 +187,9 @@ def async_subscribe_events(
         # changed events
         return
 
-    @callback
-    def _forward_state_events_filtered(event: EventType[EventStateChangedData]) -> None:
-        if (old_state := event.data["old_state"]) is None or (
-            new_state := event.data["new_state"]
-        ) is None:
-            return
-        if _is_state_filtered(ent_reg, new_state, old_state) or (
-            entities_filter and not entities_filter(new_state.entity_id)
-        ):
-            return
-        target(event)
+    _forward_state_events_filtered = _state_event_forwarder_filtered(
+        ent_reg, target, entities_filter
+    )
 
     if entity_ids:
         subscriptions.append(
@@ -217,6 +209,56 @@ def async_subscribe_events(
     )
 
 
+@callback
+def async_event_forwarder(
+    hass: HomeAssistant,
+    target: Callable[[Event], None],
+    event_types: tuple[str, ...],
+    entities_filter: Callable[[str], bool] | None,
+) -> Callable[[Event], None]:
+    """Make a callable which forwards the events of all entities to target.
+
+    Forwards the same events as async_subscribe_events does for all
+    entities, for events which are not received from the bus.
+    """
+    event_types_set = set(event_types)
+    event_forwarder = event_forwarder_filtered(target, entities_filter, None, None)
+    state_event_forwarder = _state_event_forwarder_filtered(
+        er.async_get(hass), target, entities_filter
+    )
+
+    @callback
+    def _forward_event(event: Event) -> None:
+        if event.event_type == EVENT_STATE_CHANGED:
+            state_event_forwarder(event)  # type: ignore[arg-type]
+        elif event.event_type in event_types_set:
+            event_forwarder(event)
+
+    return _forward_event
+
+
+def _state_event_forwarder_filtered(
+    ent_reg: er.EntityRegistry,
+    target: Callable[[Event], None],
+    entities_filter: Callable[[str], bool] | None,
+) -> Callable[[EventType[EventStateChangedData]], None]:
+    """Make a callable to filter state changed events."""
+
+    @callback
+    def _forward_state_events_filtered(event: EventType[EventStateChangedData]) -> None:
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        if _is_state_filtered(ent_reg, new_state, old_state) or (
+            entities_filter and not entities_filter(new_state.entity_id)
+        ):
+            return
+        target(event)
+
+    return _forward_state_events_filtered
+
+
 def is_sensor_continuous(ent_reg: er.EntityRegistry, entity_id: str) -> bool:
     """Determine if a sensor is continuous by checking its state class.
 
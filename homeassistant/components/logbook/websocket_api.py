@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+import functools
 import logging
 from typing import Any
 
@@ -14,6 +15,11 @@ from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.live_stream import (
+    LiveStreamSubscription,
+    async_get_backfill_cache,
+    async_subscribe_live_stream,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import JSON_DUMP
@@ -42,10 +48,8 @@ _LOGGER = logging.getLogger(__name__)
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
-    subscriptions: list[CALLBACK_TYPE]
+    subscription: LiveStreamSubscription | None = None
     end_time_unsub: CALLBACK_TYPE | None = None
-    task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
@@ -83,6 +87,7 @@ async def _async_send_historical_events(
     event_processor: EventProcessor,
     partial: bool,
     force_send: bool = False,
+    cache: bool = False,
 ) -> dt | None:
     """Select historical data from the database and deliver it to the websocket.
 
@@ -93,7 +98,8 @@ async def _async_send_historical_events(
     the data right away.
 
     This function returns the time of the most recent event we sent to the
-    websocket.
+    websocket. If cache is set, the events are shared with the streams of
+    the same period which start shortly after.
     """
     is_big_query = (
         not event_processor.entity_ids
@@ -110,6 +116,7 @@ async def _async_send_historical_events(
             formatter,
             event_processor,
             partial,
+            cache,
         )
         # If there is no last_event_time, there are no historical
         # results, but we still send an empty message
@@ -131,7 +138,8 @@ async def _async_send_historical_events(
         end_time,
         formatter,
         event_processor,
-        partial=True,
+        True,
+        cache,
     )
     if recent_query_last_event_time:
         connection.send_message(recent_message)
@@ -144,6 +152,7 @@ async def _async_send_historical_events(
         formatter,
         event_processor,
         partial,
+        cache,
     )
     # If there is no last_event_time, there are no historical
     # results, but we still send an empty message
@@ -165,21 +174,42 @@ async def _async_get_ws_stream_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[str, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
-        msg_id,
-        start_time,
-        end_time,
-        formatter,
-        event_processor,
-        partial,
+    cache: bool,
+) -> tuple[messages.StreamedMessage, dt | None]:
+    """Async wrapper around _ws_stream_get_events."""
+
+    def _async_query() -> Awaitable[tuple[list[str], dt | None]]:
+        return _async_get_events_json(hass, start_time, end_time, event_processor)
+
+    if cache:
+        events_json, last_time = await async_get_backfill_cache(hass).async_get(
+            (
+                DOMAIN,
+                start_time,
+                end_time,
+                event_processor.event_types,
+                tuple(event_processor.entity_ids or ()),
+                tuple(event_processor.device_ids or ()),
+            ),
+            _async_query,
+        )
+    else:
+        events_json, last_time = await _async_query()
+    message = _generate_stream_message(messages.STREAMED_ITEMS, start_time, end_time)
+    if partial:
+        # This is a hint to consumers of the api that
+        # we are about to send a another block of historical
+        # data in case the UI needs to show that historical
+        # data is still loading in the future
+        message["partial"] = True
+    return (
+        messages.streamed_message(formatter(msg_id, message), events_json),
+        last_time,
     )
 
 
 def _generate_stream_message(
-    events: list[dict[str, Any]], start_day: dt, end_day: dt
+    events: list[dict[str, Any]] | str, start_day: dt, end_day: dt
 ) -> dict[str, Any]:
     """Generate a logbook stream message response."""
     return {
@@ -189,62 +219,46 @@ def _generate_stream_message(
     }
 
 
+async def _async_get_events_json(
+    hass: HomeAssistant, start_time: dt, end_time: dt, event_processor: EventProcessor
+) -> tuple[list[str], dt | None]:
+    """Return the events from the logbook cache or the database."""
+    logbook_config: LogbookConfig = hass.data[DOMAIN]
+    if (
+        logbook_config.cache
+        and (
+            cached := await logbook_config.cache.async_get_events(
+                event_processor, start_time, end_time
+            )
+        )
+        is not None
+    ):
+        return cached
+    return await get_instance(hass).async_add_executor_job(
+        _ws_stream_get_events, start_time, end_time, event_processor
+    )
+
+
 def _ws_stream_get_events(
-    msg_id: int,
-    start_day: dt,
-    end_day: dt,
-    formatter: Callable[[int, Any], dict[str, Any]],
-    event_processor: EventProcessor,
-    partial: bool,
-) -> tuple[str, dt | None]:
+    start_day: dt, end_day: dt, event_processor: EventProcessor
+) -> tuple[list[str], dt | None]:
     """Fetch events and convert them to json in the executor."""
     events = event_processor.get_events(start_day, end_day)
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
-    message = _generate_stream_message(events, start_day, end_day)
-    if partial:
-        # This is a hint to consumers of the api that
-        # we are about to send a another block of historical
-        # data in case the UI needs to show that historical
-        # data is still loading in the future
-        message["partial"] = True
-    return JSON_DUMP(formatter(msg_id, message)), last_time
+    return [JSON_DUMP(event) for event in events], last_time
 
 
-async def _async_events_consumer(
-    subscriptions_setup_complete_time: dt,
-    connection: ActiveConnection,
-    msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    event_processor: EventProcessor,
-) -> None:
-    """Stream events from the queue."""
-    while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired <= subscriptions_setup_complete_time:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
-        while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
-            connection.send_message(
-                JSON_DUMP(
-                    messages.event_message(
-                        msg_id,
-                        {"events": logbook_events},
-                    )
-                )
-            )
+def _events_to_stream_event(
+    events: list[Event], event_processor: EventProcessor
+) -> dict[str, Any] | None:
+    """Convert a batch of live events to the event of a stream message."""
+    if logbook_events := event_processor.humanify(
+        async_event_to_row(e) for e in events
+    ):
+        return {"events": logbook_events}
+    return None
 
 
 @websocket_api.websocket_command(
@@ -316,23 +330,18 @@ async def ws_event_stream(
             messages.event_message,
             event_processor,
             partial=False,
+            cache=True,
         )
         return
 
-    subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
-    live_stream = LogbookLiveStream(
-        subscriptions=subscriptions, stream_queue=stream_queue
-    )
+    live_stream = LogbookLiveStream()
 
     @callback
     def _unsub(*time: Any) -> None:
         """Unsubscribe from all events."""
-        for subscription in subscriptions:
-            subscription()
-        subscriptions.clear()
-        if live_stream.task:
-            live_stream.task.cancel()
+        if live_stream.subscription:
+            live_stream.subscription.async_unsubscribe()
+            live_stream.subscription = None
         if live_stream.wait_sync_task:
             live_stream.wait_sync_task.cancel()
         if live_stream.end_time_unsub:
@@ -345,32 +354,56 @@ async def ws_event_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
-        try:
-            stream_queue.put_nowait(event)
-        except asyncio.QueueFull:
-            _LOGGER.debug(
-                "Client exceeded max pending messages of %s",
-                MAX_PENDING_LOGBOOK_EVENTS,
-            )
-            _unsub()
+    def _cancel() -> None:
+        """Cancel the stream of a client which fell behind."""
+        _LOGGER.debug(
+            "Client exceeded max pending messages of %s",
+            MAX_PENDING_LOGBOOK_EVENTS,
+        )
+        _unsub()
 
     entities_filter: Callable[[str], bool] | None = None
     if not event_processor.limited_select:
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         entities_filter = logbook_config.entity_filter
 
-    async_subscribe_events(
+    # The live events are humanified once for the streams of the same
+    # entities and devices
+    live_event_processor = EventProcessor(
         hass,
-        subscriptions,
-        _queue_or_cancel,
         event_types,
-        entities_filter,
         entity_ids,
         device_ids,
+        None,
+        timestamp=True,
+        include_entity_name=False,
+    )
+    live_event_processor.switch_to_live()
+    live_stream.subscription = subscription = async_subscribe_live_stream(
+        hass,
+        (
+            DOMAIN,
+            tuple(sorted(set(entity_ids or ()))),
+            tuple(sorted(set(device_ids or ()))),
+        ),
+        functools.partial(
+            async_subscribe_events,
+            hass,
+            event_types=event_types,
+            entities_filter=entities_filter,
+            entity_ids=entity_ids,
+            device_ids=device_ids,
+        ),
+        functools.partial(
+            _events_to_stream_event, event_processor=live_event_processor
+        ),
+        connection,
+        msg_id,
+        _cancel,
+        EVENT_COALESCE_TIME,
+        MAX_PENDING_LOGBOOK_EVENTS,
     )
-    subscriptions_setup_complete_time = dt_util.utcnow()
+    subscriptions_setup_complete_time = subscription.start_time
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
@@ -394,15 +427,7 @@ async def ws_event_stream(
         # Unsubscribe happened while sending historical events
         return
 
-    live_stream.task = asyncio.create_task(
-        _async_events_consumer(
-            subscriptions_setup_complete_time,
-            connection,
-            msg_id,
-            stream_queue,
-            event_processor,
-        )
-    )
+    subscription.async_go_live()
 
     live_stream.wait_sync_task = asyncio.create_task(
         get_instance(hass).async_block_till_done()
@@ -427,21 +452,6 @@ async def ws_event_stream(
         event_processor,
         partial=False,
     )
-    event_processor.switch_to_live()
-
-
-def _ws_formatted_get_events(
-    msg_id: int,
-    start_time: dt,
-    end_time: dt,
-    event_processor: EventProcessor,
-) -> str:
-    """Fetch events and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
-        )
-    )
 
 
 @websocket_api.websocket_command(
@@ -503,12 +513,11 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    events_json, _ = await _async_get_events_json(
+        hass, start_time, end_time, event_processor
+    )
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
-            _ws_formatted_get_events,
-            msg["id"],
-            start_time,
-            end_time,
-            event_processor,
+        messages.streamed_message(
+            messages.result_message(msg["id"], messages.STREAMED_ITEMS), events_json
         )
     )
@@ -22,6 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import compiled_template_cache_stats
 
 from .const import DOMAIN
 
@@ -214,6 +215,11 @@ async def async_setup_entry(  # noqa: C901
                         "Cache data for sqlalchemy LRUCache %s: %s: %s", lru, key, value
                     )
 
+        _LOGGER.critical(
+            "Cache stats for compiled templates: %s",
+            compiled_template_cache_stats(hass),
+        )
+
         persistent_notification.create(
             hass,
             (
@@ -36,6 +36,7 @@ from .const import (  # noqa: F401
     SupportedDialect,
 )
 from .core import Recorder
+from .partition import PARTITION_INTERVALS
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -59,6 +60,13 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_PARTITION_INTERVAL = "partition_interval"
+CONF_STATISTICS_BUFFER = "statistics_buffer"
+CONF_READ_DB_URL = "read_db_url"
+CONF_READ_POOL_SIZE = "read_pool_size"
+CONF_READ_QUERY_TIMEOUT = "read_query_timeout"
+CONF_DOWNSAMPLED_HISTORY = "downsampled_history"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -111,6 +119,13 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_PARTITION_INTERVAL): vol.In(PARTITION_INTERVALS),
+                    vol.Optional(CONF_STATISTICS_BUFFER, default=False): cv.boolean,
+                    vol.Optional(CONF_READ_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_READ_POOL_SIZE, default=0): cv.positive_int,
+                    vol.Optional(CONF_READ_QUERY_TIMEOUT, default=0): cv.positive_int,
+                    vol.Optional(CONF_DOWNSAMPLED_HISTORY, default=False): cv.boolean,
                 }
             ),
         )
@@ -141,6 +156,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    bulk_insert = conf[CONF_BULK_INSERT]
+    partition_interval = conf.get(CONF_PARTITION_INTERVAL)
+    statistics_buffer = conf[CONF_STATISTICS_BUFFER]
+    read_db_url = conf.get(CONF_READ_DB_URL)
+    read_pool_size = conf[CONF_READ_POOL_SIZE]
+    read_query_timeout = conf[CONF_READ_QUERY_TIMEOUT]
+    downsampled_history = conf[CONF_DOWNSAMPLED_HISTORY]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -160,6 +182,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert=bulk_insert,
+        partition_interval=partition_interval,
+        statistics_buffer=statistics_buffer,
+        read_db_url=read_db_url,
+        read_pool_size=read_pool_size,
+        read_query_timeout=read_query_timeout,
+        downsampled_history=downsampled_history,
     )
     instance.async_initialize()
     instance.async_register()
@@ -29,7 +29,7 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
@@ -40,7 +40,7 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
-from . import migration, statistics
+from . import migration, partition, statistics
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
@@ -85,6 +85,9 @@ from .queries import (
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .read_pool import create_read_engine
+from .statistics_buffer import StatisticsBuffer
+from .table_managers.bulk_insert import BulkEvents, BulkInsertManager, BulkStates
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -95,6 +98,7 @@ from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
+    AllocatePartitionsTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
@@ -149,6 +153,7 @@ COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
+ALLOCATE_PARTITIONS_TASK = AllocatePartitionsTask()
 
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
@@ -178,6 +183,13 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        bulk_insert: bool,
+        partition_interval: str | None,
+        statistics_buffer: bool,
+        read_db_url: str | None,
+        read_pool_size: int,
+        read_query_timeout: int,
+        downsampled_history: bool,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -211,21 +223,38 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        self.bulk_insert = bulk_insert
+        self.partition_interval = partition_interval
+        self.use_partitions = False
 
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Listeners for the events of each commit, and the events recorded
+        # in the event session which are passed to them once it is committed
+        self._committed_events_listeners: list[Callable[[list[Event]], None]] = []
+        self._pending_committed_events: list[Event] = []
+        self._rows_added = 0
 
         self.recorder_runs_manager = RecorderRunsManager()
+        self.bulk_insert_manager = BulkInsertManager()
         self.states_manager = StatesManager()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_buffer = StatisticsBuffer()
+        self.statistics_buffer.active = statistics_buffer
+        self.read_db_url = read_db_url
+        self.read_pool_size = read_pool_size
+        self.read_query_timeout = read_query_timeout
+        self._read_engine: Engine | None = None
+        self.downsampled_history = downsampled_history
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -278,6 +307,15 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for read-only queries.
+
+        The session uses the read pool if there is one.
+        """
+        if self._get_read_session is None:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -291,7 +329,8 @@ class Recorder(threading.Thread):
         """Start the executor."""
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            # Every connection of the read pool can be used concurrently
+            max_workers=MAX_DB_EXECUTOR_WORKERS + self.read_pool_size,
             shutdown_hook=self._shutdown_pool,
         )
 
@@ -300,6 +339,29 @@ class Recorder(threading.Thread):
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    @callback
+    def async_listen_committed_events(
+        self, listener: Callable[[list[Event]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the events which were committed to the database.
+
+        The listener is called in the event loop with the events of each
+        commit, in the order they were recorded.
+        """
+        self._committed_events_listeners.append(listener)
+
+        @callback
+        def _async_remove_listener() -> None:
+            self._committed_events_listeners.remove(listener)
+
+        return _async_remove_listener
+
+    @callback
+    def _async_committed_events(self, events: list[Event]) -> None:
+        """Pass the events of a commit to the listeners."""
+        for listener in list(self._committed_events_listeners):
+            listener(events)
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
@@ -428,6 +490,8 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        # States are no longer recorded so they cannot be buffered either
+        self.statistics_buffer.active = False
 
     @callback
     def _async_stop_listeners(self) -> None:
@@ -549,6 +613,8 @@ class Recorder(threading.Thread):
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
         self.queue_task(ADJUST_LRU_SIZE_TASK)
+        if self.use_partitions:
+            self.queue_task(ALLOCATE_PARTITIONS_TASK)
         self.async_periodic_statistics()
 
     def _adjust_lru_size(self) -> None:
@@ -711,6 +777,24 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_row_to_session(
+        self, session: Session, obj: Events | States | BulkEvents | BulkStates
+    ) -> None:
+        """Add a new States or Events row to the session.
+
+        Rows built for bulk inserts are kept out of the session
+        and inserted with executemany at the next commit.
+        """
+        self._rows_added += 1
+        if isinstance(obj, BulkStates):
+            self._event_session_has_pending_writes = True
+            self.bulk_insert_manager.add_state(obj)
+        elif isinstance(obj, BulkEvents):
+            self._event_session_has_pending_writes = True
+            self.bulk_insert_manager.add_event(obj)
+        else:
+            self._add_to_session(session, obj)
+
     def _run(self) -> None:
         """Start processing events to save."""
         self.thread_id = threading.get_ident()
@@ -1015,11 +1099,16 @@ class Recorder(threading.Thread):
 
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
+            # The buffered states are incomplete once a state is not recorded
+            self.statistics_buffer.reset()
             return
+        rows_added = self._rows_added
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        if self._committed_events_listeners and self._rows_added != rows_added:
+            self._pending_committed_events.append(event)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1028,7 +1117,11 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        dbevent: Events | BulkEvents
+        if self.bulk_insert_manager.active:
+            dbevent = BulkEvents(event)
+        else:
+            dbevent = Events.from_event(event)
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
@@ -1043,7 +1136,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_row_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1068,7 +1161,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_row_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1077,7 +1170,11 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | BulkStates
+        if self.bulk_insert_manager.active:
+            dbstate = BulkStates(event)
+        else:
+            dbstate = States.from_event(event)
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
@@ -1141,7 +1238,14 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self.statistics_buffer.active:
+            new_state: State | None = event.data.get("new_state")
+            self.statistics_buffer.add_state(
+                entity_id,
+                new_state.last_updated if new_state else event.time_fired,
+                new_state,
+            )
+        self._add_row_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1180,12 +1284,20 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self.bulk_insert_manager.has_pending:
+            self.bulk_insert_manager.flush(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
+        if committed_events := self._pending_committed_events:
+            self._pending_committed_events = []
+            self.hass.loop.call_soon_threadsafe(
+                self._async_committed_events, committed_events
+            )
+        self.bulk_insert_manager.post_commit_pending()
         self.states_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
@@ -1212,6 +1324,10 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        # The events of the session are rolled back
+        self._pending_committed_events = []
+        self.bulk_insert_manager.reset()
+        self.statistics_buffer.reset()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1403,12 +1519,89 @@ class Recorder(threading.Thread):
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
+        if self.partition_interval:
+            self._create_partitioned_tables()
         Base.metadata.create_all(self.engine)
+        self._setup_bulk_insert()
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self.read_pool_size:
+            self._setup_read_pool()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_pool(self) -> None:
+        """Create the pool of read-only connections."""
+        self._read_engine = create_read_engine(
+            self,
+            self.read_db_url or self.db_url,
+            self.read_pool_size,
+            self.read_query_timeout,
+        )
+        if self._read_engine:
+            self._get_read_session = scoped_session(
+                sessionmaker(bind=self._read_engine, future=True)
+            )
+
+    def _setup_bulk_insert(self) -> None:
+        """Activate bulk inserts if enabled and supported by the database."""
+        assert self.engine is not None
+        self.bulk_insert_manager.active = False
+        if not self.bulk_insert:
+            return
+        # The state_ids of a bulk insert must be returned in the order the
+        # rows were passed in to be able to link the old_state_id
+        if not self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            _LOGGER.warning(
+                "Bulk inserts are not supported by the %s database, "
+                "rows will be inserted one at a time",
+                self.engine.dialect.name,
+            )
+            return
+        self.bulk_insert_manager.active = True
+
+    def _create_partitioned_tables(self) -> None:
+        """Create partitioned states and events tables for a new database."""
+        assert self.engine is not None
+        if self._dialect_name not in partition.PARTITIONED_DIALECTS:
+            _LOGGER.warning(
+                "Partitioned tables are not supported by the %s database",
+                self.engine.dialect.name,
+            )
+            return
+        partition.create_partitioned_tables(self.engine, self._dialect_name)
+
+    def _setup_partitions(self) -> None:
+        """Detect partitioned tables and allocate the upcoming partitions."""
+        self.use_partitions = False
+        if (dialect_name := self._dialect_name) not in partition.PARTITIONED_DIALECTS:
+            return
+        with session_scope(session=self.get_session()) as session:
+            if not partition.tables_are_partitioned(session, dialect_name):
+                if self.partition_interval:
+                    _LOGGER.warning(
+                        "Partitioned tables can only be created for a new database,"
+                        " old rows will be purged in batches"
+                    )
+                return
+        self.use_partitions = True
+        self._allocate_partitions()
+
+    def _allocate_partitions(self) -> None:
+        """Allocate partitions for the upcoming states and events."""
+        assert self._dialect_name is not None
+        with session_scope(session=self.get_session()) as session:
+            partition.allocate_partitions(
+                session,
+                self._dialect_name,
+                partition.partition_interval(self.partition_interval),
+                time.time(),
+            )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        self._get_read_session = None
+        if self._read_engine:
+            self._read_engine.dispose()
+            self._read_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -1420,6 +1613,7 @@ class Recorder(threading.Thread):
             end_incomplete_runs(session, self.recorder_runs_manager.recording_start)
             self.recorder_runs_manager.start(session)
 
+        self._setup_partitions()
         self._open_event_session()
 
     def _schedule_compile_missing_statistics(self) -> None:
@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 43
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +84,7 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATES_DOWNSAMPLED = "states_downsampled"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -105,6 +106,7 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATES_DOWNSAMPLED,
 ]
 
 TABLES_TO_CHECK = [
@@ -626,6 +628,47 @@ class StatesMeta(Base):
         )
 
 
+class StatesDownsampled(Base):
+    """The states of an entity downsampled to a bucket of a history tier.
+
+    Only buckets during which the entity recorded states have a row.
+    """
+
+    __table_args__ = (
+        # Used for fetching the buckets of an entity during a period
+        Index(
+            "ix_states_downsampled_metadata_id_tier_start_ts",
+            "metadata_id",
+            "tier",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_DOWNSAMPLED
+    id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey(f"{TABLE_STATES_META}.metadata_id", ondelete="CASCADE")
+    )
+    # The length of the bucket in seconds
+    tier: Mapped[int | None] = mapped_column(Integer)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    # The last state recorded during the bucket
+    state: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_STATE))
+    # The range of the numeric states recorded during the bucket
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatesDownsampled("
+            f"id={self.id}, metadata_id={self.metadata_id}, tier={self.tier},"
+            f" start_ts={self.start_ts}, state='{self.state}'"
+            ")>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
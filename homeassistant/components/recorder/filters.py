@@ -8,7 +8,11 @@ from sqlalchemy import Column, Text, cast, not_, or_
 from sqlalchemy.sql.elements import ColumnElement
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
+from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
+    EntityFilterCase,
+    entity_filter_case,
+)
 from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.typing import ConfigType
 
@@ -139,7 +143,8 @@ class Filters:
     ) -> ColumnElement:
         """Generate a filter from pre-computed sets and pattern lists.
 
-        This must match exactly how homeassistant.helpers.entityfilter works.
+        The filter is generated for the same EntityFilterCase as the filter
+        of homeassistant.helpers.entityfilter so they match exactly.
         """
         i_domains = _domain_matcher(self._included_domains, columns, encoder)
         i_entities = _entity_matcher(self._included_entities, columns, encoder)
@@ -151,57 +156,35 @@ class Filters:
         e_entity_globs = _globs_to_like(self._excluded_entity_globs, columns, encoder)
         excludes = [e_domains, e_entities, e_entity_globs]
 
-        have_exclude = self._have_exclude
-        have_include = self._have_include
+        case = entity_filter_case(
+            self._included_domains,
+            self._included_entities,
+            self._excluded_domains,
+            self._excluded_entities,
+            self._included_entity_globs,
+            self._excluded_entity_globs,
+        )
 
-        # Case 1 - No filter
-        # - All entities included
-        if not have_include and not have_exclude:
+        if case is EntityFilterCase.ALL:
             raise RuntimeError(
                 "No filter configuration provided, check has_config before calling this method."
             )
 
-        # Case 2 - Only includes
-        # - Entity listed in entities include: include
-        # - Otherwise, entity matches domain include: include
-        # - Otherwise, entity matches glob include: include
-        # - Otherwise: exclude
-        if have_include and not have_exclude:
+        if case is EntityFilterCase.INCLUDE:
             return or_(*includes).self_group()
 
-        # Case 3 - Only excludes
-        # - Entity listed in exclude: exclude
-        # - Otherwise, entity matches domain exclude: exclude
-        # - Otherwise, entity matches glob exclude: exclude
-        # - Otherwise: include
-        if not have_include and have_exclude:
+        if case is EntityFilterCase.EXCLUDE:
             return not_(or_(*excludes).self_group())
 
-        # Case 4 - Domain and/or glob includes (may also have excludes)
-        # - Entity listed in entities include: include
-        # - Otherwise, entity listed in entities exclude: exclude
-        # - Otherwise, entity matches glob include: include
-        # - Otherwise, entity matches glob exclude: exclude
-        # - Otherwise, entity matches domain include: include
-        # - Otherwise: exclude
-        if self._included_domains or self._included_entity_globs:
+        if case is EntityFilterCase.DOMAIN_OR_GLOB_INCLUDE:
             return or_(
                 i_entities,
                 (~e_entities & (i_entity_globs | (~e_entity_globs & i_domains))),
             ).self_group()
 
-        # Case 5 - Domain and/or glob excludes (no domain and/or glob includes)
-        # - Entity listed in entities include: include
-        # - Otherwise, entity listed in exclude: exclude
-        # - Otherwise, entity matches glob exclude: exclude
-        # - Otherwise, entity matches domain exclude: exclude
-        # - Otherwise: include
-        if self._excluded_domains or self._excluded_entity_globs:
+        if case is EntityFilterCase.DOMAIN_OR_GLOB_EXCLUDE:
             return (not_(or_(*excludes)) | i_entities).self_group()  # type: ignore[no-any-return, no-untyped-call]
 
-        # Case 6 - No Domain and/or glob includes or excludes
-        # - Entity listed in entities include: include
-        # - Otherwise: exclude
         return i_entities
 
     def states_entity_filter(self) -> ColumnElement:
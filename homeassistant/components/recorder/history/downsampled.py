@@ -0,0 +1,385 @@
+"""Downsampled history tiers for long ranges of history.
+
+Every 5 minutes the states recorded during the last 5 minutes are
+downsampled to a bucket per entity, and at the end of each hour the
+5-minute buckets are downsampled to an hourly bucket. A bucket keeps the
+last state recorded during it and the range of the numeric states, which
+is enough to draw the history of a long period with a few points per
+bucket instead of every state.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, MutableMapping
+from datetime import datetime, timedelta
+from itertools import groupby
+import math
+from operator import itemgetter
+from typing import Any
+
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from ... import recorder
+from ..db_schema import States, StatesDownsampled, StatisticsRuns
+from ..models import process_timestamp
+from ..util import execute_stmt_lambda_element, session_scope
+from .const import NEED_ATTRIBUTE_DOMAINS
+from .modern import get_significant_states_with_session
+
+TIER_5MINUTE = 300
+TIER_HOUR = 3600
+# Ordered from the finest to the coarsest tier
+TIERS = (TIER_5MINUTE, TIER_HOUR)
+# The resolution of the recorded states assumed when picking a tier
+UNDOWNSAMPLED_RESOLUTION = 60
+
+
+def _get_states_during_stmt(start_ts: float, end_ts: float) -> StatementLambdaElement:
+    """Generate a statement for the states recorded during a period."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id, States.state)
+        .filter(States.last_updated_ts >= start_ts)
+        .filter(States.last_updated_ts < end_ts)
+        .filter(States.metadata_id.is_not(None))
+        .filter(States.state.is_not(None))
+        .order_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
+def _get_buckets_during_stmt(
+    tier: int, start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Generate a statement for the buckets of a tier during a period."""
+    return lambda_stmt(
+        lambda: select(
+            StatesDownsampled.metadata_id,
+            StatesDownsampled.state,
+            StatesDownsampled.min,
+            StatesDownsampled.max,
+        )
+        .filter(StatesDownsampled.tier == tier)
+        .filter(StatesDownsampled.start_ts >= start_ts)
+        .filter(StatesDownsampled.start_ts < end_ts)
+        .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+    )
+
+
+def _get_entity_buckets_stmt(
+    tier: int, metadata_ids: list[int], start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Generate a statement for the buckets of entities during a period."""
+    return lambda_stmt(
+        lambda: select(
+            StatesDownsampled.metadata_id,
+            StatesDownsampled.start_ts,
+            StatesDownsampled.state,
+            StatesDownsampled.min,
+            StatesDownsampled.max,
+        )
+        .filter(StatesDownsampled.metadata_id.in_(metadata_ids))
+        .filter(StatesDownsampled.tier == tier)
+        .filter(StatesDownsampled.start_ts >= start_ts)
+        .filter(StatesDownsampled.start_ts < end_ts)
+        .order_by(StatesDownsampled.metadata_id, StatesDownsampled.start_ts)
+    )
+
+
+def _get_first_bucket_start_stmt(tier: int) -> StatementLambdaElement:
+    """Generate a statement for the start of the oldest bucket of a tier."""
+    return lambda_stmt(
+        lambda: select(func.min(StatesDownsampled.start_ts)).filter(
+            StatesDownsampled.tier == tier
+        )
+    )
+
+
+def _numeric_value(state: str) -> float | None:
+    """Return the numeric value of a state, None if it is not numeric."""
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _add_buckets(
+    session: Session,
+    tier: int,
+    start: datetime,
+    rows: Iterable[Row],
+    bucket_values: Callable[[Iterable[Row]], tuple[str, float | None, float | None]],
+) -> None:
+    """Add a bucket per entity from rows sorted by metadata_id."""
+    start_ts = start.timestamp()
+    for metadata_id, group in groupby(rows, itemgetter(0)):
+        state, min_value, max_value = bucket_values(group)
+        session.add(
+            StatesDownsampled(
+                metadata_id=metadata_id,
+                tier=tier,
+                start_ts=start_ts,
+                state=state,
+                min=min_value,
+                max=max_value,
+            )
+        )
+
+
+def _states_to_bucket(
+    rows: Iterable[Row],
+) -> tuple[str, float | None, float | None]:
+    """Downsample the states of an entity to a bucket."""
+    states = [row[1] for row in rows]
+    values = [value for state in states if (value := _numeric_value(state)) is not None]
+    if not values:
+        return states[-1], None, None
+    return states[-1], min(values), max(values)
+
+
+def _buckets_to_bucket(
+    rows: Iterable[Row],
+) -> tuple[str, float | None, float | None]:
+    """Downsample the buckets of an entity to a bucket of a coarser tier."""
+    buckets = list(rows)
+    state = buckets[-1][1]
+    numeric = [bucket for bucket in buckets if bucket[2] is not None]
+    if not numeric:
+        return state, None, None
+    return (
+        state,
+        min(bucket[2] for bucket in numeric),
+        max(bucket[3] for bucket in numeric),
+    )
+
+
+def compile_downsampled_states(session: Session, start: datetime) -> None:
+    """Downsample the states recorded during the 5 minutes from start.
+
+    The hourly buckets are downsampled once the last 5-minute
+    bucket of the hour is compiled.
+    """
+    end = start + timedelta(seconds=TIER_5MINUTE)
+    _add_buckets(
+        session,
+        TIER_5MINUTE,
+        start,
+        execute_stmt_lambda_element(
+            session, _get_states_during_stmt(start.timestamp(), end.timestamp())
+        ),
+        _states_to_bucket,
+    )
+    if end.minute:
+        return
+    # A full hour is ready, downsample it
+    session.flush()
+    hour_start = end - timedelta(seconds=TIER_HOUR)
+    _add_buckets(
+        session,
+        TIER_HOUR,
+        hour_start,
+        execute_stmt_lambda_element(
+            session,
+            _get_buckets_during_stmt(
+                TIER_5MINUTE, hour_start.timestamp(), end.timestamp()
+            ),
+        ),
+        _buckets_to_bucket,
+    )
+
+
+def _tier_for_period(
+    start_time: datetime, end_time: datetime, max_points: int
+) -> int | None:
+    """Return the finest tier with at most max_points buckets during the period.
+
+    Returns None if the period is short enough to not downsample it, the
+    coarsest tier if every tier has more than max_points buckets.
+    """
+    seconds = (end_time - start_time).total_seconds()
+    if seconds <= UNDOWNSAMPLED_RESOLUTION * max_points:
+        return None
+    return next(
+        (tier for tier in TIERS if seconds <= tier * max_points),
+        TIERS[-1],
+    )
+
+
+def _bucket_points(
+    start_ts: float,
+    tier: int,
+    state: str,
+    min_value: float | None,
+    max_value: float | None,
+) -> list[tuple[float, str]]:
+    """Return the points to draw a bucket with."""
+    if min_value is None or max_value is None:
+        return [(start_ts, state)]
+    if min_value == max_value:
+        return [(start_ts, str(min_value))]
+    # Move towards the last state of the bucket
+    last_value = _numeric_value(state)
+    if last_value is not None and last_value < (min_value + max_value) / 2:
+        first, second = max_value, min_value
+    else:
+        first, second = min_value, max_value
+    return [(start_ts, str(first)), (start_ts + tier / 2, str(second))]
+
+
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    max_points: int,
+) -> MutableMapping[str, list[dict[str, Any]]] | None:
+    """Return the history of entities during a period in at most max_points buckets.
+
+    The history is returned in the compressed state format without
+    attributes. Numeric states are drawn with their minimum and maximum
+    during each bucket and other states with their last state during each
+    bucket. The history after the newest bucket is filled in with the
+    recorded states.
+
+    Returns None if the period is short enough to return every state or
+    the states were not downsampled since start_time.
+    """
+    instance = recorder.get_instance(hass)
+    end_time = end_time or dt_util.utcnow()
+    if (
+        not instance.states_meta_manager.active
+        or (tier := _tier_for_period(start_time, end_time, max_points)) is None
+    ):
+        return None
+
+    start_time_ts = start_time.timestamp()
+    with session_scope(hass=hass, read_only=True) as session:
+        first_bucket_start_ts: float | None = session.execute(
+            _get_first_bucket_start_stmt(tier)
+        ).scalar()
+        if first_bucket_start_ts is None or first_bucket_start_ts > start_time_ts:
+            return None
+        # The buckets are compiled with the statistics
+        if not (
+            last_run := session.execute(select(func.max(StatisticsRuns.start))).scalar()
+        ):
+            return None
+        tiers_end = process_timestamp(last_run) + timedelta(seconds=TIER_5MINUTE)
+        if tier == TIER_HOUR:
+            tiers_end = tiers_end.replace(minute=0)
+        tiers_end = min(tiers_end, end_time)
+
+        raw_entity_ids = [
+            entity_id
+            for entity_id in entity_ids
+            if split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        ]
+        downsampled_entity_ids = [
+            entity_id for entity_id in entity_ids if entity_id not in raw_entity_ids
+        ]
+        result: dict[str, list[dict[str, Any]]] = {
+            entity_id: [] for entity_id in entity_ids
+        }
+        if raw_entity_ids:
+            result.update(
+                get_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    raw_entity_ids,
+                    None,
+                    include_start_time_state,
+                    True,
+                    True,
+                    True,
+                    True,
+                )  # type: ignore[arg-type]
+            )
+        if not downsampled_entity_ids:
+            return result
+
+        def _append(entity_id: str, states: Iterable[dict[str, Any]]) -> None:
+            """Append the states which changed to the history of an entity."""
+            entity_states = result[entity_id]
+            for state in states:
+                if (
+                    entity_states
+                    and entity_states[-1][COMPRESSED_STATE_STATE]
+                    == state[COMPRESSED_STATE_STATE]
+                ):
+                    continue
+                entity_states.append(state)
+
+        if include_start_time_state:
+            for entity_id, states in get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                start_time,
+                downsampled_entity_ids,
+                None,
+                True,
+                True,
+                True,
+                True,
+                True,
+            ).items():
+                _append(entity_id, states)  # type: ignore[arg-type]
+
+        metadata_ids = instance.states_meta_manager.get_many(
+            downsampled_entity_ids, session, False
+        )
+        metadata_id_to_entity_id = {
+            metadata_id: entity_id
+            for entity_id, metadata_id in metadata_ids.items()
+            if metadata_id is not None
+        }
+        if metadata_id_to_entity_id:
+            rows = execute_stmt_lambda_element(
+                session,
+                _get_entity_buckets_stmt(
+                    tier,
+                    list(metadata_id_to_entity_id),
+                    start_time_ts,
+                    tiers_end.timestamp(),
+                ),
+            )
+            for metadata_id, group in groupby(rows, itemgetter(0)):
+                _append(
+                    metadata_id_to_entity_id[metadata_id],
+                    (
+                        {
+                            COMPRESSED_STATE_STATE: state,
+                            COMPRESSED_STATE_LAST_UPDATED: point_ts,
+                        }
+                        for _, start_ts, state, min_value, max_value in group
+                        for point_ts, state in _bucket_points(
+                            start_ts, tier, state, min_value, max_value
+                        )
+                    ),
+                )
+
+        if tiers_end < end_time:
+            for entity_id, states in get_significant_states_with_session(
+                hass,
+                session,
+                tiers_end,
+                end_time,
+                downsampled_entity_ids,
+                None,
+                False,
+                True,
+                True,
+                True,
+                True,
+            ).items():
+                _append(entity_id, states)  # type: ignore[arg-type]
+
+    return {entity_id: states for entity_id, states in result.items() if states}
@@ -61,6 +61,7 @@ from .db_schema import (
     EventTypes,
     SchemaChanges,
     States,
+    StatesDownsampled,
     StatesMeta,
     Statistics,
     StatisticsMeta,
@@ -1061,6 +1062,9 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # The table is usually created by create_all already
+        cast(Table, StatesDownsampled.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
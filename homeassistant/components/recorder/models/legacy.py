@@ -50,6 +50,10 @@ class LegacyLazyStatePreSchema31(State):
         self._last_updated: datetime | None = start_time
         self._context: Context | None = None
         self.attr_cache = attr_cache
+        # The caches of State, which is not initialized
+        self._as_dict_json = None
+        self._as_compressed_state = None
+        self._as_compressed_state_json = None
 
     @property  # type: ignore[override]
     def attributes(self) -> dict[str, Any]:
@@ -197,6 +201,10 @@ class LegacyLazyState(State):
         )
         self._context: Context | None = None
         self.attr_cache = attr_cache
+        # The caches of State, which is not initialized
+        self._as_dict_json = None
+        self._as_compressed_state = None
+        self._as_compressed_state_json = None
 
     @property  # type: ignore[override]
     def attributes(self) -> dict[str, Any]:
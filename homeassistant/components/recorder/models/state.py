@@ -64,6 +64,10 @@ class LazyState(State):
         self._last_changed_ts: float | None = None
         self._context: Context | None = None
         self.attr_cache = attr_cache
+        # The caches of State, which is not initialized
+        self._as_dict_json = None
+        self._as_compressed_state = None
+        self._as_compressed_state_json = None
 
     @property  # type: ignore[override]
     def attributes(self) -> dict[str, Any]:
@@ -0,0 +1,365 @@
+"""Support for range partitioned states and events tables.
+
+The states and events tables can be created as RANGE partitioned tables
+on their primary key on MariaDB/MySQL and PostgreSQL. The primary key is
+used instead of the timestamp columns because MariaDB/MySQL cannot
+partition on a DOUBLE column and PostgreSQL requires the partition key to
+be part of the primary key.
+
+Partitions are allocated ahead of time with a size that is estimated from
+the rate rows were written at, so each partition holds roughly one
+partition interval of rows. Purging drops a whole partition once its
+newest row is older than the purge cutoff instead of deleting the rows
+one batch at a time.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import re
+from typing import Any, NamedTuple, cast
+
+from sqlalchemy import Column, Index, MetaData, Table, func, inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+
+from .const import SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Base, Events, States
+
+_LOGGER = logging.getLogger(__name__)
+
+PARTITION_INTERVALS: dict[str, timedelta] = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+DEFAULT_PARTITION_INTERVAL = "daily"
+
+PARTITIONED_DIALECTS = {SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL}
+
+# Size of the first partition before there is a write rate to estimate from
+DEFAULT_PARTITION_ROWS = 1000000
+MIN_PARTITION_ROWS = 10000
+# Do not estimate the write rate from less than an hour of rows
+MIN_ESTIMATE_SECONDS = 3600
+# Number of partition intervals allocated ahead of the newest row
+PARTITION_HEADROOM = 2
+
+MYSQL_FUTURE_PARTITION = "p_future"
+
+_PARTITION_NAME_RE = re.compile(r"p(\d+)_(\d+)$")
+
+
+class PartitionedTable(NamedTuple):
+    """A table that can be partitioned on its primary key."""
+
+    name: str
+    id_column: Column[Any]
+    time_column: Column[Any]
+    shared_id_column: Column[Any]
+
+
+_STATES = cast(Table, States.__table__).c
+_EVENTS = cast(Table, Events.__table__).c
+
+PARTITIONED_TABLES = (
+    PartitionedTable(
+        TABLE_STATES, _STATES.state_id, _STATES.last_updated_ts, _STATES.attributes_id
+    ),
+    PartitionedTable(
+        TABLE_EVENTS, _EVENTS.event_id, _EVENTS.time_fired_ts, _EVENTS.data_id
+    ),
+)
+PARTITIONED_STATES, PARTITIONED_EVENTS = PARTITIONED_TABLES
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """A partition holding the ids in [start, end)."""
+
+    name: str
+    start: int
+    end: int
+
+
+def _partition_name(dialect_name: str, table: str, start: int, end: int) -> str:
+    """Return the name of the partition holding ids in [start, end)."""
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        # PostgreSQL partitions are tables and share the table namespace
+        return f"{table}_p{start}_{end}"
+    return f"p{start}_{end}"
+
+
+def _partitioned_table_copy(
+    table: Table, metadata: MetaData, dialect_name: str
+) -> Table:
+    """Return a copy of a table that can be range partitioned on its id.
+
+    Partitioned tables cannot have foreign keys on MariaDB/MySQL, and on
+    PostgreSQL foreign keys would turn dropping a partition into a scan
+    of the referencing rows, so the copy does not have any.
+    """
+    columns = [
+        Column(
+            column.name,
+            column.type,
+            primary_key=column.primary_key,
+            nullable=column.nullable,
+        )
+        for column in table.columns
+    ]
+    indexes = [
+        Index(
+            index.name,
+            *(column.name for column in index.columns),
+            **index.dialect_kwargs,
+        )
+        for index in table.indexes
+    ]
+    kwargs = dict(table.dialect_kwargs)
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        id_column = next(iter(table.primary_key.columns))
+        kwargs["postgresql_partition_by"] = f"RANGE ({id_column.name})"
+    return Table(table.name, metadata, *columns, *indexes, **kwargs)
+
+
+def create_partitioned_tables(engine: Engine, dialect_name: str) -> bool:
+    """Create the states and events tables as partitioned tables.
+
+    Returns False if the tables already exist.
+    """
+    inspector = inspect(engine)
+    if any(inspector.has_table(table.name) for table in PARTITIONED_TABLES):
+        return False
+
+    metadata = MetaData()
+    tables = [
+        _partitioned_table_copy(
+            Base.metadata.tables[table.name], metadata, dialect_name
+        )
+        for table in PARTITIONED_TABLES
+    ]
+    with engine.begin() as connection:
+        metadata.create_all(connection, tables=tables)
+        for table in tables:
+            id_column = next(iter(table.primary_key.columns))
+            if dialect_name == SupportedDialect.POSTGRESQL:
+                # The default partition catches any rows past the
+                # allocated partitions so inserts never fail
+                connection.execute(
+                    text(
+                        f"CREATE TABLE {table.name}_default "
+                        f"PARTITION OF {table.name} DEFAULT"
+                    )
+                )
+            else:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table.name} "
+                        f"PARTITION BY RANGE ({id_column.name}) "
+                        f"(PARTITION {MYSQL_FUTURE_PARTITION} "
+                        "VALUES LESS THAN MAXVALUE)"
+                    )
+                )
+    _LOGGER.info("Created partitioned states and events tables")
+    return True
+
+
+def tables_are_partitioned(session: Session, dialect_name: str) -> bool:
+    """Return if the states and events tables are partitioned."""
+    for table in PARTITIONED_TABLES:
+        if dialect_name == SupportedDialect.POSTGRESQL:
+            query = text(
+                "SELECT 1 FROM pg_partitioned_table JOIN pg_class "
+                "ON pg_class.oid = pg_partitioned_table.partrelid "
+                "WHERE pg_class.relname = :table"
+            )
+        else:
+            query = text(
+                "SELECT 1 FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+                "AND PARTITION_NAME IS NOT NULL"
+            )
+        if not session.execute(query, {"table": table.name}).first():
+            return False
+    return True
+
+
+def list_partitions(
+    session: Session, dialect_name: str, table: PartitionedTable
+) -> list[Partition]:
+    """Return the id range partitions of a table ordered by their ids.
+
+    The catch-all partitions are not included.
+    """
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        query = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        )
+    else:
+        query = text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND PARTITION_NAME IS NOT NULL"
+        )
+    partitions = [
+        Partition(name, int(match[1]), int(match[2]))
+        for (name,) in session.execute(query, {"table": table.name})
+        if (match := _PARTITION_NAME_RE.search(name))
+    ]
+    partitions.sort(key=lambda partition: partition.start)
+    return partitions
+
+
+def _add_partition(
+    session: Session,
+    dialect_name: str,
+    table: PartitionedTable,
+    start: int,
+    end: int,
+) -> None:
+    """Add a partition holding the ids in [start, end)."""
+    name = _partition_name(dialect_name, table.name, start, end)
+    _LOGGER.debug("Adding partition %s to %s", name, table.name)
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        session.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {table.name} "
+                f"FOR VALUES FROM ({start}) TO ({end})"
+            )
+        )
+        return
+    # Splitting the catch-all partition only has to copy the
+    # rows in it, which there are none of unless it overflowed
+    session.execute(
+        text(
+            f"ALTER TABLE {table.name} REORGANIZE PARTITION {MYSQL_FUTURE_PARTITION} "
+            f"INTO (PARTITION {name} VALUES LESS THAN ({end}), "
+            f"PARTITION {MYSQL_FUTURE_PARTITION} VALUES LESS THAN MAXVALUE)"
+        )
+    )
+
+
+def drop_partition(
+    session: Session, dialect_name: str, table: PartitionedTable, partition: Partition
+) -> None:
+    """Drop a partition and all the rows in it."""
+    _LOGGER.debug("Dropping partition %s of %s", partition.name, table.name)
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        session.execute(text(f"DROP TABLE {partition.name}"))
+        return
+    session.execute(text(f"ALTER TABLE {table.name} DROP PARTITION {partition.name}"))
+
+
+def _estimate_partition_rows(
+    session: Session,
+    table: PartitionedTable,
+    partition: Partition | None,
+    max_id: int,
+    interval: timedelta,
+    now_timestamp: float,
+) -> int:
+    """Estimate how many rows are written in one partition interval."""
+    if partition is None or max_id < partition.start:
+        return DEFAULT_PARTITION_ROWS
+    first_timestamp = session.execute(
+        select(func.min(table.time_column)).where(table.id_column >= partition.start)
+    ).scalar()
+    if not first_timestamp:
+        return DEFAULT_PARTITION_ROWS
+    elapsed = now_timestamp - first_timestamp
+    if elapsed < MIN_ESTIMATE_SECONDS:
+        return DEFAULT_PARTITION_ROWS
+    rows = max_id - partition.start + 1
+    return max(MIN_PARTITION_ROWS, int(rows * interval.total_seconds() / elapsed))
+
+
+def allocate_partitions(
+    session: Session,
+    dialect_name: str,
+    interval: timedelta,
+    now_timestamp: float,
+) -> None:
+    """Allocate partitions until there is room for the upcoming rows."""
+    for table in PARTITIONED_TABLES:
+        partitions = list_partitions(session, dialect_name, table)
+        max_id: int = session.execute(select(func.max(table.id_column))).scalar() or 0
+        # Estimate from the partition the newest row is in
+        current = next(
+            (
+                partition
+                for partition in reversed(partitions)
+                if partition.start <= max_id
+            ),
+            None,
+        )
+        rows = _estimate_partition_rows(
+            session, table, current, max_id, interval, now_timestamp
+        )
+        start = partitions[-1].end if partitions else 1
+        if max_id >= start and dialect_name == SupportedDialect.POSTGRESQL:
+            # A partition cannot be created for rows that are already
+            # in the default partition, they stay there until purged
+            _LOGGER.warning(
+                "Rows were written past the allocated partitions of %s,"
+                " the rows up to id %s are kept in the default partition",
+                table.name,
+                max_id,
+            )
+            start = max_id + 1
+        while start - max_id < PARTITION_HEADROOM * rows:
+            _add_partition(session, dialect_name, table, start, start + rows)
+            start += rows
+
+
+def find_expired_partition(
+    session: Session,
+    table: PartitionedTable,
+    partitions: list[Partition],
+    purge_before_timestamp: float,
+) -> Partition | None:
+    """Return the oldest partition if all its rows are older than the cutoff.
+
+    The partition the newest row is in is never returned as it is
+    still being written to.
+    """
+    if not partitions:
+        return None
+    max_id: int = session.execute(select(func.max(table.id_column))).scalar() or 0
+    oldest = partitions[0]
+    if oldest.end > max_id:
+        return None
+    newest_timestamp = session.execute(
+        select(func.max(table.time_column)).where(
+            table.id_column >= oldest.start, table.id_column < oldest.end
+        )
+    ).scalar()
+    if newest_timestamp is not None and newest_timestamp >= purge_before_timestamp:
+        return None
+    return oldest
+
+
+def select_shared_ids_in_partition(
+    session: Session, table: PartitionedTable, partition: Partition
+) -> set[int]:
+    """Return the attributes_ids or data_ids used by the rows of a partition."""
+    return {
+        shared_id
+        for (shared_id,) in session.execute(
+            select(table.shared_id_column)
+            .distinct()
+            .where(
+                table.id_column >= partition.start,
+                table.id_column < partition.end,
+                table.shared_id_column.is_not(None),
+            )
+        )
+    }
+
+
+def partition_interval(interval: str | None) -> timedelta:
+    """Return the partition interval for the configured name."""
+    return PARTITION_INTERVALS[interval or DEFAULT_PARTITION_INTERVAL]
@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 
 import homeassistant.util.dt as dt_util
 
+from . import partition
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -24,11 +25,13 @@ from .queries import (
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_downsampled_rows,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_in_range,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -37,6 +40,7 @@ from .queries import (
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_downsampled_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -73,7 +77,12 @@ def purge_old_data(
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
+        if instance.use_partitions:
+            _LOGGER.debug("Purge running by dropping expired partitions")
+            has_more_to_purge |= _purge_expired_partitions(
+                instance, session, purge_before
+            )
+        elif instance.use_legacy_events_index and _purging_legacy_format(session):
             _LOGGER.debug(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
@@ -98,13 +107,24 @@ def purge_old_data(
         short_term_statistics = _select_short_term_statistics_to_purge(
             session, purge_before, instance.max_bind_vars
         )
+        states_downsampled = _select_states_downsampled_to_purge(
+            session, purge_before, instance.max_bind_vars
+        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        if states_downsampled:
+            _purge_states_downsampled(session, states_downsampled)
+
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or states_downsampled
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -244,6 +264,55 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _purge_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Drop the oldest states and events partitions if all their rows are expired.
+
+    Only one partition of each table is dropped at a time so the sweep for
+    the attributes and event data only used by the dropped rows is bounded.
+
+    Returns true if there may be more partitions to drop.
+    """
+    dialect_name = instance.dialect_name
+    assert dialect_name is not None
+    purge_before_timestamp = dt_util.utc_to_timestamp(purge_before)
+    has_more_to_purge = False
+
+    states = partition.PARTITIONED_STATES
+    if expired := partition.find_expired_partition(
+        session,
+        states,
+        partition.list_partitions(session, dialect_name, states),
+        purge_before_timestamp,
+    ):
+        attributes_ids = partition.select_shared_ids_in_partition(
+            session, states, expired
+        )
+        disconnected_rows = session.execute(
+            disconnect_states_rows_in_range(expired.start, expired.end)
+        )
+        _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+        partition.drop_partition(session, dialect_name, states, expired)
+        instance.states_manager.evict_purged_state_id_range(expired.start, expired.end)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+        has_more_to_purge = True
+
+    events = partition.PARTITIONED_EVENTS
+    if expired := partition.find_expired_partition(
+        session,
+        events,
+        partition.list_partitions(session, dialect_name, events),
+        purge_before_timestamp,
+    ):
+        data_ids = partition.select_shared_ids_in_partition(session, events, expired)
+        partition.drop_partition(session, dialect_name, events, expired)
+        _purge_unused_data_ids(instance, session, data_ids)
+        has_more_to_purge = True
+
+    return has_more_to_purge
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -453,6 +522,17 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_states_downsampled_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of downsampled states to purge."""
+    states_downsampled = session.execute(
+        find_states_downsampled_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug("Selected %s downsampled states to remove", len(states_downsampled))
+    return [state_downsampled_id for (state_downsampled_id,) in states_downsampled]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -569,6 +649,12 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_states_downsampled(session: Session, states_downsampled: list[int]) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(delete_states_downsampled_rows(states_downsampled))
+    _LOGGER.debug("Deleted %s downsampled states", deleted_rows)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
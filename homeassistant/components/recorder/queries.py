@@ -15,6 +15,7 @@ from .db_schema import (
     RecorderRuns,
     StateAttributes,
     States,
+    StatesDownsampled,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -538,6 +539,18 @@ def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def disconnect_states_rows_in_range(start: int, end: int) -> StatementLambdaElement:
+    """Disconnect newer states rows from the states with ids in [start, end)."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id >= start)
+        .where(States.old_state_id < end)
+        .where(States.state_id >= end)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete states rows."""
     return lambda_stmt(
@@ -589,6 +602,17 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_states_downsampled_rows(
+    states_downsampled: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete states_downsampled rows."""
+    return lambda_stmt(
+        lambda: delete(StatesDownsampled)
+        .where(StatesDownsampled.id.in_(states_downsampled))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -646,6 +670,18 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def find_states_downsampled_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find downsampled states to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(StatesDownsampled.id)
+        .filter(StatesDownsampled.start_ts < purge_before_ts)
+        .limit(max_bind_vars)
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -0,0 +1,148 @@
+"""A pool of read-only connections for concurrent queries.
+
+History, logbook and statistics queries run in the database executor and
+share the connections of the recorder, so a slow query holds up every
+query queued behind it. The read pool gives these queries their own
+connections, either to the recorder database or to a read replica, so
+they run concurrently with each other and with the writes of the
+recorder. A query timeout stops a single slow query from holding a
+connection indefinitely.
+
+SQLite databases are in WAL mode, which lets readers on their own
+connections run while the recorder is writing.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import create_engine, event as sqlalchemy_event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import QueuePool
+
+from .const import SQLITE_URL_PREFIX, SupportedDialect
+from .util import (
+    execute_on_connection,
+    query_on_connection,
+    setup_connection_for_dialect,
+)
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for a free connection before the query fails
+READ_POOL_TIMEOUT = 30
+
+# Number of SQLite virtual machine instructions between timeout checks
+SQLITE_PROGRESS_STEPS = 1000
+
+_QUERY_DEADLINE = "ha_query_deadline"
+
+
+def create_read_engine(
+    instance: Recorder, url: str, pool_size: int, query_timeout: int
+) -> Engine | None:
+    """Create an engine with a pool of read-only connections.
+
+    Returns None if the database does not support concurrent readers.
+    """
+    if url == SQLITE_URL_PREFIX or ":memory:" in url:
+        _LOGGER.warning("The read pool is not supported for in-memory SQLite databases")
+        return None
+
+    kwargs: dict[str, Any] = {}
+    if url.startswith(SQLITE_URL_PREFIX):
+        # Connections are handed out to any of the executor threads
+        kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        kwargs["echo"] = False
+
+    engine = create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=READ_POOL_TIMEOUT,
+        pool_pre_ping=not url.startswith(SQLITE_URL_PREFIX),
+        future=True,
+        **kwargs,
+    )
+    dialect_name = engine.dialect.name
+
+    def _setup_read_connection(
+        dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Set up a connection of the read pool."""
+        setup_connection_for_dialect(instance, dialect_name, dbapi_connection, False)
+        _setup_read_only(dbapi_connection, dialect_name)
+        if query_timeout:
+            _setup_query_timeout(
+                dbapi_connection, connection_record, dialect_name, query_timeout
+            )
+
+    sqlalchemy_event.listen(engine, "connect", _setup_read_connection)
+
+    if query_timeout and dialect_name == SupportedDialect.SQLITE:
+
+        def _start_query_timer(conn: Any, *args: Any) -> None:
+            """Start the timeout of a query."""
+            conn.info[_QUERY_DEADLINE] = time.monotonic() + query_timeout
+
+        sqlalchemy_event.listen(engine, "before_cursor_execute", _start_query_timer)
+
+    _LOGGER.debug(
+        "Created read pool with %s connections to %s", pool_size, dialect_name
+    )
+    return engine
+
+
+def _setup_read_only(dbapi_connection: DBAPIConnection, dialect_name: str) -> None:
+    """Make the connection reject writes."""
+    if dialect_name == SupportedDialect.SQLITE:
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+
+
+def _setup_query_timeout(
+    dbapi_connection: DBAPIConnection,
+    connection_record: Any,
+    dialect_name: str,
+    query_timeout: int,
+) -> None:
+    """Abort queries that run for longer than query_timeout seconds."""
+    if dialect_name == SupportedDialect.SQLITE:
+        # SQLite has no statement timeout, the progress handler interrupts
+        # the query once the deadline set before it was executed passed
+        info: dict[str, float] = connection_record.info
+
+        def _query_timed_out() -> bool:
+            return time.monotonic() > info.get(_QUERY_DEADLINE, math.inf)
+
+        dbapi_connection.set_progress_handler(  # type: ignore[attr-defined]
+            _query_timed_out, SQLITE_PROGRESS_STEPS
+        )
+    elif dialect_name == SupportedDialect.MYSQL:
+        version = query_on_connection(dbapi_connection, "SELECT VERSION()")[0][0]
+        if "mariadb" in version.lower():
+            execute_on_connection(
+                dbapi_connection, f"SET SESSION max_statement_time = {query_timeout}"
+            )
+        else:
+            execute_on_connection(
+                dbapi_connection,
+                f"SET SESSION max_execution_time = {query_timeout * 1000}",
+            )
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, f"SET statement_timeout = {query_timeout * 1000}"
+        )
@@ -60,6 +60,7 @@ from .db_schema import (
     StatisticsRuns,
     StatisticsShortTerm,
 )
+from .history.downsampled import compile_downsampled_states
 from .models import (
     StatisticData,
     StatisticDataTimestamp,
@@ -194,6 +195,20 @@ class StatisticsRow(BaseStatisticsRow, total=False):
     change: float | None
 
 
+class StatisticsColumns(TypedDict, total=False):
+    """Processed statistic data with a list per column and an item per row."""
+
+    start: list[float]
+    end: list[float]
+    last_reset: list[float | None]
+    state: list[float | None]
+    sum: list[float | None]
+    min: list[float | None]
+    max: list[float | None]
+    mean: list[float | None]
+    change: list[float | None]
+
+
 def _get_unit_class(unit: str | None) -> str | None:
     """Get corresponding unit class from from the statistics unit."""
     if converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(unit):
@@ -228,6 +243,42 @@ def _get_statistic_to_display_unit_converter(
     requested_units: dict[str, str] | None,
 ) -> Callable[[float | None], float | None] | None:
     """Prepare a converter from the statistics unit to display unit."""
+    if (
+        converter_and_unit := _get_statistic_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = converter_and_unit
+    return converter.converter_factory_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
+def _get_statistic_to_display_unit_many_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[Iterable[float | None]], list[float | None]] | None:
+    """Prepare a converter of columns from the statistics unit to display unit."""
+    if (
+        converter_and_unit := _get_statistic_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = converter_and_unit
+    return converter.converter_factory_many_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
+def _get_statistic_display_unit(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if statistics need conversion."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -245,9 +296,7 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
-    return converter.converter_factory_allow_none(
-        from_unit=statistic_unit, to_unit=display_unit
-    )
+    return converter, display_unit
 
 
 def _get_display_to_statistic_unit_converter(
@@ -538,6 +587,12 @@ def _compile_statistics(
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
+    if instance.statistics_buffer.active:
+        instance.statistics_buffer.compiled(instance.hass, session, end)
+
+    if instance.downsampled_history:
+        compile_downsampled_states(session, start)
+
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
     # Insert collected statistics in the database
@@ -1571,22 +1626,20 @@ def _extract_metadata_and_discard_impossible_columns(
     return metadata_ids
 
 
-def _augment_result_with_change(
+def _get_sums_before(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
     units: dict[str, str] | None,
-    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
     table: type[Statistics | StatisticsShortTerm],
     metadata: dict[str, tuple[int, StatisticMetaData]],
-    result: dict[str, list[StatisticsRow]],
-) -> None:
-    """Add change to the result."""
-    drop_sum = "sum" not in _types
-    prev_sums = {}
+    statistic_ids: Iterable[str],
+) -> dict[str, float | None]:
+    """Return the last sum before start_time of the statistic_ids."""
+    prev_sums: dict[str, float | None] = {}
     if tmp := _statistics_at_time(
         session,
-        {metadata[statistic_id][0] for statistic_id in result},
+        {metadata[statistic_id][0] for statistic_id in statistic_ids},
         table,
         start_time,
         {"sum"},
@@ -1605,6 +1658,24 @@ def _augment_result_with_change(
                 prev_sums[statistic_id] = convert(row.sum)
             else:
                 prev_sums[statistic_id] = row.sum
+    return prev_sums
+
+
+def _augment_result_with_change(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+    table: type[Statistics | StatisticsShortTerm],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    result: dict[str, list[StatisticsRow]],
+) -> None:
+    """Add change to the result."""
+    drop_sum = "sum" not in _types
+    prev_sums = _get_sums_before(
+        hass, session, start_time, units, table, metadata, result
+    )
 
     for statistic_id, rows in result.items():
         prev_sum = prev_sums.get(statistic_id) or 0
@@ -1622,33 +1693,63 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
-def _statistics_during_period_with_session(
+def _augment_columns_with_change(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None,
-    statistic_ids: set[str] | None,
-    period: Literal["5minute", "day", "hour", "week", "month"],
     units: dict[str, str] | None,
     _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Return statistic data points during UTC period start_time - end_time.
+    table: type[Statistics | StatisticsShortTerm],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    result: dict[str, StatisticsColumns],
+) -> None:
+    """Add a change column to the result."""
+    drop_sum = "sum" not in _types
+    prev_sums = _get_sums_before(
+        hass, session, start_time, units, table, metadata, result
+    )
 
-    If end_time is omitted, returns statistics newer than or equal to start_time.
-    If statistic_ids is omitted, returns statistics for all statistics ids.
+    for statistic_id, columns in result.items():
+        if "sum" not in columns:
+            continue
+        sums = columns.pop("sum") if drop_sum else columns["sum"]
+        prev_sum = prev_sums.get(statistic_id) or 0
+        change: list[float | None] = []
+        for _sum in sums:
+            if _sum is None:
+                change.append(None)
+                continue
+            change.append(_sum - prev_sum)
+            prev_sum = _sum
+        columns["change"] = change
+
+
+def _get_statistics_during_period_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    table: type[Statistics | StatisticsShortTerm],
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[
+    dict[str, tuple[int, StatisticMetaData]],
+    set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    Sequence[Row],
+]:
+    """Query the statistics rows during UTC period start_time - end_time.
+
+    Returns the metadata, the types to query and the rows ordered by
+    metadata_id and start_ts.
     """
-    if statistic_ids is not None and not isinstance(statistic_ids, set):
-        # This is for backwards compatibility to avoid a breaking change
-        # for custom integrations that call this method.
-        statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
     # Fetch metadata for the given (or all) statistic_ids
     metadata = get_instance(hass).statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = set()
     if not metadata:
-        return {}
+        return metadata, types, []
 
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = set()
     for stat_type in _types:
         if stat_type == "change":
             types.add("sum")
@@ -1659,6 +1760,35 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    return metadata, types, stats
+
+
+def _statistics_during_period_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return statistic data points during UTC period start_time - end_time.
+
+    If end_time is omitted, returns statistics newer than or equal to start_time.
+    If statistic_ids is omitted, returns statistics for all statistics ids.
+    """
+    if statistic_ids is not None and not isinstance(statistic_ids, set):
+        # This is for backwards compatibility to avoid a breaking change
+        # for custom integrations that call this method.
+        statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+
     # Align start_time and end_time with the period
     if period == "day":
         start_time = dt_util.as_local(start_time).replace(
@@ -1692,11 +1822,8 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    metadata, types, stats = _get_statistics_during_period_rows(
+        hass, session, start_time, end_time, statistic_ids, table, _types
     )
 
     if not stats:
@@ -1733,6 +1860,67 @@ def _statistics_during_period_with_session(
     return result
 
 
+def _statistics_rows_to_columns(
+    rows: list[StatisticsRow],
+) -> StatisticsColumns:
+    """Convert processed rows of a statistic to columns."""
+    return cast(
+        StatisticsColumns,
+        {key: [row.get(key) for row in rows] for key in rows[0]} if rows else {},
+    )
+
+
+def _statistics_during_period_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Return statistic data points during UTC period start_time - end_time as columns.
+
+    5-minute and hourly statistics are converted from the query result a
+    column at a time without building a dict per data point. Daily, weekly
+    and monthly statistics are reduced from the hourly rows first.
+    """
+    if period not in ("5minute", "hour"):
+        return {
+            statistic_id: _statistics_rows_to_columns(rows)
+            for statistic_id, rows in _statistics_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                period,
+                units,
+                _types,
+            ).items()
+        }
+
+    table: type[Statistics | StatisticsShortTerm] = (
+        Statistics if period != "5minute" else StatisticsShortTerm
+    )
+    metadata, types, stats = _get_statistics_during_period_rows(
+        hass, session, start_time, end_time, statistic_ids, table, _types
+    )
+
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_columns(hass, stats, metadata, table, units, types)
+
+    if "change" in _types:
+        _augment_columns_with_change(
+            hass, session, start_time, units, _types, table, metadata, result
+        )
+
+    return result
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -1760,6 +1948,33 @@ def statistics_during_period(
         )
 
 
+def statistics_during_period_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Return statistic data points during UTC period start_time - end_time.
+
+    Unlike statistics_during_period, the data points of each statistic_id are
+    returned as a list per column instead of a dict per data point.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        return _statistics_during_period_columns_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            units,
+            types,
+        )
+
+
 def _get_last_statistics_stmt(
     metadata_id: int,
     number_of_stats: int,
@@ -1994,19 +2209,23 @@ def _statistics_at_time(
 def _fast_build_sum_list(
     stats_list: list[Row],
     table_duration_seconds: float,
-    convert: Callable | None,
+    convert_many: Callable[[Iterable[float | None]], list[float | None]] | None,
     start_ts_idx: int,
     sum_idx: int,
 ) -> list[StatisticsRow]:
     """Build a list of sum statistics."""
-    if convert:
+    if convert_many:
+        # Convert the sum column at once instead of a value at a time
         return [
             {
                 "start": (start_ts := db_state[start_ts_idx]),
                 "end": start_ts + table_duration_seconds,
-                "sum": convert(db_state[sum_idx]),
+                "sum": sum_,
             }
-            for db_state in stats_list
+            for db_state, sum_ in zip(
+                stats_list,
+                convert_many([db_state[sum_idx] for db_state in stats_list]),
+            )
         ]
     return [
         {
@@ -2069,13 +2288,19 @@ def _sorted_statistics_to_dict(  # noqa: C901
     for meta_id, stats_list in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        convert = convert_many = None
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
-        else:
-            convert = None
+            if sum_only:
+                convert_many = _get_statistic_to_display_unit_many_converter(
+                    unit, state_unit, units
+                )
+            else:
+                convert = _get_statistic_to_display_unit_converter(
+                    unit, state_unit, units
+                )
 
         if sum_only:
             # This function is extremely flexible and can handle all types of
@@ -2087,7 +2312,7 @@ def _sorted_statistics_to_dict(  # noqa: C901
             result[statistic_id] = _fast_build_sum_list(
                 stats_list,
                 table_duration_seconds,
-                convert,
+                convert_many,
                 start_ts_idx,
                 sum_idx,
             )
@@ -2135,6 +2360,63 @@ def _sorted_statistics_to_dict(  # noqa: C901
     return result
 
 
+def _sorted_statistics_to_columns(
+    hass: HomeAssistant,
+    stats: Sequence[Row[Any]],
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    table: type[StatisticsBase],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Convert SQL results into a list per column for each statistic_id.
+
+    The rows of each statistic_id are transposed into columns and the unit
+    conversion is done a column at a time, which avoids creating a dict
+    and doing the field lookups for every row.
+    """
+    assert stats, "stats must not be empty"  # Guard against implementation error
+    result: dict[str, StatisticsColumns] = {}
+    metadata = dict(_metadata.values())
+    field_map: dict[str, int] = {key: idx for idx, key in enumerate(stats[0]._fields)}
+    start_ts_idx = field_map["start_ts"]
+    # The unit of last_reset is a timestamp, it is never converted
+    last_reset_ts_idx = field_map["last_reset_ts"] if "last_reset" in types else None
+    value_idxs = [
+        (stat_type, field_map[stat_type])
+        for stat_type in ("state", "sum", "min", "max", "mean")
+        if stat_type in types
+    ]
+    table_duration_seconds = table.duration.total_seconds()
+    for meta_id, group in groupby(stats, itemgetter(field_map["metadata_id"])):
+        metadata_by_id = metadata[meta_id]
+        statistic_id = metadata_by_id["statistic_id"]
+        state_unit = unit = metadata_by_id["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert_many = _get_statistic_to_display_unit_many_converter(
+            unit, state_unit, units
+        )
+
+        db_columns = list(zip(*group))
+        columns: dict[str, list[Any]] = {
+            "start": list(db_columns[start_ts_idx]),
+            "end": [
+                start_ts + table_duration_seconds
+                for start_ts in db_columns[start_ts_idx]
+            ],
+        }
+        if last_reset_ts_idx is not None:
+            columns["last_reset"] = list(db_columns[last_reset_ts_idx])
+        for stat_type, idx in value_idxs:
+            if convert_many:
+                columns[stat_type] = convert_many(db_columns[idx])
+            else:
+                columns[stat_type] = list(db_columns[idx])
+        result[statistic_id] = cast(StatisticsColumns, columns)
+
+    return result
+
+
 def validate_statistics(hass: HomeAssistant) -> dict[str, list[ValidationIssue]]:
     """Validate statistics."""
     platform_validation: dict[str, list[ValidationIssue]] = {}
@@ -0,0 +1,166 @@
+"""Buffer the recorded states of entities statistics are compiled for."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import HomeAssistant, State, split_entity_id
+import homeassistant.util.dt as dt_util
+
+from .history import get_full_significant_states_with_session
+from .history.const import SIGNIFICANT_DOMAINS
+
+
+@dataclass(slots=True)
+class _BufferedEntity:
+    """The recorded states of an entity."""
+
+    # All states recorded from this point in time on are buffered
+    tracked_since: datetime
+    # The state at complete_since, None until the state is known
+    complete_since: datetime | None = None
+    start_state: State | None = None
+    # The states recorded since complete_since, None if the entity was removed
+    changes: list[tuple[datetime, State | None]] = field(default_factory=list)
+
+
+class StatisticsBuffer:
+    """Buffer the recorded states of the entities statistics are compiled for.
+
+    Compiling statistics needs the states of each entity during the period
+    and the state at the start of it. When the buffer is active, an entity is
+    buffered from the first time its states are requested and the states are
+    kept in memory as they are recorded, so the next periods can be compiled
+    without querying the states from the database.
+
+    An entity's states can only be returned once the buffer holds every state
+    recorded since the start of the period; until then, and after the buffer
+    has been reset, the states have to be queried from the database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics buffer."""
+        self.active = False
+        self._entities: dict[str, _BufferedEntity] = {}
+
+    def add_state(self, entity_id: str, when: datetime, state: State | None) -> None:
+        """Buffer a recorded state, None if the entity was removed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (entity := self._entities.get(entity_id)) is not None:
+            entity.changes.append((when, state))
+
+    def get_states(
+        self,
+        entity_id: str,
+        start: datetime,
+        end: datetime,
+        significant_changes_only: bool,
+    ) -> list[State] | None:
+        """Return the states of an entity during start-end.
+
+        The first state is the state at start if there is one, like
+        the history the database returns. Returns None if the states
+        are not buffered, in which case the entity is buffered from
+        now on.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (entity := self._entities.get(entity_id)) is None:
+            self._entities[entity_id] = _BufferedEntity(dt_util.utcnow())
+            return None
+        if entity.complete_since is None or start < entity.complete_since:
+            return None
+        significant_changes_only = (
+            significant_changes_only
+            and split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS
+        )
+        start_state = entity.start_state
+        states: list[State] = []
+        for when, state in entity.changes:
+            if when < start:
+                start_state = state
+            elif (
+                when < end
+                and state is not None
+                and (
+                    not significant_changes_only
+                    or state.last_changed == state.last_updated
+                )
+            ):
+                states.append(state)
+        if start_state is not None:
+            states.insert(0, start_state)
+        return states
+
+    def compiled(self, hass: HomeAssistant, session: Session, end: datetime) -> None:
+        """Drop the states which are no longer needed once compiled up to end.
+
+        Entities which have been buffered since before end become complete
+        at end. The state at end is queried from the database for the ones
+        which have not changed since they were buffered.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        to_query: list[str] = []
+        for entity_id, entity in self._entities.items():
+            if entity.complete_since is None:
+                if entity.tracked_since > end:
+                    continue
+                if not any(when < end for when, _ in entity.changes):
+                    to_query.append(entity_id)
+                    continue
+            elif end <= entity.complete_since:
+                continue
+            _drop_states_before(entity, end)
+
+        if to_query:
+            states_at_end = get_full_significant_states_with_session(
+                hass,
+                session,
+                end,
+                end,
+                entity_ids=to_query,
+                significant_changes_only=False,
+            )
+            for entity_id in to_query:
+                entity = self._entities[entity_id]
+                if states := states_at_end.get(entity_id):
+                    entity.start_state = states[-1]
+                entity.complete_since = end
+
+        # Stop buffering entities which have been removed
+        for entity_id in [
+            entity_id
+            for entity_id, entity in self._entities.items()
+            if entity.complete_since is not None
+            and entity.start_state is None
+            and not entity.changes
+        ]:
+            del self._entities[entity_id]
+
+    def reset(self) -> None:
+        """Reset after states may not have been recorded.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._entities.clear()
+
+
+def _drop_states_before(entity: _BufferedEntity, end: datetime) -> None:
+    """Make an entity complete at end by dropping the states before it."""
+    changes: list[tuple[datetime, State | None]] = []
+    for when, state in entity.changes:
+        if when < end:
+            entity.start_state = state
+        else:
+            changes.append((when, state))
+    entity.changes = changes
+    entity.complete_since = end
@@ -0,0 +1,256 @@
+"""Support inserting States and Events rows in bulk."""
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from ..db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+EVENTS_TABLE = cast(Table, Events.__table__)
+STATES_TABLE = cast(Table, States.__table__)
+
+_INSERT_EVENTS = insert(EVENTS_TABLE)
+_INSERT_STATES = insert(STATES_TABLE).returning(
+    STATES_TABLE.c.state_id, sort_by_parameter_order=True
+)
+
+
+class BulkEvents:
+    """A new Events row waiting to be inserted in bulk.
+
+    Has the same attributes as the Events columns and relationships the
+    recorder sets for a new event, without the overhead of an ORM instance.
+    """
+
+    __slots__ = (
+        "origin_idx",
+        "time_fired_ts",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "event_type_id",
+        "event_type_rel",
+        "data_id",
+        "event_data_rel",
+    )
+
+    def __init__(self, event: Event) -> None:
+        """Initialize the row from a native event."""
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.time_fired_ts = dt_util.utc_to_timestamp(event.time_fired)
+        self.context_id_bin = ulid_to_bytes_or_none(event.context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(event.context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(event.context.parent_id)
+        self.event_type_id: int | None = None
+        self.event_type_rel: EventTypes | None = None
+        self.data_id: int | None = None
+        self.event_data_rel: EventData | None = None
+
+    def as_row(self) -> dict[str, Any]:
+        """Return the parameters to insert the row."""
+        if (event_type := self.event_type_rel) is not None:
+            self.event_type_id = event_type.event_type_id
+        if (event_data := self.event_data_rel) is not None:
+            self.data_id = event_data.data_id
+        return {
+            "origin_idx": self.origin_idx,
+            "time_fired_ts": self.time_fired_ts,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+            "event_type_id": self.event_type_id,
+            "data_id": self.data_id,
+        }
+
+
+class BulkStates:
+    """A new States row waiting to be inserted in bulk.
+
+    Has the same attributes as the States columns and relationships the
+    recorder sets for a new state, without the overhead of an ORM instance.
+    """
+
+    __slots__ = (
+        "state_id",
+        "entity_id",
+        "state",
+        "attributes",
+        "last_updated_ts",
+        "last_changed_ts",
+        "origin_idx",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "old_state_id",
+        "old_state",
+        "attributes_id",
+        "state_attributes",
+        "metadata_id",
+        "states_meta_rel",
+    )
+
+    # Assigned once the row has been inserted
+    state_id: int
+
+    def __init__(self, event: Event) -> None:
+        """Initialize the row from a state_changed event."""
+        state: State | None = event.data.get("new_state")
+        self.entity_id: str | None = event.data["entity_id"]
+        self.attributes: str | None = None
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.context_id_bin = ulid_to_bytes_or_none(event.context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(event.context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(event.context.parent_id)
+        self.old_state_id: int | None = None
+        self.old_state: States | BulkStates | None = None
+        self.attributes_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.metadata_id: int | None = None
+        self.states_meta_rel: StatesMeta | None = None
+        # None state means the state was removed from the state machine
+        if state is None:
+            self.state: str | None = ""
+            self.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
+            self.last_changed_ts: float | None = None
+            return
+        self.state = state.state
+        self.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        if state.last_updated == state.last_changed:
+            self.last_changed_ts = None
+        else:
+            self.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+
+    def as_row(self) -> dict[str, Any]:
+        """Return the parameters to insert the row."""
+        if (old_state := self.old_state) is not None:
+            self.old_state_id = old_state.state_id
+        if (state_attributes := self.state_attributes) is not None:
+            self.attributes_id = state_attributes.attributes_id
+        if (states_meta := self.states_meta_rel) is not None:
+            self.metadata_id = states_meta.metadata_id
+        return {
+            "entity_id": self.entity_id,
+            "state": self.state,
+            "attributes": self.attributes,
+            "last_updated_ts": self.last_updated_ts,
+            "last_changed_ts": self.last_changed_ts,
+            "origin_idx": self.origin_idx,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+            "old_state_id": self.old_state_id,
+            "attributes_id": self.attributes_id,
+            "metadata_id": self.metadata_id,
+        }
+
+
+class BulkInsertManager:
+    """Manage inserting new States and Events rows with executemany.
+
+    The rows are kept out of the session so the unit of work does not
+    have to build, sort and flush ORM instances one by one. Instead they
+    are inserted with an executemany per table when the event session
+    is committed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert manager."""
+        self.active = False
+        self._events: list[BulkEvents] = []
+        self._states: list[BulkStates] = []
+
+    @property
+    def has_pending(self) -> bool:
+        """Return if there are rows waiting to be inserted."""
+        return bool(self._events or self._states)
+
+    def add_event(self, dbevent: BulkEvents) -> None:
+        """Add an Events row to insert at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.append(dbevent)
+
+    def add_state(self, dbstate: BulkStates) -> None:
+        """Add a States row to insert at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.append(dbstate)
+
+    def flush(self, session: Session) -> None:
+        """Insert the pending rows into the session's transaction.
+
+        The EventTypes, EventData, StatesMeta and StateAttributes rows
+        the new rows refer to are flushed first so their ids are known.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        session.flush()
+        if self._events:
+            session.execute(
+                _INSERT_EVENTS, [dbevent.as_row() for dbevent in self._events]
+            )
+        if self._states:
+            self._insert_states(session)
+
+    def _insert_states(self, session: Session) -> None:
+        """Insert the pending States rows.
+
+        A state can only be inserted once the state_id of the old_state
+        it links to is known, so the rows are split into generations
+        where generation n holds the n-th state written for an entity
+        since the last commit.
+        """
+        generation_by_id: dict[int, int] = {}
+        generations: list[list[BulkStates]] = []
+        for dbstate in self._states:
+            generation = 0
+            if (old_state := dbstate.old_state) is not None:
+                generation = generation_by_id.get(id(old_state), -1) + 1
+            generation_by_id[id(dbstate)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(dbstate)
+
+        for dbstates in generations:
+            result = session.execute(
+                _INSERT_STATES, [dbstate.as_row() for dbstate in dbstates]
+            )
+            for dbstate, state_id in zip(dbstates, result.scalars(), strict=True):
+                dbstate.state_id = state_id
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to clear the inserted rows.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.clear()
+        self._states.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.clear()
+        self._states.clear()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from ..db_schema import States
+from .bulk_insert import BulkStates
 
 
 class StatesManager:
@@ -9,10 +10,10 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | BulkStates] = {}
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | BulkStates | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +34,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | BulkStates) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -80,6 +81,20 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_id_range(self, start: int, end: int) -> None:
+        """Evict committed states with a state_id in [start, end).
+
+        When we drop a states partition we need to make sure the next call
+        to record a state does not link the old_state_id to a dropped state.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id in [
+            entity_id
+            for entity_id, state_id in last_committed_ids.items()
+            if start <= state_id < end
+        ]:
+            del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
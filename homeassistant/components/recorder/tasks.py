@@ -372,6 +372,17 @@ class AdjustLRUSizeTask(RecorderTask):
         instance._adjust_lru_size()  # pylint: disable=[protected-access]
 
 
+@dataclass(slots=True)
+class AllocatePartitionsTask(RecorderTask):
+    """An object to insert into the recorder queue to allocate partitions."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task to allocate the upcoming partitions."""
+        instance._allocate_partitions()  # pylint: disable=[protected-access]
+
+
 @dataclass(slots=True)
 class StatesContextIDMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to migrate states context ids."""
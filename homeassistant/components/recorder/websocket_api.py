@@ -40,6 +40,7 @@ from .statistics import (
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
+    statistics_during_period_columns,
     validate_statistics,
 )
 from .util import (
@@ -177,6 +178,39 @@ def _ws_get_statistics_during_period(
     return JSON_DUMP(messages.result_message(msg_id, result))
 
 
+def _ws_get_statistics_during_period_columns(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str],
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> str:
+    """Fetch statistics as columns and convert them to json in the executor."""
+    result = statistics_during_period_columns(
+        hass,
+        start_time,
+        end_time,
+        statistic_ids,
+        period,
+        units,
+        types,
+    )
+    for columns in result.values():
+        if (start := columns.get("start")) is not None:
+            columns["start"] = [int(start_ts * 1000) for start_ts in start]
+        if (end := columns.get("end")) is not None:
+            columns["end"] = [int(end_ts * 1000) for end_ts in end]
+        if (last_reset := columns.get("last_reset")) is not None:
+            columns["last_reset"] = [
+                None if last_reset_ts is None else int(last_reset_ts * 1000)
+                for last_reset_ts in last_reset
+            ]
+    return JSON_DUMP(messages.result_message(msg_id, result))
+
+
 async def ws_handle_get_statistics_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
@@ -203,7 +237,9 @@ async def ws_handle_get_statistics_during_period(
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
-            _ws_get_statistics_during_period,
+            _ws_get_statistics_during_period_columns
+            if msg.get("columns")
+            else _ws_get_statistics_during_period,
             hass,
             msg["id"],
             start_time,
@@ -228,6 +264,7 @@ async def ws_handle_get_statistics_during_period(
             [vol.Any("change", "last_reset", "max", "mean", "min", "state", "sum")],
             vol.Coerce(set),
         ),
+        vol.Optional("columns"): bool,
     }
 )
 @websocket_api.async_response
@@ -52,7 +52,7 @@ from homeassistant.helpers.script import (
     script_stack_cv,
 )
 from homeassistant.helpers.service import async_set_service_schema
-from homeassistant.helpers.trace import trace_get, trace_path
+from homeassistant.helpers.trace import trace_disable, trace_get, trace_path
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime
@@ -585,7 +585,10 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             self._trace_config,
         ) as script_trace:
             # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            if script_trace.sampled:
+                script_trace.set_trace(trace_get())
+            else:
+                trace_disable()
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
@@ -6,9 +6,10 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_sample_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
 
@@ -31,8 +32,9 @@ def trace_script(
     trace_config: dict[str, Any],
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
-    trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    sampled = async_sample_trace(hass, f"{DOMAIN}.{item_id}", trace_config)
+    trace = ScriptTrace(item_id, config, blueprint_inputs, context, sampled)
+    async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -43,3 +45,4 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+            async_finish_trace(hass, trace, trace_config)
@@ -195,6 +195,7 @@ class SensorEntity(Entity):
     _last_reset_reported = False
     _sensor_option_display_precision: int | None = None
     _sensor_option_unit_of_measurement: str | None | UndefinedType = UNDEFINED
+    _static_attribute_properties = frozenset({"device_class"})
 
     @callback
     def add_to_platform_start(
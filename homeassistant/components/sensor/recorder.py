@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Iterable, MutableMapping
 import datetime
 import itertools
 import logging
 import math
+from operator import itemgetter
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -22,6 +23,7 @@ from homeassistant.components.recorder.models import (
     StatisticMetaData,
     StatisticResult,
 )
+from homeassistant.components.recorder.statistics_buffer import StatisticsBuffer
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     REVOLUTIONS_PER_MINUTE,
@@ -218,8 +220,7 @@ def _normalize_states(
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
     valid_fstates: list[tuple[float, State]] = []
-    convert: Callable[[float], float]
-    last_unit: str | None | object = object()
+    supported_fstates: list[tuple[float, State, str | None]] = []
 
     for fstate, state in fstates:
         state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
@@ -243,13 +244,19 @@ def _normalize_states(
                     LINK_DEV_STATISTICS,
                 )
             continue
-        if state_unit != last_unit:
-            # The unit of measurement has changed since the last state change
-            # recreate the converter factory
-            convert = converter.converter_factory(state_unit, statistics_unit)
-            last_unit = state_unit
-
-        valid_fstates.append((convert(fstate), state))
+        supported_fstates.append((fstate, state, state_unit))
+
+    # Convert the states with the same unit at once, the unit rarely changes
+    for state_unit, group in itertools.groupby(supported_fstates, itemgetter(2)):
+        run = list(group)
+        valid_fstates.extend(
+            zip(
+                converter.convert_many(
+                    [fstate for fstate, _, _ in run], state_unit, statistics_unit
+                ),
+                [state for _, state, _ in run],
+            )
+        )
 
     return statistics_unit, valid_fstates
 
@@ -373,6 +380,29 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_buffered_history(
+    statistics_buffer: StatisticsBuffer,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Return the history between start and end of the buffered entities."""
+    history_list: dict[str, list[State]] = {}
+    for _state in sensor_states:
+        entity_id = _state.entity_id
+        if (
+            entity_history := statistics_buffer.get_states(
+                entity_id,
+                start,
+                end,
+                significant_changes_only="sum" not in wanted_statistics[entity_id],
+            )
+        ) is not None:
+            history_list[entity_id] = entity_history
+    return history_list
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -384,13 +414,20 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    # Get history between start and end, from the statistics buffer if the
+    # recorder buffers the states and from the database otherwise
+    history_list: MutableMapping[str, list[State]] = {}
+    if (statistics_buffer := get_instance(hass).statistics_buffer).active:
+        history_list = _get_buffered_history(
+            statistics_buffer, sensor_states, wanted_statistics, start, end
+        )
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
+        _history_list = history.get_full_significant_states_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
@@ -398,10 +435,12 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
+        history_list = {**history_list, **_history_list}
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in history_list
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
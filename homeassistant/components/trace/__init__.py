@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+import json
 import logging
 from typing import Any
 
@@ -12,16 +13,22 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
+from homeassistant.helpers.script import DATA_SCRIPT_BREAKPOINTS
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_ERRORS_ONLY,
+    CONF_MAX_STORED_SIZE,
+    CONF_SAMPLE_EVERY,
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_EVERY,
     DEFAULT_STORED_TRACES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
@@ -31,10 +38,15 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "trace"
 
 STORAGE_KEY = "trace.saved_traces"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_SAMPLE_EVERY, default=DEFAULT_SAMPLE_EVERY): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_ERRORS_ONLY, default=False): cv.boolean,
+    vol.Optional(CONF_MAX_STORED_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1)),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -42,6 +54,27 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
 
+class TraceStore(Store[dict[str, list]]):
+    """Store saved traces."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, list],
+    ) -> dict[str, list]:
+        """Migrate to the new version."""
+        if old_major_version > 2:
+            raise NotImplementedError
+        if old_major_version == 1 and old_minor_version < 2:
+            # Version 2 only stores the extended dict of each trace
+            old_data = {
+                key: [trace["extended_dict"] for trace in traces]
+                for key, traces in old_data.items()
+            }
+        return old_data
+
+
 @callback
 def _get_data(hass: HomeAssistant) -> TraceData:
     return hass.data[DATA_TRACE]
@@ -50,10 +83,9 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
-    store = Store[dict[str, list]](
-        hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
-    )
+    store = TraceStore(hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder)
     hass.data[DATA_TRACE_STORE] = store
 
     async def _async_store_traces_at_stop(_: Event) -> None:
@@ -61,7 +93,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.debug("Storing traces")
         try:
             await store.async_save(
-                {key: list(traces.values()) for key, traces in _get_data(hass).items()}
+                {
+                    key: [trace.as_extended_dict() for trace in traces.values()]
+                    for key, traces in _get_data(hass).items()
+                }
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error storing traces", exc_info=exc)
@@ -151,6 +186,67 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_sample_trace(hass: HomeAssistant, key: str, trace_config: ConfigType) -> bool:
+    """Return if the next run of a script or automation should be traced.
+
+    Every sample_every-th run is traced, starting with the first run. All runs
+    are traced while a breakpoint is set for the script or automation, the
+    debugger can only stop runs which are traced.
+    """
+    if (sample_every := trace_config[CONF_SAMPLE_EVERY]) == 1:
+        return True
+    runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+    run = runs.get(key, 0)
+    runs[key] = (run + 1) % sample_every
+    if run == 0:
+        return True
+    breakpoints = hass.data.get(DATA_SCRIPT_BREAKPOINTS, {})
+    return any(breakpoints.get(key, {}).values())
+
+
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store a trace when its execution starts.
+
+    With errors_only, the trace is only stored when its execution has failed.
+    """
+    if trace.sampled and not trace_config[CONF_ERRORS_ONLY]:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store a trace when its execution has finished.
+
+    Drops the oldest traces of the script or automation if they exceed
+    max_stored_size. The newest trace is always kept. Restored traces have
+    no size, they are only dropped as older traces.
+    """
+    if not trace.sampled:
+        return
+    if trace_config[CONF_ERRORS_ONLY]:
+        if not trace.has_error:
+            return
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if (max_stored_size := trace_config.get(CONF_MAX_STORED_SIZE)) is None:
+        return
+    trace.size = len(json.dumps(trace.as_extended_dict(), cls=ExtendedJSONEncoder))
+    if not (traces := _get_data(hass).get(trace.key)):
+        return
+    stored_size = sum(stored_trace.size for stored_trace in traces.values())
+    for run_id, stored_trace in list(traces.items())[:-1]:
+        if stored_size <= max_stored_size:
+            break
+        if stored_trace.stopped:
+            stored_size -= stored_trace.size
+            del traces[run_id]
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -168,7 +264,7 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
 
     hass.data[DATA_TRACES_RESTORED] = True
 
-    store: Store[dict[str, list]] = hass.data[DATA_TRACE_STORE]
+    store: TraceStore = hass.data[DATA_TRACE_STORE]
     try:
         restored_traces = await store.async_load() or {}
     except HomeAssistantError:
@@ -1,7 +1,12 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_ERRORS_ONLY = "errors_only"
+CONF_MAX_STORED_SIZE = "max_stored_size"
+CONF_SAMPLE_EVERY = "sample_every"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_RUNS = "trace_runs"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_EVERY = 1  # Record the trace of every run
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
@@ -17,6 +17,9 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 import homeassistant.util.uuid as uuid_util
 
+# The keys of the extended dict which are not in the short dict
+_EXTENDED_KEYS = ("trace", "config", "blueprint_inputs", "context")
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -24,6 +27,14 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    # The size of the stored trace in bytes, only set for the traces of
+    # scripts and automations with max_stored_size when they finish
+    size: int = 0
+
+    @property
+    @abc.abstractmethod
+    def stopped(self) -> bool:
+        """Return if the execution has stopped."""
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -52,8 +63,12 @@ class ActionTrace(BaseTrace):
         config: dict[str, Any] | None,
         blueprint_inputs: dict[str, Any] | None,
         context: Context,
+        sampled: bool = True,
     ) -> None:
-        """Container for script trace."""
+        """Container for script trace.
+
+        The execution of a trace which is not sampled is not recorded.
+        """
         self._trace: dict[str, deque[TraceElement]] | None = None
         self._config = config
         self._blueprint_inputs = blueprint_inputs
@@ -67,10 +82,23 @@ class ActionTrace(BaseTrace):
         self.key = f"{self._domain}.{item_id}"
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
+        self.sampled = sampled
+        if not sampled:
+            return
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
 
+    @property
+    def stopped(self) -> bool:
+        """Return if the execution has stopped."""
+        return self._state == "stopped"
+
+    @property
+    def has_error(self) -> bool:
+        """Return if the execution failed with an error."""
+        return self._error is not None or self._script_execution == "error"
+
     def set_trace(self, trace: dict[str, deque[TraceElement]] | None) -> None:
         """Set action trace."""
         self._trace = trace
@@ -147,9 +175,11 @@ class RestoredTrace(BaseTrace):
     """Container for a restored script or automation trace."""
 
     def __init__(self, data: dict[str, Any]) -> None:
-        """Restore from dict."""
-        extended_dict = data["extended_dict"]
-        short_dict = data["short_dict"]
+        """Restore from the extended dict."""
+        extended_dict = data
+        short_dict = {
+            key: value for key, value in data.items() if key not in _EXTENDED_KEYS
+        }
         context = Context(
             user_id=extended_dict["context"]["user_id"],
             parent_id=extended_dict["context"]["parent_id"],
@@ -161,6 +191,11 @@ class RestoredTrace(BaseTrace):
         self._dict = extended_dict
         self._short_dict = short_dict
 
+    @property
+    def stopped(self) -> bool:
+        """Return if the execution has stopped."""
+        return True
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this RestoredTrace."""
         return self._dict
@@ -16,6 +16,7 @@ from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
 from .error import Disconnect
+from .messages import StreamedMessage
 
 if TYPE_CHECKING:
     from .http import WebSocketAdapter
@@ -57,7 +58,9 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[
+            [str | dict[str, Any] | StreamedMessage | Callable[[], str]], None
+        ],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
     ) -> None:
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HomeAssistant,
@@ -64,6 +65,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_SUBSCRIPTIONS = "websocket_api_entity_subscriptions"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -353,30 +355,142 @@ def _send_handle_get_states_response(
 ) -> None:
     """Send handle get states response."""
     connection.send_message(
-        construct_result_message(msg_id, f'[{",".join(serialized_states)}]')
+        messages.streamed_message(
+            messages.result_message(msg_id, messages.STREAMED_ITEMS),
+            serialized_states,
+        )
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("connection", "msg_id", "pending")
+
+    def __init__(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Initialize the subscription."""
+        self.connection = connection
+        self.msg_id = msg_id
+        # The changes which are queued but not sent yet by entity_id
+        self.pending: dict[str, _PendingEntityChange] = {}
+
+
+class _PendingEntityChange:
+    """A change of an entity which is queued to be sent to a connection.
+
+    Changes are queued like this once the connection falls behind. Later
+    changes of the entity are merged into the queued change until it is
+    sent, so the connection gets the latest state of the entity instead
+    of every change.
+    """
+
+    __slots__ = ("subscription", "entity_id", "event", "new_state")
+
+    def __init__(
+        self, subscription: _EntitySubscription, entity_id: str, event: Event
+    ) -> None:
+        """Initialize the change."""
+        self.subscription = subscription
+        self.entity_id = entity_id
+        self.event = event
+        self.new_state: State | None = event.data["new_state"]
+
+    def __call__(self) -> str:
+        """Build the message when it is sent."""
+        subscription = self.subscription
+        del subscription.pending[self.entity_id]
+        if self.new_state is self.event.data["new_state"]:
+            return messages.cached_state_diff_message(subscription.msg_id, self.event)
+        # A diff of merged changes can not describe both the last changed
+        # and last updated times, replace the whole state instead
+        return messages.entity_state_message(
+            subscription.msg_id, self.entity_id, self.new_state
+        )
+
+
+class _EntitySubscriptions:
+    """Forward state changed events to the subscribe_entities subscriptions.
+
+    A single listener serializes the state diff of an event once and
+    forwards it to the subscriptions of every connection.
+    """
+
+    __slots__ = ("hass", "_all_entities", "_entities", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self.hass = hass
+        self._all_entities: list[_EntitySubscription] = []
+        self._entities: dict[str, list[_EntitySubscription]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to the changes of entities, all if empty."""
+        subscription = _EntitySubscription(connection, msg_id)
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._entities.setdefault(entity_id, []).append(subscription)
+        else:
+            self._all_entities.append(subscription)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Unsubscribe the connection."""
+            if not entity_ids:
+                self._all_entities.remove(subscription)
+            for entity_id in entity_ids:
+                subscriptions = self._entities[entity_id]
+                subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._entities[entity_id]
+            if not self._all_entities and not self._entities and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward a state changed event to the subscriptions of the entity."""
+        entity_id: str = event.data["entity_id"]
+        subscriptions = self._all_entities
+        if entity_subscriptions := self._entities.get(entity_id):
+            subscriptions = [*subscriptions, *entity_subscriptions]
+        message_prefix: str | None = None
+        for subscription in subscriptions:
+            connection = subscription.connection
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            permissions = connection.user.permissions
+            if not permissions.access_all_entities(
+                POLICY_READ
+            ) and not permissions.check_entity(entity_id, POLICY_READ):
+                continue
+            # Once a change of the entity is queued, the later changes are
+            # merged into it to keep the changes of the entity in order
+            if subscription.pending and (
+                pending := subscription.pending.get(entity_id)
+            ):
+                pending.new_state = event.data["new_state"]
+                connection.send_stats.merged += 1
+            elif connection.pending_messages() >= const.MERGE_PENDING_MSG:
+                pending = subscription.pending[entity_id] = _PendingEntityChange(
+                    subscription, entity_id, event
+                )
+                connection.send_message(pending)
+            else:
+                if message_prefix is None:
+                    message_prefix = messages.cached_state_diff_message_prefix(event)
+                connection.send_message(
+                    f'{message_prefix},"id":{subscription.msg_id}}}'
+                )
 
 
 @callback
@@ -395,16 +509,10 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    if (subscriptions := hass.data.get(ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = hass.data[ENTITY_SUBSCRIPTIONS] = _EntitySubscriptions(hass)
+    connection.subscriptions[msg["id"]] = subscriptions.async_subscribe(
+        connection, msg["id"], entity_ids
     )
     connection.send_result(msg["id"])
 
@@ -443,7 +551,13 @@ def _send_handle_entities_init_response(
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
-        f'{{"id":{msg_id},"type":"event","event":{{"a":{{{",".join(serialized_states)}}}}}}}'
+        messages.streamed_message(
+            messages.event_message(
+                msg_id, {messages.ENTITY_EVENT_ADD: messages.STREAMED_ITEMS}
+            ),
+            serialized_states,
+            as_object=True,
+        )
     )
 
 
@@ -30,6 +30,44 @@ MessageHandler = Callable[[HomeAssistant, "ActiveConnection", dict[str, Any]], N
 BinaryHandler = Callable[[HomeAssistant, "ActiveConnection", bytes], None]
 
 
+class SendStats:
+    """Statistics of the messages sent to a connection.
+
+    The latency of a message is the time from queuing it until it was
+    written, which grows when the client does not keep up.
+    """
+
+    __slots__ = ("messages", "frames", "merged", "total_latency", "max_latency")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.messages = 0
+        self.frames = 0
+        self.merged = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return (
+            f"<SendStats messages={self.messages} frames={self.frames} "
+            f"merged={self.merged} average_latency={self.average_latency:.3f} "
+            f"max_latency={self.max_latency:.3f}>"
+        )
+
+    @property
+    def average_latency(self) -> float:
+        """Return the average latency of the messages in seconds."""
+        return self.total_latency / self.messages if self.messages else 0.0
+
+    def record(self, sent_at: float, queued_at: list[float]) -> None:
+        """Record a frame with the messages queued at the times in queued_at."""
+        self.frames += 1
+        self.messages += len(queued_at)
+        self.total_latency += sent_at * len(queued_at) - sum(queued_at)
+        self.max_latency = max(self.max_latency, sent_at - queued_at[0])
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -45,13 +83,18 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "send_stats",
+        "pending_messages",
     )
 
     def __init__(
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[
+            [str | dict[str, Any] | messages.StreamedMessage | Callable[[], str]],
+            None,
+        ],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -69,6 +112,9 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.send_stats = SendStats()
+        # Return the number of messages which are queued to be sent
+        self.pending_messages: Callable[[], int] = lambda: 0
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -244,7 +290,7 @@ class ActiveConnection:
 
     @callback
     def _connect_closed_error(
-        self, msg: str | dict[str, Any] | Callable[[], str]
+        self, msg: str | dict[str, Any] | messages.StreamedMessage | Callable[[], str]
     ) -> None:
         """Send a message when the connection is closed."""
         self.logger.debug("Tried to send message %s on closed connection", msg)
@@ -25,6 +25,10 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Changes of an entity are merged once this many messages are pending
+MERGE_PENDING_MSG: Final = 128
+# Streamed messages larger than this are sent in fragments of this size
+STREAM_FRAGMENT_SIZE: Final = 2**16
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
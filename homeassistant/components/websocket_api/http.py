@@ -6,9 +6,12 @@ from collections import deque
 from collections.abc import Callable
 import datetime as dt
 import logging
-from typing import TYPE_CHECKING, Any, Final
+import struct
+from typing import TYPE_CHECKING, Any, Final, cast
+import zlib
 
-from aiohttp import WSMsgType, web
+from aiohttp import WSMsgType, __version__ as AIOHTTP_VERSION, web
+from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -18,6 +21,7 @@ from homeassistant.helpers.event import async_call_later
 from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
+from .connection import SendStats
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
@@ -25,10 +29,11 @@ from .const import (
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
+    STREAM_FRAGMENT_SIZE,
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import StreamedMessage, message_to_json
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -37,6 +42,76 @@ if TYPE_CHECKING:
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
+_DEFLATE_TRAILER: Final = b"\x00\x00\xff\xff"
+
+# aiohttp has no API to send fragments, _async_send_fragment uses the
+# internals of the WebSocketWriter of these aiohttp versions. Streamed
+# messages are sent whole with other versions.
+_FRAGMENT_AIOHTTP_VERSIONS: Final = ("3.9.",)
+_FRAGMENT_WRITER_ATTRIBUTES: Final = (
+    "_closing",
+    "_compressobj",
+    "_make_compress_obj",
+    "_write",
+    "_output_size",
+    "_limit",
+    "compress",
+    "notakeover",
+)
+
+
+def _supports_fragments(writer: WebSocketWriter | None) -> bool:
+    """Return if _async_send_fragment can send fragments with a writer."""
+    return (
+        AIOHTTP_VERSION.startswith(_FRAGMENT_AIOHTTP_VERSIONS)
+        and writer is not None
+        and all(hasattr(writer, attr) for attr in _FRAGMENT_WRITER_ATTRIBUTES)
+        and hasattr(writer.protocol, "_drain_helper")
+    )
+
+
+async def _async_send_fragment(
+    writer: WebSocketWriter, payload: bytes, first: bool, last: bool
+) -> None:
+    """Send a fragment of a text message.
+
+    aiohttp only sends whole messages. The frame is built like aiohttp
+    builds its frames and uses its compressor, as the compressed data of
+    a message continues the compressed data of the earlier messages.
+
+    Only use this if _supports_fragments returns True for the writer.
+    """
+    # pylint: disable=protected-access
+    if writer._closing:
+        raise ConnectionResetError("Cannot write to closing transport")
+    header: int = WSMsgType.TEXT if first else WSMsgType.CONTINUATION
+    if last:
+        header |= 0x80
+    if writer.compress:
+        if not writer._compressobj:
+            writer._compressobj = writer._make_compress_obj(writer.compress)
+        compressobj = writer._compressobj
+        payload = await compressobj.compress(payload)
+        payload += compressobj.flush(
+            zlib.Z_FULL_FLUSH if writer.notakeover else zlib.Z_SYNC_FLUSH
+        )
+        if last and payload.endswith(_DEFLATE_TRAILER):
+            payload = payload[:-4]
+        if first:
+            header |= 0x40
+    if (length := len(payload)) < 126:
+        frame_header = struct.pack("!BB", header, length)
+    elif length < 2**16:
+        frame_header = struct.pack("!BBH", header, 126, length)
+    else:
+        frame_header = struct.pack("!BBQ", header, 127, length)
+    writer._write(frame_header + payload)
+    # Wait for the client to read the buffered data like aiohttp does
+    writer._output_size += len(frame_header) + length
+    if writer._output_size > writer._limit:
+        writer._output_size = 0
+        await writer.protocol._drain_helper()
+
 
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
@@ -74,6 +149,8 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_queued_at",
+        "_send_stats",
         "_ready_future",
     )
 
@@ -94,7 +171,12 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[
+            str | StreamedMessage | Callable[[], str] | None
+        ] = deque()
+        # The times the messages in the queue were queued at
+        self._queued_at: deque[float] = deque()
+        self._send_stats = SendStats()
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -119,6 +201,8 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        queued_at = self._queued_at
+        send_stats = self._send_stats
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
@@ -140,29 +224,53 @@ class WebSocketHandler:
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
+                batch_queued_at = [queued_at.popleft()]
+
+                if type(message) is not str:  # noqa: E721
+                    if isinstance(message, StreamedMessage):
+                        if debug_enabled:
+                            debug(
+                                "%s: Sending streamed message of %s characters",
+                                self.description,
+                                message.size,
+                            )
+                        await self._send_streamed(message)
+                        send_stats.record(loop.time(), batch_queued_at)
+                        continue
+                    # Messages which are built when they are sent
+                    message = cast(Callable[[], str], message)()
 
                 if (
                     not messages_remaining
                     or not (connection := self._connection)
                     or not connection.can_coalesce
+                    or isinstance(message_queue[0], StreamedMessage)
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
                     await send_str(message)
+                    send_stats.record(loop.time(), batch_queued_at)
                     continue
 
                 messages: list[str] = [message]
-                while messages_remaining:
+                # Streamed messages are sent on their own
+                while messages_remaining and not isinstance(
+                    message_queue[0], StreamedMessage
+                ):
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
+                    if type(message) is not str:  # noqa: E721
+                        message = cast(Callable[[], str], message)()
                     messages.append(message)
+                    batch_queued_at.append(queued_at.popleft())
                     messages_remaining -= 1
 
                 coalesced_messages = f'[{",".join(messages)}]'
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_str(coalesced_messages)
+                send_stats.record(loop.time(), batch_queued_at)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -173,6 +281,32 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _send_streamed(self, message: StreamedMessage) -> None:
+        """Send a streamed message in fragments.
+
+        Only a fragment of the message is encoded at a time, and the client
+        has to read the earlier fragments before more are sent.
+        """
+        writer = self._wsock._writer  # pylint: disable=protected-access
+        if not _supports_fragments(writer):
+            await self._wsock.send_str(str(message))
+            return
+        assert writer is not None
+        buffer: list[str] = []
+        size = 0
+        first = True
+        for fragment in message:
+            buffer.append(fragment)
+            if (size := size + len(fragment)) < STREAM_FRAGMENT_SIZE:
+                continue
+            await _async_send_fragment(
+                writer, "".join(buffer).encode("utf-8"), first, False
+            )
+            buffer.clear()
+            size = 0
+            first = False
+        await _async_send_fragment(writer, "".join(buffer).encode("utf-8"), first, True)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -181,7 +315,9 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | dict[str, Any] | StreamedMessage | Callable[[], str]
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -195,6 +331,11 @@ class WebSocketHandler:
 
         if isinstance(message, dict):
             message = message_to_json(message)
+        elif (
+            isinstance(message, StreamedMessage)
+            and message.size <= STREAM_FRAGMENT_SIZE
+        ):
+            message = str(message)
 
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
@@ -213,6 +354,7 @@ class WebSocketHandler:
             return
 
         message_queue.append(message)
+        self._queued_at.append(self._hass.loop.time())
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -322,6 +464,8 @@ class WebSocketHandler:
             if is_enabled_for(logging_debug):
                 debug("%s: Received %s", self.description, auth_msg_data)
             connection = await auth.async_handle(auth_msg_data)
+            connection.send_stats = self._send_stats
+            connection.pending_messages = self._message_queue.__len__
             self._connection = connection
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -438,6 +582,7 @@ class WebSocketHandler:
                     # Make sure all error messages are written before closing
                     await wsock.close()
                 finally:
+                    debug("%s: Sent %s", self.description, self._send_stats)
                     if disconnect_warn is None:
                         debug("%s: Disconnected", self.description)
                     else:
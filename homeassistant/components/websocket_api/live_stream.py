@@ -0,0 +1,289 @@
+"""Live event streams shared by websocket subscriptions.
+
+The history and logbook streams of the same entities and devices get the
+same live events. The subscriptions with the same filter share a live
+stream, which listens for the events once, converts a batch of events to
+a message once and sends the message to every subscription.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar, cast
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.json import JSON_DUMP
+import homeassistant.util.dt as dt_util
+
+from .connection import ActiveConnection
+from .const import DOMAIN
+
+DATA_LIVE_STREAMS = f"{DOMAIN}.live_streams"
+DATA_BACKFILL_CACHE = f"{DOMAIN}.backfill_cache"
+
+# Seconds to cache the result of a historical query
+BACKFILL_CACHE_TIME = 10
+BACKFILL_CACHE_SIZE = 16
+
+_T = TypeVar("_T")
+
+EventsConverter = Callable[[list[Event]], dict[str, Any] | None]
+EventsSubscriber = Callable[[list[CALLBACK_TYPE], Callable[[Event], None]], None]
+
+
+class LiveStreamSubscription:
+    """A subscription of a connection to a live stream."""
+
+    __slots__ = (
+        "stream",
+        "connection",
+        "msg_id",
+        "start_time",
+        "live",
+        "pending",
+        "cancel",
+    )
+
+    def __init__(
+        self,
+        stream: LiveStream,
+        connection: ActiveConnection,
+        msg_id: int,
+        cancel: CALLBACK_TYPE,
+    ) -> None:
+        """Initialize the subscription."""
+        self.stream = stream
+        self.connection = connection
+        self.msg_id = msg_id
+        # Events fired before are sent from the database instead
+        self.start_time = dt_util.utcnow()
+        self.live = False
+        # Events received before the subscription went live
+        self.pending: list[Event] = []
+        self.cancel = cancel
+
+    @callback
+    def async_go_live(self) -> None:
+        """Start sending the live events, the pending events first."""
+        self.live = True
+        events, self.pending = self.pending, []
+        self.stream.async_send(self, events)
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Unsubscribe from the live stream."""
+        self.stream.async_remove(self)
+
+
+class LiveStream:
+    """A live stream of events shared by subscriptions."""
+
+    __slots__ = (
+        "hass",
+        "key",
+        "_convert",
+        "_coalesce_time",
+        "_max_pending",
+        "_subscriptions",
+        "_unsubs",
+        "_events",
+        "_flush_handle",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: Hashable,
+        convert: EventsConverter,
+        coalesce_time: float,
+        max_pending: int,
+    ) -> None:
+        """Initialize the live stream."""
+        self.hass = hass
+        self.key = key
+        self._convert = convert
+        self._coalesce_time = coalesce_time
+        self._max_pending = max_pending
+        self._subscriptions: list[LiveStreamSubscription] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._events: list[Event] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_listen(self, subscribe: EventsSubscriber) -> None:
+        """Listen for the events of the stream."""
+        subscribe(self._unsubs, self.async_add_event)
+
+    @callback
+    def async_add_subscription(
+        self, connection: ActiveConnection, msg_id: int, cancel: CALLBACK_TYPE
+    ) -> LiveStreamSubscription:
+        """Add a subscription which gets the events fired from now on."""
+        subscription = LiveStreamSubscription(self, connection, msg_id, cancel)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    @callback
+    def async_add_event(self, event: Event) -> None:
+        """Add an event to the next batch.
+
+        The events are sent in batches so an event storm does not result
+        in a message per event, the subscriptions are canceled if there
+        are too many events to send.
+        """
+        self._events.append(event)
+        if len(self._events) > self._max_pending:
+            for subscription in list(self._subscriptions):
+                subscription.cancel()
+        elif self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                self._coalesce_time, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the batch of events to the subscriptions."""
+        self._flush_handle = None
+        events, self._events = self._events, []
+        partial_message: str | None = None
+        for subscription in list(self._subscriptions):
+            if not subscription.live:
+                subscription.pending.extend(events)
+                if len(subscription.pending) > self._max_pending:
+                    subscription.cancel()
+                continue
+            if events[0].time_fired <= subscription.start_time:
+                # The subscription started during the batch
+                self.async_send(subscription, events)
+                continue
+            if partial_message is None:
+                partial_message = self._partial_message(events)
+            if partial_message:
+                subscription.connection.send_message(
+                    f'{partial_message[:-1]},"id":{subscription.msg_id}}}'
+                )
+
+    def _partial_message(self, events: list[Event]) -> str:
+        """Return the JSON of an event message of events without the id."""
+        if not (event := self._convert(events)):
+            return ""
+        return JSON_DUMP({"type": "event", "event": event})
+
+    @callback
+    def async_send(
+        self, subscription: LiveStreamSubscription, events: list[Event]
+    ) -> None:
+        """Send the events fired after the start of a subscription to it."""
+        start_time = subscription.start_time
+        if events := [event for event in events if event.time_fired > start_time]:
+            if partial_message := self._partial_message(events):
+                subscription.connection.send_message(
+                    f'{partial_message[:-1]},"id":{subscription.msg_id}}}'
+                )
+
+    @callback
+    def async_remove(self, subscription: LiveStreamSubscription) -> None:
+        """Remove a subscription, the last one stops the stream."""
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.remove(subscription)
+        if self._subscriptions:
+            return
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        del self.hass.data[DATA_LIVE_STREAMS][self.key]
+
+
+@callback
+def async_subscribe_live_stream(
+    hass: HomeAssistant,
+    key: Hashable,
+    subscribe: EventsSubscriber,
+    convert: EventsConverter,
+    connection: ActiveConnection,
+    msg_id: int,
+    cancel: CALLBACK_TYPE,
+    coalesce_time: float,
+    max_pending: int,
+) -> LiveStreamSubscription:
+    """Subscribe a connection to the live stream of a filter.
+
+    The stream is created by subscribing to the events with subscribe
+    unless there is a stream with the same key, and the batches of events
+    are converted to the event of a message with convert. Subscriptions
+    only get the live events once they go live, cancel is called if too
+    many events are pending before.
+    """
+    streams: dict[Hashable, LiveStream] = hass.data.setdefault(DATA_LIVE_STREAMS, {})
+    if (stream := streams.get(key)) is None:
+        stream = streams[key] = LiveStream(
+            hass, key, convert, coalesce_time, max_pending
+        )
+        stream.async_listen(subscribe)
+    return stream.async_add_subscription(connection, msg_id, cancel)
+
+
+class _QueryCancelled(Exception):
+    """The query which ran a shared query was cancelled."""
+
+
+class BackfillCache(Generic[_T]):
+    """Cache the results of historical queries for a short time.
+
+    Queries for the same period which are started while the same query
+    is running wait for the result of the running query.
+    """
+
+    __slots__ = ("hass", "_results")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._results: dict[Hashable, tuple[float, asyncio.Future[_T]]] = {}
+
+    async def async_get(self, key: Hashable, query: Callable[[], Awaitable[_T]]) -> _T:
+        """Return the cached result of a query or run it."""
+        now = self.hass.loop.time()
+        while (cached := self._results.get(key)) is not None and cached[0] > now:
+            try:
+                return await asyncio.shield(cached[1])
+            except _QueryCancelled:
+                # The query which ran the shared query was cancelled
+                now = self.hass.loop.time()
+        for cached_key in [
+            cached_key
+            for cached_key, (expires, _) in self._results.items()
+            if expires <= now
+        ]:
+            del self._results[cached_key]
+        if len(self._results) >= BACKFILL_CACHE_SIZE:
+            del self._results[next(iter(self._results))]
+
+        future: asyncio.Future[_T] = self.hass.loop.create_future()
+        self._results[key] = (now + BACKFILL_CACHE_TIME, future)
+        try:
+            result = await query()
+        except BaseException as err:
+            if (cached := self._results.get(key)) is not None and cached[1] is future:
+                del self._results[key]
+            # The waiting queries run the query again if it was cancelled
+            future.set_exception(
+                err if isinstance(err, Exception) else _QueryCancelled()
+            )
+            # Only the waiting queries retrieve the exception
+            future.exception()
+            raise
+        future.set_result(result)
+        return result
+
+
+@callback
+def async_get_backfill_cache(hass: HomeAssistant) -> BackfillCache[Any]:
+    """Return the cache of historical queries of the streams."""
+    if (cache := hass.data.get(DATA_BACKFILL_CACHE)) is None:
+        cache = hass.data[DATA_BACKFILL_CACHE] = BackfillCache[Any](hass)
+    return cast(BackfillCache[Any], cache)
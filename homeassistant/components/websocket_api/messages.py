@@ -1,6 +1,7 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from functools import lru_cache
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
@@ -55,6 +56,56 @@ INVALID_JSON_PARTIAL_MESSAGE = JSON_DUMP(
 )
 
 
+# Placeholder for the items of a streamed message
+STREAMED_ITEMS: Final = "\0streamed_items\0"
+_STREAMED_ITEMS_JSON: Final = JSON_DUMP(STREAMED_ITEMS)
+
+
+class StreamedMessage:
+    """A message made up of the JSON of its items.
+
+    Large messages are sent to the client in fragments instead of building
+    the JSON of the whole message at once.
+    """
+
+    __slots__ = ("prefix", "items", "suffix", "size")
+
+    def __init__(self, prefix: str, items: Sequence[str], suffix: str) -> None:
+        """Initialize a streamed message."""
+        self.prefix = prefix
+        self.items = items
+        self.suffix = suffix
+        self.size = len(prefix) + sum(map(len, items)) + len(items) + len(suffix)
+
+    def __iter__(self) -> Iterator[str]:
+        """Return the fragments of the JSON of the message."""
+        yield self.prefix
+        separator = ""
+        for item in self.items:
+            yield separator
+            yield item
+            separator = ","
+        yield self.suffix
+
+    def __str__(self) -> str:
+        """Return the JSON of the message."""
+        return "".join(self)
+
+
+def streamed_message(
+    message: dict[str, Any], items: Sequence[str], as_object: bool = False
+) -> StreamedMessage:
+    """Return a streamed message from a message and the JSON of its items.
+
+    The value of the message which is STREAMED_ITEMS is replaced by an
+    array of the items, or an object if the items are JSON object members.
+    """
+    prefix, suffix = JSON_DUMP(message).split(_STREAMED_ITEMS_JSON)
+    if as_object:
+        return StreamedMessage(f"{prefix}{{", items, f"}}{suffix}")
+    return StreamedMessage(f"{prefix}[", items, f"]{suffix}")
+
+
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
@@ -130,7 +181,27 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return f'{_partial_cached_state_diff_message(event)[:-1]},"id":{iden}}}'
+    return f'{cached_state_diff_message_prefix(event)},"id":{iden}}}'
+
+
+def entity_state_message(iden: int, entity_id: str, state: State | None) -> str:
+    """Return an event message which adds or replaces the state of an entity.
+
+    The entity is removed if the state is None.
+    """
+    if state is None:
+        return message_to_json(event_message(iden, {ENTITY_EVENT_REMOVE: [entity_id]}))
+    return message_to_json(
+        event_message(iden, {ENTITY_EVENT_ADD: {entity_id: state.as_compressed_state}})
+    )
+
+
+def cached_state_diff_message_prefix(event: Event) -> str:
+    """Return the JSON of a state diff message up to the id.
+
+    The message is completed by appending the id and a closing brace.
+    """
+    return _partial_cached_state_diff_message(event)[:-1]
 
 
 @lru_cache(maxsize=128)
@@ -33,6 +33,7 @@ from typing import (
     Any,
     Generic,
     Literal,
+    NamedTuple,
     ParamSpec,
     Self,
     TypeVar,
@@ -45,9 +46,9 @@ import voluptuous as vol
 import yarl
 
 from . import block_async_io, util
-from .backports.functools import cached_property
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
@@ -1025,17 +1026,79 @@ _FilterableJobType = tuple[
     bool,  # run_immediately
 ]
 
+EVENT_INDEX_DOMAIN = "domain"
+EVENT_INDEX_ENTITY_ID = "entity_id"
+
+
+def _event_domain_key(event: Event) -> str | None:
+    """Return the domain of the entity_id in the event data."""
+    if not isinstance(entity_id := event.data.get(ATTR_ENTITY_ID), str):
+        return None
+    return entity_id.partition(".")[0]
+
+
+def _event_data_key_getter(data_key: str) -> Callable[[Event], str | None]:
+    """Return a callable that returns a value from the event data.
+
+    Values which are not strings can't match the keys of indexed listeners,
+    the callable returns None for them.
+    """
+
+    def _event_data_key(event: Event) -> str | None:
+        if not isinstance(key := event.data.get(data_key), str):
+            return None
+        return key
+
+    return _event_data_key
+
+
+_EVENT_INDEX_KEY_FUNCS: dict[str, Callable[[Event], str | None]] = {
+    EVENT_INDEX_DOMAIN: _event_domain_key,
+}
+
+_EventIndexType = tuple[
+    Callable[[Event], str | None],  # key function
+    dict[str, list[_FilterableJobType]],  # key -> listeners
+]
+
+
+def _async_filter_events(
+    event_filter: Callable[[Event], bool], batch: list[Event]
+) -> list[Event]:
+    """Return the events of a batch which pass an event filter."""
+    filtered: list[Event] = []
+    for event in batch:
+        try:
+            if event_filter(event):
+                filtered.append(event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error in event filter")
+    return filtered
+
+
+def _run_callback_batch(
+    job: HassJob[[Event], Coroutine[Any, Any, None] | None], batch: list[Event]
+) -> None:
+    """Run a callback listener for each event of a batch."""
+    for event in batch:
+        try:
+            job.target(event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running job: %s", job)
+
 
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_match_all_listeners", "_indexed_listeners", "_hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # event_type -> index -> (key function, key -> listeners)
+        self._indexed_listeners: dict[str, dict[str, _EventIndexType]] = {}
         self._hass = hass
 
     @callback
@@ -1044,7 +1107,18 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._indexed_listeners.items():
+            # A listener registered for multiple keys is only counted once
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {
+                    job
+                    for _, keyed_listeners in indexes.values()
+                    for jobs in keyed_listeners.values()
+                    for job in jobs
+                }
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1083,19 +1157,29 @@ class EventBus:
 
         listeners = self._listeners.get(event_type, [])
         match_all_listeners = self._match_all_listeners
+        indexes = self._indexed_listeners.get(event_type)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
+        if not listeners and not match_all_listeners and not indexes:
             return
 
         # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
         if event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        if indexes:
+            # Indexed listeners are routed with a single dict lookup per
+            # index instead of running an event_filter for each listener
+            for key_func, keyed_listeners in indexes.values():
+                if (key := key_func(event)) is not None and (
+                    indexed := keyed_listeners.get(key)
+                ):
+                    listeners = listeners + indexed
+
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1112,6 +1196,97 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def async_fire_many(
+        self,
+        event_type: str,
+        events: Iterable[tuple[dict[str, Any], Context | None]],
+        origin: EventOrigin = EventOrigin.local,
+        time_fired: datetime.datetime | None = None,
+    ) -> None:
+        """Fire a batch of events of the same type.
+
+        events is an iterable of event data and context pairs. The listeners
+        are looked up once for the batch and each callback listener is
+        scheduled once to handle all of its events. A listener handles its
+        events in order, but may handle the whole batch before the next
+        listener handles any of it.
+
+        This method must be run in the event loop.
+        """
+        if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
+            raise MaxLengthExceeded(
+                event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
+            )
+
+        listeners = self._listeners.get(event_type, [])
+        match_all_listeners = self._match_all_listeners
+        indexes = self._indexed_listeners.get(event_type)
+
+        batch = [
+            Event(event_type, event_data, origin, time_fired, context)
+            for event_data, context in events
+        ]
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for event in batch:
+                _LOGGER.debug("Bus:Handling %s", event)
+
+        if not batch or (not listeners and not match_all_listeners and not indexes):
+            return
+
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners = match_all_listeners + listeners
+
+        for job, event_filter, run_immediately in listeners:
+            if event_filter is None:
+                self._async_run_job_batch(job, run_immediately, batch)
+            else:
+                self._async_run_job_batch(
+                    job, run_immediately, _async_filter_events(event_filter, batch)
+                )
+
+        if not indexes:
+            return
+
+        # The events of each indexed listener, keyed by the listener
+        indexed_batches: dict[int, tuple[_FilterableJobType, list[Event]]] = {}
+        for key_func, keyed_listeners in indexes.values():
+            for event in batch:
+                if (key := key_func(event)) is None or not (
+                    indexed := keyed_listeners.get(key)
+                ):
+                    continue
+                for filterable_job in indexed:
+                    if (
+                        indexed_batch := indexed_batches.get(id(filterable_job))
+                    ) is None:
+                        indexed_batches[id(filterable_job)] = (filterable_job, [event])
+                    else:
+                        indexed_batch[1].append(event)
+
+        for (job, _, run_immediately), job_batch in indexed_batches.values():
+            self._async_run_job_batch(job, run_immediately, job_batch)
+
+    @callback
+    def _async_run_job_batch(
+        self,
+        job: HassJob[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool,
+        batch: list[Event],
+    ) -> None:
+        """Run or schedule a listener for a batch of events."""
+        if not batch:
+            return
+        if run_immediately:
+            _run_callback_batch(job, batch)
+        elif job.job_type == HassJobType.Callback:
+            self._hass.loop.call_soon(_run_callback_batch, job, batch)
+        else:
+            for event in batch:
+                self._hass.async_add_hass_job(job, event)
+
     def listen(
         self,
         event_type: str,
@@ -1171,6 +1346,64 @@ class EventBus:
             ),
         )
 
+    @callback
+    def async_listen_indexed(
+        self,
+        event_type: str,
+        index: str,
+        keys: str | Iterable[str],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type matching one or more keys.
+
+        The index names the event data key to route on, for example
+        ``EVENT_INDEX_ENTITY_ID``. ``EVENT_INDEX_DOMAIN`` routes on the
+        domain of the entity_id in the event data.
+
+        Unlike an event_filter, which runs for every listener, indexed
+        listeners are found with a single dict lookup per index when
+        the event is fired.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Indexed listeners require an event type")
+        job_type: HassJobType | None = None
+        if run_immediately:
+            if not is_callback_check_partial(listener):
+                raise HomeAssistantError(f"Event listener {listener} is not a callback")
+            job_type = HassJobType.Callback
+        # A listener is only registered once per key
+        key_list = [keys] if isinstance(keys, str) else list(dict.fromkeys(keys))
+        filterable_job: _FilterableJobType = (
+            HassJob(
+                listener, f"listen {event_type} {index} {key_list}", job_type=job_type
+            ),
+            None,
+            run_immediately,
+        )
+        indexes = self._indexed_listeners.setdefault(event_type, {})
+        if index not in indexes:
+            key_func = _EVENT_INDEX_KEY_FUNCS.get(index) or _event_data_key_getter(
+                index
+            )
+            indexes[index] = (key_func, {})
+        keyed_listeners = indexes[index][1]
+        for key in key_list:
+            keyed_listeners.setdefault(key, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_indexed_listener,
+            event_type,
+            index,
+            key_list,
+            filterable_job,
+        )
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
@@ -1272,6 +1505,37 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_indexed_listener(
+        self,
+        event_type: str,
+        index: str,
+        keys: list[str],
+        filterable_job: _FilterableJobType,
+    ) -> None:
+        """Remove an indexed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            indexes = self._indexed_listeners[event_type]
+            keyed_listeners = indexes[index][1]
+            for key in keys:
+                keyed_listeners[key].remove(filterable_job)
+                if not keyed_listeners[key]:
+                    del keyed_listeners[key]
+        except (KeyError, ValueError):
+            # KeyError if the event_type, index or key did not exist
+            # ValueError if listener did not exist within the key
+            _LOGGER.exception(
+                "Unable to remove unknown indexed job listener %s", filterable_job
+            )
+            return
+        if not keyed_listeners:
+            del indexes[index]
+            if not indexes:
+                del self._indexed_listeners[event_type]
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1286,6 +1550,23 @@ class State:
     object_id: Object id of this state.
     """
 
+    __slots__ = (
+        "entity_id",
+        "state",
+        "attributes",
+        "last_changed",
+        "last_updated",
+        "context",
+        "state_info",
+        "domain",
+        "object_id",
+        "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         entity_id: str,
@@ -1310,13 +1591,22 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # ReadOnlyDict is immutable so it can be shared between states
+        # instead of being copied, e.g. when only the state changed
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # noqa: E721
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -1351,12 +1641,14 @@ class State:
             )
         return self._as_dict
 
-    @cached_property
+    @property
     def as_dict_json(self) -> str:
         """Return a JSON string of the State."""
-        return json_dumps(self.as_dict())
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
 
-    @cached_property
+    @property
     def as_compressed_state(self) -> dict[str, Any]:
         """Build a compressed dict of a state for adds.
 
@@ -1364,6 +1656,8 @@ class State:
 
         Sends c (context) as a string if it only contains an id.
         """
+        if self._as_compressed_state is not None:
+            return self._as_compressed_state
         state_context = self.context
         if state_context.parent_id is None and state_context.user_id is None:
             context: dict[str, Any] | str = state_context.id
@@ -1379,9 +1673,10 @@ class State:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = dt_util.utc_to_timestamp(
                 self.last_updated
             )
+        self._as_compressed_state = compressed_state
         return compressed_state
 
-    @cached_property
+    @property
     def as_compressed_state_json(self) -> str:
         """Build a compressed JSON key value pair of a state for adds.
 
@@ -1389,7 +1684,11 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_dumps({self.entity_id: self.as_compressed_state})[1:-1]
+        if self._as_compressed_state_json is None:
+            self._as_compressed_state_json = json_dumps(
+                {self.entity_id: self.as_compressed_state}
+            )[1:-1]
+        return self._as_compressed_state_json
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -1494,6 +1793,17 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class StateWrite(NamedTuple):
+    """A state to write to the state machine with StateMachine.async_set_many."""
+
+    entity_id: str
+    new_state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
@@ -1705,7 +2015,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            if same_attr := old_state.attributes == attributes:
+                # Share the immutable attributes of the old state
+                attributes = old_state.attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
@@ -1750,6 +2062,91 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def async_set_many(self, writes: Iterable[StateWrite]) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        All states are validated and built before any of them is written
+        to the state machine, so an invalid state leaves the state machine
+        untouched. The states share a single timestamp and their
+        state_changed events are fired as one batch with
+        EventBus.async_fire_many once all states are written.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        states_data = self._states_data
+        # Newer states for entity_ids written more than once in this batch
+        pending: dict[str, State] = {}
+        changes: list[tuple[str, State | None, State, Context]] = []
+
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+        ) in writes:
+            entity_id = entity_id.lower()
+            new_state = str(new_state)
+            attributes = attributes or {}
+            if (old_state := pending.get(entity_id)) is None:
+                old_state = states_data.get(entity_id)
+            if old_state is None:
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                if same_attr := old_state.attributes == attributes:
+                    # Share the immutable attributes of the old state
+                    attributes = old_state.attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            if same_state and same_attr:
+                continue
+
+            if context is None:
+                context = Context(id=ulid_at_time(timestamp))
+
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                context,
+                old_state is None,
+                state_info,
+            )
+            pending[entity_id] = state
+            changes.append((entity_id, old_state, state, context))
+
+        states = self._states
+        for entity_id, old_state, state, _ in changes:
+            if old_state is not None:
+                old_state.expire()
+            states[entity_id] = state
+
+        self._bus.async_fire_many(
+            EVENT_STATE_CHANGED,
+            [
+                (
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": state,
+                    },
+                    context,
+                )
+                for entity_id, old_state, state, context in changes
+            ],
+            EventOrigin.local,
+            time_fired=now,
+        )
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -63,6 +63,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_enabled,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -149,8 +150,14 @@ def condition_trace_update_result(**kwargs: Any) -> None:
 
 
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None, None]:
+def trace_condition(
+    variables: TemplateVarsType,
+) -> Generator[TraceElement | None, None, None]:
     """Trace condition evaluation."""
+    if not trace_enabled():
+        yield None
+        return
+
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
@@ -4,6 +4,7 @@ from __future__ import annotations
 from abc import ABC
 import asyncio
 from collections.abc import Coroutine, Iterable, Mapping, MutableMapping
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum, auto
@@ -43,7 +44,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     EntityCategory,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    HomeAssistant,
+    StateWrite,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     InvalidStateError,
@@ -58,6 +65,10 @@ from .event import (
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
 )
+from .significant_change import (
+    DATA_FUNCTIONS as DATA_SIGNIFICANT_CHANGE_FUNCTIONS,
+    async_initialize as async_initialize_significant_change,
+)
 from .typing import UNDEFINED, EventType, StateType, UndefinedType
 
 if TYPE_CHECKING:
@@ -74,6 +85,62 @@ DATA_ENTITY_SOURCE = "entity_info"
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
 
+# The attributes which are cached between state writes and the properties
+# they are calculated from. An attribute is only cached if the properties
+# are not overridden, or the classes overriding them list them in
+# _static_attribute_properties.
+_STATIC_ATTRIBUTE_PROPERTIES: dict[str, tuple[str, ...]] = {
+    ATTR_UNIT_OF_MEASUREMENT: ("unit_of_measurement",),
+    ATTR_ASSUMED_STATE: ("assumed_state",),
+    ATTR_ATTRIBUTION: ("attribution",),
+    ATTR_DEVICE_CLASS: ("device_class",),
+    ATTR_ENTITY_PICTURE: ("entity_picture",),
+    ATTR_ICON: ("icon",),
+    ATTR_FRIENDLY_NAME: (
+        "name",
+        "has_entity_name",
+        "use_device_name",
+        "translation_key",
+        "device_class",
+    ),
+    ATTR_SUPPORTED_FEATURES: ("supported_features",),
+}
+# The cached attributes are recalculated when one of these is changed on the entity
+_STATIC_ATTRIBUTE_INPUTS = (
+    "_attr_unit_of_measurement",
+    "_attr_assumed_state",
+    "_attr_attribution",
+    "_attr_device_class",
+    "_attr_entity_picture",
+    "_attr_icon",
+    "_attr_name",
+    "_attr_has_entity_name",
+    "_attr_translation_key",
+    "_attr_supported_features",
+    "entity_description",
+    "registry_entry",
+    "device_entry",
+    "platform",
+)
+
+
+def _static_attributes(cls: type[Entity]) -> frozenset[str]:
+    """Return the attributes of an entity class which can be cached."""
+
+    def is_static(name: str) -> bool:
+        for klass in cls.__mro__:
+            if name in vars(klass):
+                return klass is Entity or name in vars(klass).get(
+                    "_static_attribute_properties", ()
+                )
+        return False
+
+    return frozenset(
+        attribute
+        for attribute, properties in _STATIC_ATTRIBUTE_PROPERTIES.items()
+        if all(is_static(name) for name in properties)
+    )
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -277,6 +344,12 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
+    # Limits the executor jobs of sync updates, shared by all entity platforms
+    executor_budget: asyncio.Semaphore | None = None
+
+    # The time the last update took, without waiting for parallel updates
+    _last_update_duration: float = 0
+
     # Entry in the entity registry
     registry_entry: er.RegistryEntry | None = None
 
@@ -313,6 +386,28 @@ class Entity(ABC):
 
     __remove_event: asyncio.Event | None = None
 
+    # The properties overridden by a subclass which only depend on the _attr_
+    # attributes and the entity description, set by subclasses
+    _static_attribute_properties: frozenset[str] = frozenset()
+    # The attributes which are cached and the attributes which are calculated
+    # on every state write, set automatically by __init_subclass__
+    __static_attributes: frozenset[str] = frozenset(_STATIC_ATTRIBUTE_PROPERTIES)
+    __dynamic_attributes: frozenset[str] = frozenset()
+    # The cached attributes and the inputs they were calculated from
+    _cached_static_attributes: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+    # Coalescing of state writes, set up by async_internal_added_to_hass if the
+    # entity has a min_state_write_interval
+    _state_write_interval: float | None = None
+    _last_state_write: float = 0
+    # The state and attributes of the last state write, which the next
+    # state writes are compared against
+    _last_written_state: tuple[str, Mapping[str, Any] | None] | None = None
+    _pending_state_write: StateWrite | None = None
+    _pending_state_write_handle: asyncio.TimerHandle | None = None
+    # Number of state writes which were replaced by a later state write
+    state_writes_suppressed: int = 0
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -329,6 +424,7 @@ class Entity(ABC):
     _attr_extra_state_attributes: MutableMapping[str, Any]
     _attr_force_update: bool
     _attr_icon: str | None
+    _attr_min_state_write_interval: timedelta | None = None
     _attr_name: str | None
     _attr_should_poll: bool = True
     _attr_state: StateType = STATE_UNKNOWN
@@ -343,6 +439,10 @@ class Entity(ABC):
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        cls.__static_attributes = _static_attributes(cls)
+        cls.__dynamic_attributes = (
+            frozenset(_STATIC_ATTRIBUTE_PROPERTIES) - cls.__static_attributes
+        )
 
     @property
     def should_poll(self) -> bool:
@@ -600,6 +700,19 @@ class Entity(ABC):
             return self.entity_description.force_update
         return False
 
+    @property
+    def min_state_write_interval(self) -> timedelta | None:
+        """Return the minimum time between two state writes.
+
+        A state write within the interval is delayed until the interval has
+        passed, and replaced by later state writes. Significant changes are
+        written right away. Defaults to MIN_STATE_WRITE_INTERVAL of the platform.
+        """
+        if self._attr_min_state_write_interval is not None:
+            return self._attr_min_state_write_interval
+        interval = getattr(self.platform, "min_state_write_interval", None)
+        return interval if isinstance(interval, timedelta) else None
+
     @property
     def supported_features(self) -> int | None:
         """Flag supported features."""
@@ -693,6 +806,7 @@ class Entity(ABC):
             )
 
         # update entity data
+        self._cached_static_attributes = None
         if force_refresh:
             try:
                 await self.async_device_update()
@@ -776,9 +890,10 @@ class Entity(ABC):
 
     @callback
     def _async_generate_attributes(self) -> tuple[str, dict[str, Any]]:
-        """Calculate state string and attribute mapping."""
-        entry = self.registry_entry
+        """Calculate state string and attribute mapping.
 
+        The attributes which do not change between state writes are cached.
+        """
         attr = self.capability_attributes
         attr = dict(attr) if attr else {}
 
@@ -788,42 +903,74 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.extra_state_attributes or {})
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        inputs = tuple(map(self.__dict__.get, _STATIC_ATTRIBUTE_INPUTS))
+        if (cached := self._cached_static_attributes) is None or cached[0] != inputs:
+            cached = (inputs, {})
+            self._async_add_attributes(cached[1], self.__static_attributes)
+            self._cached_static_attributes = cached
+        attr.update(cached[1])
+
+        if dynamic_attributes := self.__dynamic_attributes:
+            self._async_add_attributes(attr, dynamic_attributes)
+
+        return (state, attr)
+
+    @callback
+    def _async_add_attributes(
+        self, attr: dict[str, Any], attributes: frozenset[str]
+    ) -> None:
+        """Add the attributes calculated from the entity properties."""
+        entry = self.registry_entry
+
+        if ATTR_UNIT_OF_MEASUREMENT in attributes and (
+            (unit_of_measurement := self.unit_of_measurement) is not None
+        ):
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if ATTR_ASSUMED_STATE in attributes and (assumed_state := self.assumed_state):
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if ATTR_ATTRIBUTION in attributes and (
+            (attribution := self.attribution) is not None
+        ):
             attr[ATTR_ATTRIBUTION] = attribution
 
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
+        if ATTR_DEVICE_CLASS in attributes and (
+            (device_class := (entry and entry.device_class) or self.device_class)
+            is not None
+        ):
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if ATTR_ENTITY_PICTURE in attributes and (
+            (entity_picture := self.entity_picture) is not None
+        ):
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if ATTR_ICON in attributes and (
+            (icon := (entry and entry.icon) or self.icon) is not None
+        ):
             attr[ATTR_ICON] = icon
 
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
+        if ATTR_FRIENDLY_NAME in attributes and (
+            (name := (entry and entry.name) or self._friendly_name_internal())
+            is not None
+        ):
             attr[ATTR_FRIENDLY_NAME] = name
 
-        if (supported_features := self.supported_features) is not None:
+        if ATTR_SUPPORTED_FEATURES in attributes and (
+            (supported_features := self.supported_features) is not None
+        ):
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr)
-
     @callback
-    def _async_write_ha_state(self) -> None:
-        """Write the state to the state machine."""
+    def _async_calculate_state(self) -> StateWrite | None:
+        """Calculate the state to write to the state machine.
+
+        Returns None if the state should not be written.
+        """
         if self._platform_state == EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -839,7 +986,7 @@ class Entity(ABC):
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         start = timer()
         state, attr = self._async_generate_attributes()
@@ -868,15 +1015,31 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        return StateWrite(
+            entity_id, state, attr, self.force_update, self._context, self._state_info
+        )
+
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+        if (state_write := self._async_calculate_state()) is None:
+            return
+
+        if self._state_write_interval is not None and self._async_defer_state_write(
+            state_write
+        ):
+            return
+
+        self._async_set_state(state_write)
+
+    @callback
+    def _async_set_state(self, state_write: StateWrite) -> None:
+        """Set the state in the state machine."""
+        hass = self.hass
+        entity_id = self.entity_id
+
         try:
-            hass.states.async_set(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-            )
+            hass.states.async_set(*state_write)
         except InvalidStateError:
             _LOGGER.exception(
                 "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
@@ -885,6 +1048,85 @@ class Entity(ABC):
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    @callback
+    def _async_defer_state_write(self, state_write: StateWrite) -> bool:
+        """Return if the state write is delayed by the min_state_write_interval.
+
+        The delayed state write replaces any state write which is already
+        delayed, and is written when the interval has passed.
+        """
+        assert self._state_write_interval is not None
+        now = self.hass.loop.time()
+        if (
+            now - self._last_state_write >= self._state_write_interval
+            or self._async_is_significant_state_write(state_write)
+        ):
+            self._async_state_written(state_write, now)
+            return False
+
+        if self._pending_state_write is not None:
+            self.state_writes_suppressed += 1
+            self.platform.state_writes_suppressed += 1
+        else:
+            self._pending_state_write_handle = self.hass.loop.call_at(
+                self._last_state_write + self._state_write_interval,
+                self._async_write_pending_state,
+            )
+        self._pending_state_write = state_write
+        return True
+
+    @callback
+    def _async_is_significant_state_write(self, state_write: StateWrite) -> bool:
+        """Return if the state write is a significant change of the written state.
+
+        A change is only significant if the significant_change platform of
+        the domain says so, or if the entity turns or stops being unknown or
+        unavailable.
+        """
+        if (last_written_state := self._last_written_state) is None:
+            return True
+        old_state, old_attrs = last_written_state
+        new_state = state_write.new_state
+        if new_state in (STATE_UNKNOWN, STATE_UNAVAILABLE) or old_state in (
+            STATE_UNKNOWN,
+            STATE_UNAVAILABLE,
+        ):
+            return new_state != old_state
+        functions = self.hass.data[DATA_SIGNIFICANT_CHANGE_FUNCTIONS]
+        if (check_significant_change := functions.get(self.platform.domain)) is None:
+            return False
+        return (
+            check_significant_change(
+                self.hass, old_state, old_attrs, new_state, state_write.attributes
+            )
+            is True
+        )
+
+    @callback
+    def _async_state_written(self, state_write: StateWrite, now: float) -> None:
+        """Record a state write and drop the state write which was delayed."""
+        self._last_state_write = now
+        self._last_written_state = (state_write.new_state, state_write.attributes)
+        self._async_cancel_pending_state_write()
+
+    @callback
+    def _async_cancel_pending_state_write(self) -> None:
+        """Drop the state write which was delayed."""
+        if self._pending_state_write_handle is not None:
+            self._pending_state_write_handle.cancel()
+            self._pending_state_write_handle = None
+        self._pending_state_write = None
+
+    @callback
+    def _async_write_pending_state(self) -> None:
+        """Write the state write which was delayed."""
+        self._pending_state_write_handle = None
+        if (state_write := self._pending_state_write) is None:
+            return
+        self._async_state_written(state_write, self.hass.loop.time())
+        if self._platform_state != EntityPlatformState.REMOVED:
+            self._async_set_state(state_write)
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -901,7 +1143,7 @@ class Entity(ABC):
                 f"Entity {self.entity_id} schedule update ha state",
             )
         else:
-            self.hass.loop.call_soon_threadsafe(self.async_write_ha_state)
+            self.hass.loop.call_soon_threadsafe(self._async_refresh_ha_state)
 
     @callback
     def async_schedule_update_ha_state(self, force_refresh: bool = False) -> None:
@@ -921,7 +1163,13 @@ class Entity(ABC):
                 f"Entity schedule update ha state {self.entity_id}",
             )
         else:
-            self.async_write_ha_state()
+            self._async_refresh_ha_state()
+
+    @callback
+    def _async_refresh_ha_state(self) -> None:
+        """Write the state to the state machine, recalculating all attributes."""
+        self._cached_static_attributes = None
+        self.async_write_ha_state()
 
     @callback
     def _async_slow_update_warning(self) -> None:
@@ -954,14 +1202,20 @@ class Entity(ABC):
                 hass.loop.time() + SLOW_UPDATE_WARNING, self._async_slow_update_warning
             )
 
+        update_start: float | None = None
         try:
             if hasattr(self, "async_update"):
+                update_start = hass.loop.time()
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                async with self.executor_budget or nullcontext():
+                    update_start = hass.loop.time()
+                    await hass.async_add_executor_job(self.update)
             else:
                 return
         finally:
+            if update_start is not None:
+                self._last_update_duration = hass.loop.time() - update_start
             self._update_staged = False
             if warning:
                 update_warn.cancel()
@@ -1105,6 +1359,12 @@ class Entity(ABC):
             "unrecorded_attributes": self.__combined_unrecorded_attributes
         }
 
+        if isinstance(
+            min_state_write_interval := self.min_state_write_interval, timedelta
+        ):
+            self._state_write_interval = min_state_write_interval.total_seconds()
+            await async_initialize_significant_change(self.hass)
+
         if self.registry_entry is not None:
             # This is an assert as it should never happen, but helps in tests
             assert (
@@ -1123,6 +1383,9 @@ class Entity(ABC):
 
         Not to be extended by integrations.
         """
+        self._async_cancel_pending_state_write()
+        self._last_written_state = None
+
         # The check for self.platform guards against integrations not using an
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
@@ -4,8 +4,10 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import random
 from typing import TYPE_CHECKING, Any, Protocol
 
 import voluptuous as vol
@@ -15,20 +17,28 @@ from homeassistant.const import (
     ATTR_RESTORED,
     DEVICE_DEFAULT_NAME,
     EVENT_HOMEASSISTANT_STARTED,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
     EntityServiceResponse,
+    HassJob,
     HomeAssistant,
     ServiceCall,
+    StateWrite,
     SupportsResponse,
     callback,
     split_entity_id,
     valid_entity_id,
+    validate_state,
+)
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    InvalidStateError,
+    PlatformNotReady,
 )
-from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.generated import languages
 from homeassistant.setup import async_start_setup
 from homeassistant.util.async_ import run_callback_threadsafe
@@ -56,11 +66,128 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_ENTITY_POLL_SCHEDULER = "entity_poll_scheduler"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+POLL_SLOT_SECONDS = 1
+POLL_SLOT_CAPACITY = 100  # Entity updates per poll slot
+POLL_EXECUTOR_BUDGET = 16  # Parallel executor updates of entities
+POLL_BACKOFF_THRESHOLD = 10  # Failed or slow polls before backing off
+POLL_BACKOFF_MAX_SKIP = 8  # Max polls skipped after a failed or slow poll
+POLL_DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30)  # seconds
+
 _LOGGER = getLogger(__name__)
 
 
+class EntityPollScheduler:
+    """Schedule the polls of the entity platforms.
+
+    Polls are allocated to poll slots of POLL_SLOT_SECONDS. When the slot in
+    which a platform is polled is already full, the poll is moved to a random
+    time in the next slot which can take the entity updates of the platform.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the entity poll scheduler."""
+        # Entity updates allocated to each poll slot
+        self._slot_loads: dict[int, int] = {}
+        # Limits the executor jobs of entities with a sync update
+        self.executor_budget = asyncio.Semaphore(POLL_EXECUTOR_BUDGET)
+
+    @callback
+    def async_reserve_slot(self, now: float, load: int) -> float:
+        """Reserve a poll slot for a number of entity updates.
+
+        Returns the delay in seconds until the entities should be polled.
+        """
+        slot = int(now // POLL_SLOT_SECONDS)
+        slot_loads = self._slot_loads
+        for old_slot in [old_slot for old_slot in slot_loads if old_slot < slot]:
+            del slot_loads[old_slot]
+        # A poll slot always takes the updates of at least one platform
+        while (slot_load := slot_loads.get(slot, 0)) and (
+            slot_load + load > POLL_SLOT_CAPACITY
+        ):
+            slot += 1
+        slot_loads[slot] = slot_load + load
+        if (delay := slot * POLL_SLOT_SECONDS - now) <= 0:
+            return 0
+        return delay + random.uniform(0, POLL_SLOT_SECONDS)
+
+
+@callback
+def _async_get_poll_scheduler(hass: HomeAssistant) -> EntityPollScheduler:
+    """Return the entity poll scheduler."""
+    if (scheduler := hass.data.get(DATA_ENTITY_POLL_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_ENTITY_POLL_SCHEDULER] = EntityPollScheduler()
+    return scheduler
+
+
+@dataclass(slots=True)
+class EntityPollStats:
+    """Poll statistics of an entity."""
+
+    polls: int = 0
+    failed_polls: int = 0
+    skipped_polls: int = 0
+    # Number of consecutive failed or slow polls
+    misses: int = 0
+    # Number of polls to skip before the entity is polled again
+    backoff: int = 0
+    max_duration: float = 0
+    durations: list[int] = field(
+        default_factory=lambda: [0] * (len(POLL_DURATION_BUCKETS) + 1)
+    )
+
+    @callback
+    def async_should_poll(self) -> bool:
+        """Return if the entity should be polled or backs off."""
+        if not self.backoff:
+            return True
+        self.backoff -= 1
+        self.skipped_polls += 1
+        return False
+
+    @callback
+    def async_record(self, duration: float, failed: bool, slow: bool) -> None:
+        """Record a poll of the entity."""
+        self.polls += 1
+        self.max_duration = max(self.max_duration, duration)
+        bucket = 0
+        while (
+            bucket < len(POLL_DURATION_BUCKETS)
+            and duration > POLL_DURATION_BUCKETS[bucket]
+        ):
+            bucket += 1
+        self.durations[bucket] += 1
+        if failed:
+            self.failed_polls += 1
+        if not failed and not slow:
+            self.misses = 0
+            return
+        self.misses += 1
+        if self.misses >= POLL_BACKOFF_THRESHOLD:
+            self.backoff = min(
+                2 ** (self.misses - POLL_BACKOFF_THRESHOLD), POLL_BACKOFF_MAX_SKIP
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of the poll statistics."""
+        return {
+            "polls": self.polls,
+            "failed_polls": self.failed_polls,
+            "skipped_polls": self.skipped_polls,
+            "backoff": self.backoff,
+            "max_duration": self.max_duration,
+            "duration_histogram": dict(
+                zip(
+                    [*(str(bound) for bound in POLL_DURATION_BUCKETS), "+Inf"],
+                    self.durations,
+                )
+            ),
+        }
+
+
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
 
@@ -133,6 +260,14 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_unsub_polling: CALLBACK_TYPE | None = None
+        # Method to cancel a poll which was moved to a later poll slot
+        self._async_cancel_delayed_poll: CALLBACK_TYPE | None = None
+        self._delayed_poll_job = HassJob(
+            self._async_run_delayed_poll,
+            f"EntityPlatform delayed poll {domain}.{platform_name}",
+            cancel_on_shutdown=True,
+        )
+        self.poll_stats: dict[str, EntityPollStats] = {}
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -140,6 +275,14 @@ class EntityPlatform:
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
 
+        # Default minimum time between two state writes of the entities
+        self.min_state_write_interval: timedelta | None = getattr(
+            platform, "MIN_STATE_WRITE_INTERVAL", None
+        )
+        # Number of state writes of the entities which were replaced by a later
+        # state write
+        self.state_writes_suppressed = 0
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -531,7 +674,7 @@ class EntityPlatform:
 
         self._async_unsub_polling = async_track_time_interval(
             self.hass,
-            self._update_entity_states,
+            self._async_schedule_poll,
             self.scan_interval,
             name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
         )
@@ -567,6 +710,9 @@ class EntityPlatform:
             self,
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
+        if hasattr(entity, "update"):
+            scheduler = _async_get_poll_scheduler(self.hass)
+            entity.executor_budget = scheduler.executor_budget
 
         # Update properties before we generate the entity_id. This will happen
         # also for disabled entities.
@@ -748,6 +894,7 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities dict."""
             self.entities.pop(entity_id)
+            self.poll_stats.pop(entity_id, None)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -776,6 +923,9 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        if self._async_cancel_delayed_poll is not None:
+            self._async_cancel_delayed_poll()
+            self._async_cancel_delayed_poll = None
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -793,8 +943,46 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
+
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity] | None = None) -> None:
+        """Write the states of multiple entities to the state machine at once.
+
+        Writes the states of all entities of this platform if no entities
+        are passed. The states are written with a single call to
+        StateMachine.async_set_many.
+
+        This method must be run in the event loop.
+        """
+        state_writes: list[StateWrite] = []
+        for entity in self.entities.values() if entities is None else entities:
+            # pylint: disable=protected-access
+            if (state_write := entity._async_calculate_state()) is None:
+                continue
+            if (
+                entity._state_write_interval is not None
+                and entity._async_defer_state_write(state_write)
+            ):
+                continue
+            # pylint: enable=protected-access
+            try:
+                validate_state(state_write.new_state)
+            except InvalidStateError:
+                _LOGGER.exception(
+                    "Failed to set state for %s, fall back to %s",
+                    state_write.entity_id,
+                    STATE_UNKNOWN,
+                )
+                state_write = StateWrite(
+                    state_write.entity_id,
+                    STATE_UNKNOWN,
+                    {},
+                    state_write.force_update,
+                    state_write.context,
+                )
+            state_writes.append(state_write)
+        self.hass.states.async_set_many(state_writes)
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -846,11 +1034,60 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema, supports_response
         )
 
+    @callback
+    def _async_schedule_poll(self, now: datetime) -> None:
+        """Poll the entities in the first poll slot which is not full."""
+        if self._async_cancel_delayed_poll is not None:
+            # The previous poll is still waiting for its poll slot
+            return
+        hass = self.hass
+        scheduler = _async_get_poll_scheduler(hass)
+        load = sum(entity.should_poll for entity in self.entities.values())
+        if delay := scheduler.async_reserve_slot(hass.loop.time(), load):
+            self._async_cancel_delayed_poll = async_call_later(
+                hass, delay, self._delayed_poll_job
+            )
+            return
+        hass.async_create_task(
+            self._update_entity_states(now),
+            f"EntityPlatform poll {self.domain}.{self.platform_name}",
+        )
+
+    @callback
+    def _async_run_delayed_poll(self, now: datetime) -> None:
+        """Poll the entities in the poll slot they were moved to."""
+        self._async_cancel_delayed_poll = None
+        self.hass.async_create_task(
+            self._update_entity_states(now),
+            f"EntityPlatform poll {self.domain}.{self.platform_name}",
+        )
+
+    async def _async_poll_entity(self, entity: Entity) -> None:
+        """Update the state of a polling entity and record the poll."""
+        if (stats := self.poll_stats.get(entity.entity_id)) is None:
+            stats = self.poll_stats[entity.entity_id] = EntityPollStats()
+        await entity.async_update_ha_state(True)
+        # Waiting for the other updates of the platform is not part of the poll
+        duration = entity._last_update_duration  # pylint: disable=protected-access
+        stats.async_record(
+            duration,
+            not entity.available,
+            duration > self.scan_interval.total_seconds(),
+        )
+
+    @callback
+    def _async_should_poll(self, entity: Entity) -> bool:
+        """Return if a polling entity should be polled or backs off."""
+        if (stats := self.poll_stats.get(entity.entity_id)) is None:
+            return True
+        return stats.async_should_poll()
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
         To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        in parallel and other entities sequential. Entities which repeatedly
+        failed to update or were slow to update skip polls.
 
         This method must be run in the event loop.
         """
@@ -873,14 +1110,18 @@ class EntityPlatform:
                     # If the entity is removed from hass during the previous
                     # entity being updated, we need to skip updating the
                     # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
+                    if (
+                        entity.should_poll
+                        and entity.hass
+                        and self._async_should_poll(entity)
+                    ):
+                        await self._async_poll_entity(entity)
                 return
 
             if tasks := [
-                entity.async_update_ha_state(True)
+                self._async_poll_entity(entity)
                 for entity in self.entities.values()
-                if entity.should_poll
+                if entity.should_poll and self._async_should_poll(entity)
             ]:
                 await asyncio.gather(*tasks)
 
@@ -898,6 +1139,21 @@ def async_get_current_platform() -> EntityPlatform:
     return platform
 
 
+@callback
+def async_get_entity_poll_stats(
+    hass: HomeAssistant, config_entry_id: str
+) -> dict[str, dict[str, Any]]:
+    """Return the poll statistics of the entities of a config entry."""
+    return {
+        entity_id: stats.as_dict()
+        for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+        for platform in platforms
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == config_entry_id
+        for entity_id, stats in platform.poll_stats.items()
+    }
+
+
 @callback
 def async_get_platforms(
     hass: HomeAssistant, integration_name: str
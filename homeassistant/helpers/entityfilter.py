@@ -1,14 +1,16 @@
 """Helper class to implement include/exclude of entities and domains."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
+from enum import IntEnum
 import fnmatch
+from functools import lru_cache
 import re
 
 import voluptuous as vol
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import split_entity_id
+from homeassistant.core import MAX_EXPECTED_ENTITY_IDS, split_entity_id
 
 from . import config_validation as cv
 
@@ -22,6 +24,63 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 CONF_ENTITY_GLOBS = "entity_globs"
 
 
+class EntityFilterCase(IntEnum):
+    """The way a filter decides if an entity is included.
+
+    The SQL filters of the recorder are generated from the same case, so
+    they match the entities the filter includes exactly.
+    """
+
+    # All entities included
+    ALL = 1
+    # Entity listed in entities include, matches a domain include or
+    # matches a glob include: include
+    INCLUDE = 2
+    # Entity listed in entities exclude, matches a domain exclude or
+    # matches a glob exclude: exclude
+    EXCLUDE = 3
+    # Entity listed in entities include: include
+    # Otherwise, entity listed in entities exclude: exclude
+    # Otherwise, entity matches glob include: include
+    # Otherwise, entity matches glob exclude: exclude
+    # Otherwise, entity matches domain include: include
+    # Otherwise: exclude
+    DOMAIN_OR_GLOB_INCLUDE = 4
+    # Entity listed in entities include: include
+    # Otherwise, entity listed in exclude: exclude
+    # Otherwise, entity matches glob exclude: exclude
+    # Otherwise, entity matches domain exclude: exclude
+    # Otherwise: include
+    DOMAIN_OR_GLOB_EXCLUDE = 5
+    # Entity listed in entities include: include
+    # Otherwise: exclude
+    ENTITIES_INCLUDE = 6
+
+
+def entity_filter_case(
+    include_d: Collection[str],
+    include_e: Collection[str],
+    exclude_d: Collection[str],
+    exclude_e: Collection[str],
+    include_eg: Collection[str] | re.Pattern[str] | None,
+    exclude_eg: Collection[str] | re.Pattern[str] | None,
+) -> EntityFilterCase:
+    """Return the case of a filter of entities, domains and globs."""
+    have_exclude = bool(exclude_e or exclude_d or exclude_eg)
+    have_include = bool(include_e or include_d or include_eg)
+    if not have_include and not have_exclude:
+        return EntityFilterCase.ALL
+    if not have_exclude:
+        return EntityFilterCase.INCLUDE
+    if not have_include:
+        return EntityFilterCase.EXCLUDE
+    if include_d or include_eg:
+        return EntityFilterCase.DOMAIN_OR_GLOB_INCLUDE
+    if exclude_d or exclude_eg:
+        return EntityFilterCase.DOMAIN_OR_GLOB_EXCLUDE
+    return EntityFilterCase.ENTITIES_INCLUDE
+
+
 class EntityFilter:
     """A entity filter."""
 
@@ -181,21 +240,19 @@ def _generate_filter_from_sets_and_pattern_lists(
     include_eg: re.Pattern[str] | None,
     exclude_eg: re.Pattern[str] | None,
 ) -> Callable[[str], bool]:
-    """Generate a filter from pre-comuted sets and pattern lists."""
-    have_exclude = bool(exclude_e or exclude_d or exclude_eg)
-    have_include = bool(include_e or include_d or include_eg)
+    """Generate a filter from pre-comuted sets and pattern lists.
 
-    # Case 1 - No filter
-    # - All entities included
-    if not have_include and not have_exclude:
+    The decisions are cached per entity_id since the same entities are
+    filtered over and over again.
+    """
+    case = entity_filter_case(
+        include_d, include_e, exclude_d, exclude_e, include_eg, exclude_eg
+    )
+
+    if case is EntityFilterCase.ALL:
         return lambda entity_id: True
 
-    # Case 2 - Only includes
-    # - Entity listed in entities include: include
-    # - Otherwise, entity matches domain include: include
-    # - Otherwise, entity matches glob include: include
-    # - Otherwise: exclude
-    if have_include and not have_exclude:
+    if case is EntityFilterCase.INCLUDE:
 
         def entity_included(entity_id: str) -> bool:
             """Return true if entity matches inclusion filters."""
@@ -205,15 +262,9 @@ def _generate_filter_from_sets_and_pattern_lists(
                 or (bool(include_eg and include_eg.match(entity_id)))
             )
 
-        # Return filter function for case 2
-        return entity_included
+        return lru_cache(MAX_EXPECTED_ENTITY_IDS)(entity_included)
 
-    # Case 3 - Only excludes
-    # - Entity listed in exclude: exclude
-    # - Otherwise, entity matches domain exclude: exclude
-    # - Otherwise, entity matches glob exclude: exclude
-    # - Otherwise: include
-    if not have_include and have_exclude:
+    if case is EntityFilterCase.EXCLUDE:
 
         def entity_not_excluded(entity_id: str) -> bool:
             """Return true if entity matches exclusion filters."""
@@ -223,16 +274,9 @@ def _generate_filter_from_sets_and_pattern_lists(
                 or (exclude_eg and exclude_eg.match(entity_id))
             )
 
-        return entity_not_excluded
+        return lru_cache(MAX_EXPECTED_ENTITY_IDS)(entity_not_excluded)
 
-    # Case 4 - Domain and/or glob includes (may also have excludes)
-    # - Entity listed in entities include: include
-    # - Otherwise, entity listed in entities exclude: exclude
-    # - Otherwise, entity matches glob include: include
-    # - Otherwise, entity matches glob exclude: exclude
-    # - Otherwise, entity matches domain include: include
-    # - Otherwise: exclude
-    if include_d or include_eg:
+    if case is EntityFilterCase.DOMAIN_OR_GLOB_INCLUDE:
 
         def entity_filter_4a(entity_id: str) -> bool:
             """Return filter function for case 4a."""
@@ -247,15 +291,9 @@ def _generate_filter_from_sets_and_pattern_lists(
                 )
             )
 
-        return entity_filter_4a
+        return lru_cache(MAX_EXPECTED_ENTITY_IDS)(entity_filter_4a)
 
-    # Case 5 - Domain and/or glob excludes (no domain and/or glob includes)
-    # - Entity listed in entities include: include
-    # - Otherwise, entity listed in exclude: exclude
-    # - Otherwise, entity matches glob exclude: exclude
-    # - Otherwise, entity matches domain exclude: exclude
-    # - Otherwise: include
-    if exclude_d or exclude_eg:
+    if case is EntityFilterCase.DOMAIN_OR_GLOB_EXCLUDE:
 
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
@@ -264,9 +302,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 return entity_id in include_e
             return entity_id not in exclude_e
 
-        return entity_filter_4b
+        return lru_cache(MAX_EXPECTED_ENTITY_IDS)(entity_filter_4b)
 
-    # Case 6 - No Domain and/or glob includes or excludes
-    # - Entity listed in entities include: include
-    # - Otherwise: exclude
+    # A set lookup is as fast as the cache
     return lambda entity_id: entity_id in include_e
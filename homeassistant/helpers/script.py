@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
@@ -52,6 +52,7 @@ from homeassistant.const import (
     CONF_SERVICE,
     CONF_SERVICE_DATA,
     CONF_SERVICE_DATA_TEMPLATE,
+    CONF_SERVICE_TEMPLATE,
     CONF_STOP,
     CONF_TARGET,
     CONF_THEN,
@@ -61,6 +62,8 @@ from homeassistant.const import (
     CONF_WAIT_FOR_TRIGGER,
     CONF_WAIT_TEMPLATE,
     CONF_WHILE,
+    ENTITY_MATCH_ALL,
+    ENTITY_MATCH_NONE,
     EVENT_HOMEASSISTANT_STOP,
     SERVICE_TURN_ON,
 )
@@ -72,6 +75,7 @@ from homeassistant.core import (
     ServiceResponse,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
@@ -86,6 +90,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -447,29 +452,37 @@ class _ScriptRun:
         return ScriptRunResult(response, self._variables)
 
     async def _async_step(self, log_exceptions):
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        # pylint: disable-next=protected-access
+        step_data = self._script._get_step_data(self._step)
+
+        if not trace_enabled():
+            await self._async_run_step(step_data, log_exceptions)
+            return
 
         with trace_path(str(self._step)):
             async with trace_action(self._hass, self, self._stop, self._variables):
-                if self._stop.is_set():
-                    return
+                await self._async_run_step(step_data, log_exceptions)
 
-                action = cv.determine_script_action(self._action)
+    async def _async_run_step(self, step_data: _StepData, log_exceptions: bool) -> None:
+        if self._stop.is_set():
+            return
 
-                if not self._action.get(CONF_ENABLED, True):
-                    self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
-                    )
-                    trace_set_result(enabled=False)
-                    return
+        if not step_data["enabled"]:
+            self._log(
+                "Skipped disabled step %s",
+                self._script.sequence[self._step].get(CONF_ALIAS, step_data["action"]),
+            )
+            trace_set_result(enabled=False)
+            return
 
-                try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
-                except Exception as ex:  # pylint: disable=broad-except
-                    self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
-                    )
+        try:
+            await step_data["handler"](self)
+        except Exception as ex:  # pylint: disable=broad-except
+            self._handle_exception(
+                ex,
+                step_data["continue_on_error"],
+                self._log_exceptions or log_exceptions,
+            )
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # pylint: disable=protected-access
@@ -516,7 +529,8 @@ class _ScriptRun:
             raise exception
 
     def _log_exception(self, exception):
-        action_type = cv.determine_script_action(self._action)
+        # pylint: disable-next=protected-access
+        action_type = self._script._get_step_data(self._step)["action"]
 
         error = str(exception)
         level = logging.ERROR
@@ -672,9 +686,11 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        # pylint: disable-next=protected-access
+        if (params := self._script._get_static_service_params(self._step)) is None:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -760,7 +776,8 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        # pylint: disable-next=protected-access
+        cond = await self._script._async_get_step_condition(self._step)
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -1189,6 +1206,39 @@ class _IfData(TypedDict):
     if_else: Script | None
 
 
+class _StepData(TypedDict):
+    action: str
+    enabled: bool
+    continue_on_error: bool
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+
+
+class _StaticServiceParams(TypedDict):
+    params: service.ServiceParams
+    # The keys of the service data and the target with mutable values
+    service_data_mutable: tuple[str, ...]
+    target_mutable: tuple[str, ...]
+
+
+def _mutable_keys(data: Mapping[str, Any] | None) -> tuple[str, ...]:
+    """Return the keys of a dict with values which are not immutable scalars."""
+    if not data:
+        return ()
+    return tuple(
+        key
+        for key, value in data.items()
+        if value is not None and not isinstance(value, (str, int, float))
+    )
+
+
+def _copy_mutable(data: dict[str, Any], mutable: tuple[str, ...]) -> dict[str, Any]:
+    """Copy a dict, and deep copy its mutable values."""
+    data = dict(data)
+    for key in mutable:
+        data[key] = deepcopy(data[key])
+    return data
+
+
 @dataclass
 class ScriptRunResult:
     """Container with the result of a script run."""
@@ -1257,6 +1307,9 @@ class Script:
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
+        self._step_data: dict[int, _StepData] = {}
+        self._step_conditions: dict[int, ConditionCheckerType] = {}
+        self._static_service_params: dict[int, _StaticServiceParams | None] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
         self._if_data: dict[int, _IfData] = {}
@@ -1612,6 +1665,80 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    def _prep_step_data(self, step: int) -> _StepData:
+        action = self.sequence[step]
+        action_type = cv.determine_script_action(action)
+        return {
+            "action": action_type,
+            "enabled": action.get(CONF_ENABLED, True),
+            "continue_on_error": action.get(CONF_CONTINUE_ON_ERROR, False),
+            "handler": getattr(_ScriptRun, f"_async_{action_type}_step"),
+        }
+
+    def _get_step_data(self, step: int) -> _StepData:
+        if not (step_data := self._step_data.get(step)):
+            step_data = self._prep_step_data(step)
+            self._step_data[step] = step_data
+        return step_data
+
+    async def _async_get_step_condition(self, step: int) -> ConditionCheckerType:
+        if not (cond := self._step_conditions.get(step)):
+            cond = await self._async_get_condition(self.sequence[step])
+            self._step_conditions[step] = cond
+        return cond
+
+    def _prep_static_service_params(self, step: int) -> _StaticServiceParams | None:
+        """Prepare the params of a service call which does not use templates.
+
+        Returns None if the params must be prepared on every call.
+        """
+        action = self.sequence[step]
+        if any(
+            template.is_complex(action.get(key))
+            for key in (
+                CONF_SERVICE,
+                CONF_SERVICE_TEMPLATE,
+                CONF_TARGET,
+                CONF_SERVICE_DATA,
+                CONF_SERVICE_DATA_TEMPLATE,
+            )
+        ):
+            return None
+        # Entity registry ids are resolved to entity ids when preparing the call
+        if (target := action.get(CONF_TARGET)) and ATTR_ENTITY_ID in target:
+            try:
+                entity_ids = cv.comp_entity_ids_or_uuids(target[ATTR_ENTITY_ID])
+            except vol.Invalid:
+                return None
+            if entity_ids not in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE) and not all(
+                valid_entity_id(entity_id) for entity_id in entity_ids
+            ):
+                return None
+        params = service.async_prepare_call_from_config(self._hass, action)
+        return {
+            "params": params,
+            "service_data_mutable": _mutable_keys(params["service_data"]),
+            "target_mutable": _mutable_keys(params["target"]),
+        }
+
+    def _get_static_service_params(self, step: int) -> service.ServiceParams | None:
+        if step not in self._static_service_params:
+            self._static_service_params[step] = self._prep_static_service_params(step)
+        if (static_params := self._static_service_params[step]) is None:
+            return None
+        # The service call may modify the service data and target, only their
+        # values which are not immutable need a deep copy
+        params = static_params["params"]
+        if (target := params["target"]) is not None:
+            target = _copy_mutable(target, static_params["target_mutable"])
+        return {
+            **params,
+            "service_data": _copy_mutable(
+                params["service_data"], static_params["service_data_mutable"]
+            ),
+            "target": target,
+        }
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
@@ -70,12 +70,12 @@ async def create_checker(
     extra_significant_check: ExtraCheckTypeFunc | None = None,
 ) -> SignificantlyChangedChecker:
     """Create a significantly changed checker for a domain."""
-    await _initialize(hass)
+    await async_initialize(hass)
     return SignificantlyChangedChecker(hass, extra_significant_check)
 
 
 # Marked as singleton so multiple calls all wait for same output.
-async def _initialize(hass: HomeAssistant) -> None:
+async def async_initialize(hass: HomeAssistant) -> None:
     """Initialize the functions."""
     if DATA_FUNCTIONS in hass.data:
         return
@@ -2,16 +2,24 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
 import os
+import sys
 from typing import Any, Generic, TypeVar
 
-from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from atomicwrites import AtomicWriter
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+)
 from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
@@ -36,6 +44,17 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+DATA_STORAGE_SNAPSHOT = "storage_snapshot"
+SNAPSHOT_FILE = "core.snapshot"
+SNAPSHOT_VERSION = 1
+
+JOURNAL_SUFFIX = ".journal"
+# Key of the journal header which holds the hash of the data the journal
+# belongs to, a journal is stale once the data of its file changed
+JOURNAL_DATA_HASH = "data_hash"
+# Compact the journal into the file once it is this large relative to the file
+JOURNAL_COMPACT_RATIO = 0.5
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
@@ -79,6 +98,216 @@ async def async_migrator(
     return config
 
 
+def _fingerprint(path: str) -> tuple[int, int, int]:
+    """Return a fingerprint of a file which changes when the file is written."""
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+async def async_load_snapshot(hass: HomeAssistant, keys: Iterable[str]) -> None:
+    """Load the snapshot of stores and take a new one on shutdown.
+
+    The snapshot holds the data of the stores in a single marshalled file
+    which is read at once. The data of a store is decoded when the store
+    is loaded, and only if the file of the store did not change since the
+    snapshot was taken.
+    """
+    snapshot = StorageSnapshot(hass, keys)
+    await snapshot.async_load()
+    hass.data[DATA_STORAGE_SNAPSHOT] = snapshot
+
+
+class StorageSnapshot:
+    """A snapshot of the data of stores."""
+
+    def __init__(self, hass: HomeAssistant, keys: Iterable[str]) -> None:
+        """Initialize an empty snapshot."""
+        self.hass = hass
+        self.keys = list(keys)
+        self.path = hass.config.path(STORAGE_DIR, SNAPSHOT_FILE)
+        self._entries: dict[str, tuple[tuple[int, int, int], bytes]] = {}
+
+    def pop(self, key: str, path: str) -> Any | None:
+        """Return the data of a store, None if it changed since the snapshot.
+
+        The data of a store is only returned once.
+        """
+        if (entry := self._entries.pop(key, None)) is None:
+            return None
+        fingerprint, data = entry
+        try:
+            if _fingerprint(path) != fingerprint:
+                return None
+            return marshal.loads(data)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    async def async_load(self) -> None:
+        """Load the snapshot and take a new one on shutdown."""
+        self._entries = await self.hass.async_add_executor_job(self._load)
+        # Stores are written for the last time before the close event
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_save)
+
+    def _load(self) -> dict[str, tuple[tuple[int, int, int], bytes]]:
+        """Load the snapshot from disk."""
+        try:
+            with open(self.path, "rb") as fdesc:
+                version, python_version, entries = marshal.load(fdesc)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.warning("Discarding the storage snapshot %s: %s", self.path, err)
+            return {}
+        if version != SNAPSHOT_VERSION or python_version != sys.version_info[:2]:
+            return {}
+        return entries
+
+    async def _async_save(self, _event: Event) -> None:
+        """Take a new snapshot."""
+        await self.hass.async_add_executor_job(self._save)
+
+    def _save(self) -> None:
+        """Write the data of the stores to the snapshot."""
+        entries: dict[str, tuple[tuple[int, int, int], bytes]] = {}
+        for key in self.keys:
+            path = self.hass.config.path(STORAGE_DIR, key)
+            try:
+                fingerprint = _fingerprint(path)
+                with open(path, "rb") as fdesc:
+                    data = json_util.json_loads(fdesc.read())
+                if _fingerprint(path) != fingerprint:
+                    # Written while it was read
+                    continue
+            except (OSError, *json_util.JSON_DECODE_EXCEPTIONS):
+                continue
+            entries[key] = (fingerprint, marshal.dumps(data))
+
+        try:
+            if not entries:
+                with suppress(FileNotFoundError):
+                    os.unlink(self.path)
+                return
+            with AtomicWriter(self.path, mode="wb", overwrite=True).open() as fdesc:
+                marshal.dump((SNAPSHOT_VERSION, sys.version_info[:2], entries), fdesc)
+        except OSError as err:
+            _LOGGER.warning("Error writing the storage snapshot %s: %s", self.path, err)
+
+
+def _json_differs(old: Any, new: Any) -> bool:
+    """Return if two JSON values differ.
+
+    Fast, but == treats True, 1 and 1.0 inside lists and objects as equal.
+    """
+    return type(old) is not type(new) or old != new
+
+
+def _json_differs_strict(old: Any, new: Any) -> bool:
+    """Return if two JSON values differ, comparing their JSON."""
+    return json_helper.json_bytes(old) != json_helper.json_bytes(new)
+
+
+def _json_diff(
+    old: Any,
+    new: Any,
+    path: list[Any],
+    ops: list[list[Any]],
+    differs: Callable[[Any, Any], bool] = _json_differs,
+) -> None:
+    """Add the operations which turn the JSON data old into new to ops.
+
+    Operations set a value or delete a key at a path of keys. Lists of
+    objects with unique ids are diffed by id, a path element {"id": ...}
+    is the item with that id. Other lists are set as a whole. Operations
+    hold the values the data is changed to, so replaying them again leaves
+    the data unchanged.
+    """
+    if type(old) is dict and type(new) is dict:  # noqa: E721
+        ops.extend(["d", [*path, key]] for key in old.keys() - new.keys())
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["s", [*path, key], value])
+            elif differs(old[key], value):
+                _json_diff(old[key], value, [*path, key], ops, differs)
+        return
+    if (
+        type(old) is list  # noqa: E721
+        and type(new) is list  # noqa: E721
+        and (old_ids := _json_list_ids(old)) is not None
+        and (new_ids := _json_list_ids(new)) is not None
+    ):
+        new_items = dict(zip(new_ids, new))
+        kept = [item_id for item_id in old_ids if item_id in new_items]
+        # Items with a new id are appended, so the kept items must stay in
+        # the same order at the start of the list
+        if new_ids[: len(kept)] == kept:
+            old_items = dict(zip(old_ids, old))
+            ops.extend(
+                ["d", [*path, {"id": item_id}]]
+                for item_id in old_ids
+                if item_id not in new_items
+            )
+            for item_id, value in new_items.items():
+                if (old_value := old_items.get(item_id)) is None:
+                    ops.append(["s", [*path, {"id": item_id}], value])
+                elif differs(old_value, value):
+                    _json_diff(old_value, value, [*path, {"id": item_id}], ops, differs)
+            return
+    ops.append(["s", path, new])
+
+
+def _json_list_ids(items: list[Any]) -> list[str] | None:
+    """Return the ids of a list of objects with unique ids, or None."""
+    ids: list[str] = []
+    for item in items:
+        if type(item) is not dict or type(item_id := item.get("id")) is not str:  # noqa: E721
+            return None
+        ids.append(item_id)
+    if len(set(ids)) != len(ids):
+        return None
+    return ids
+
+
+def _json_index(parent: Any, key: Any) -> Any:
+    """Return the key or index of a path element in its parent.
+
+    An {"id": ...} path element is the index of the item with that id, or
+    the end of the list if there is no such item.
+    """
+    if type(key) is not dict:  # noqa: E721
+        return key
+    for index, item in enumerate(parent):
+        if type(item) is dict and item.get("id") == key["id"]:  # noqa: E721
+            return index
+    return len(parent)
+
+
+def _json_apply(data: Any, ops: list[list[Any]]) -> Any:
+    """Apply operations created by _json_diff to JSON data."""
+    for kind, path, *args in ops:
+        if not path:
+            data = args[0]
+            continue
+        parent = data
+        for key in path[:-1]:
+            parent = parent[_json_index(parent, key)]
+        key = _json_index(parent, path[-1])
+        if kind == "d":
+            if type(parent) is not list:  # noqa: E721
+                parent.pop(key, None)
+            elif key < len(parent):
+                del parent[key]
+        elif type(parent) is list and key == len(parent):  # noqa: E721
+            parent.append(args[0])
+        else:
+            parent[key] = args[0]
+    return data
+
+
+def _json_hash(data: Any) -> str:
+    """Return the hash of JSON data."""
+    return hashlib.sha256(json_helper.json_bytes(data)).hexdigest()
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -94,8 +323,14 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores with a journal append the changes of each save to a journal
+        next to the file, and only rewrite the file once the journal grew
+        too large. The journal is replayed when the store is loaded.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +344,26 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = journal
+        # The data and its JSON as of the last write, the hash of the data in
+        # the file and the sizes of the file and journal
+        self._journal_base: Any = None
+        self._journal_content = b""
+        self._file_hash: str | None = None
+        self._journal_size = 0
+        self._file_size = 0
+        self.bytes_written = 0
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -158,9 +407,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -251,6 +498,53 @@ class Store(Generic[_T]):
 
         return stored
 
+    def _load_data(self) -> Any:
+        """Load the data from the storage snapshot or else from the file."""
+        data: Any = None
+        if (snapshot := self.hass.data.get(DATA_STORAGE_SNAPSHOT)) is not None:
+            data = snapshot.pop(self.key, self.path)
+        if data is None:
+            data = json_util.load_json(self.path)
+        # The snapshot holds the file without the changes in the journal
+        if self._journal and data:
+            data = self._replay_journal(data)
+        return data
+
+    def _replay_journal(self, data: Any) -> Any:
+        """Apply the changes in the journal to the data of the file.
+
+        The journal is only replayed if its header holds the hash of the data
+        in the file, a journal left behind by an interrupted compaction is
+        stale.
+        """
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                records = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return data
+        try:
+            header = json_util.json_loads(records[0]) if records else None
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            header = None
+        file_hash = _json_hash(data)
+        if not isinstance(header, dict) or header.get(JOURNAL_DATA_HASH) != file_hash:
+            _LOGGER.debug("Ignoring the stale journal of %s", self.key)
+            return data
+        # A compaction which does not change the data of the file must
+        # remove the journal without rewriting the file
+        self._file_hash = file_hash
+        for record in records[1:]:
+            try:
+                data = _json_apply(data, json_util.json_loads(record))  # type: ignore[arg-type]
+            except (*json_util.JSON_DECODE_EXCEPTIONS, LookupError, TypeError):
+                # The last record is incomplete if writing it was interrupted
+                _LOGGER.warning(
+                    "Ignoring the rest of the journal of %s after an invalid record",
+                    self.key,
+                )
+                break
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -360,6 +654,10 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal:
+            self._write_journaled(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -369,6 +667,71 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_journaled(self, path: str, data: dict) -> None:
+        """Append the changes to the journal or rewrite the file."""
+        content = json_helper.json_bytes(data)
+        new = json_util.json_loads(content)
+        if (base := self._journal_base) is not None:
+            ops: list[list[Any]] = []
+            _json_diff(base, new, [], ops)
+            if json_helper.json_bytes(_json_apply(base, ops)) != content:
+                # The fast diff missed a change between True, 1 and 1.0
+                ops = []
+                _json_diff(
+                    json_util.json_loads(self._journal_content),
+                    new,
+                    [],
+                    ops,
+                    _json_differs_strict,
+                )
+            if not ops:
+                return
+            record = json_helper.json_bytes(ops) + b"\n"
+            if not self._journal_size:
+                # A new journal starts with the hash of the data it belongs to
+                header = json_helper.json_bytes({JOURNAL_DATA_HASH: self._file_hash})
+                record = header + b"\n" + record
+            journal_size = self._journal_size + len(record)
+            if journal_size <= self._file_size * JOURNAL_COMPACT_RATIO:
+                _LOGGER.debug(
+                    "Writing %s bytes to the journal of %s", len(record), self.key
+                )
+                fd = os.open(
+                    self.journal_path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if self._private else 0o644,
+                )
+                with open(fd, "ab") as fdesc:
+                    fdesc.write(record)
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+                self._journal_size = journal_size
+                self.bytes_written += len(record)
+                self._journal_base = new
+                self._journal_content = content
+                return
+
+        # A journal left behind if removing it is interrupted is stale as the
+        # data of the file changed. If the data is unchanged the journal is
+        # removed without rewriting the file.
+        if (file_hash := _json_hash(new)) != self._file_hash:
+            _LOGGER.debug("Writing data for %s to %s", self.key, path)
+            json_helper.save_json(
+                path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                atomic_writes=self._atomic_writes,
+            )
+            self._file_hash = file_hash
+            self.bytes_written += os.path.getsize(path)
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._file_size = os.path.getsize(path)
+        self._journal_size = 0
+        self._journal_base = new
+        self._journal_content = content
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -380,3 +743,8 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            self._journal_base = None
+            self._file_hash = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
@@ -10,10 +10,14 @@ from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+import importlib.util
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -34,6 +38,7 @@ from typing import (
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
+from atomicwrites import AtomicWriter
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
@@ -50,14 +55,18 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -80,6 +89,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -92,6 +102,9 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_COMPILED_TEMPLATE_CACHE = "template.compiled_template_cache"
+
+COMPILED_TEMPLATE_CACHE_FILE = "core.template_cache"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -943,6 +956,9 @@ class TemplateStateBase(State):
         self._collect = collect
         self._entity_id = entity_id
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: dict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
 
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
@@ -2321,6 +2337,126 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+async def async_load_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Load the compiled templates of the previous run."""
+    await _get_compiled_template_cache(hass).async_load()
+
+
+def compiled_template_cache_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return the hits and misses of the compiled template cache."""
+    cache = _get_compiled_template_cache(hass)
+    return {"hits": cache.hits, "misses": cache.misses, "size": len(cache)}
+
+
+@singleton(_COMPILED_TEMPLATE_CACHE)
+def _get_compiled_template_cache(hass: HomeAssistant) -> CompiledTemplateCache:
+    return CompiledTemplateCache(hass)
+
+
+def _compiled_template_cache_version() -> tuple[bytes, str, str]:
+    """Return the versions the compiled templates are only valid for."""
+    return (importlib.util.MAGIC_NUMBER, jinja2.__version__, HA_VERSION)
+
+
+class CompiledTemplateCache:
+    """A cache of compiled templates which is kept between restarts.
+
+    The code objects are marshalled and keyed by a hash of the template
+    and the mode of the environment which compiled it. The cache is
+    discarded when the versions of Python, Jinja or Home Assistant change.
+    Entries are only unmarshalled once a template is compiled again, and
+    the entries which were not used during a run are dropped on shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._path = hass.config.path(STORAGE_DIR, COMPILED_TEMPLATE_CACHE_FILE)
+        self._loaded: dict[bytes, bytes] = {}
+        self._used: dict[bytes, bytes] = {}
+        self._changed = False
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._loaded.keys() | self._used.keys())
+
+    @staticmethod
+    def _key(mode: str, source: str) -> bytes:
+        """Return the key of a template compiled in mode."""
+        return hashlib.sha256(f"{mode}\0{source}".encode()).digest()
+
+    def get(self, mode: str, source: str) -> CodeType | None:
+        """Return the code of a template, None if it was not compiled before."""
+        key = self._key(mode, source)
+        if (data := self._used.get(key) or self._loaded.get(key)) is not None:
+            try:
+                code = marshal.loads(data)
+            except (EOFError, ValueError, TypeError):
+                self._loaded.pop(key, None)
+            else:
+                self._used[key] = data
+                self.hits += 1
+                return code  # type: ignore[no-any-return]
+        self.misses += 1
+        return None
+
+    def set(self, mode: str, source: str, code: CodeType) -> None:
+        """Store the code of a template compiled in mode."""
+        self._used[self._key(mode, source)] = marshal.dumps(code)
+        self._changed = True
+
+    async def async_load(self) -> None:
+        """Load the cache and save the templates compiled during the run."""
+        self._loaded = await self.hass.async_add_executor_job(self._load)
+
+        async def _async_save_changed(_: Event) -> None:
+            """Save the templates compiled during startup."""
+            if self._changed:
+                await self._async_save({**self._loaded, **self._used})
+
+        async def _async_save_used(_: Event) -> None:
+            """Save the templates used during the run."""
+            if self._changed or self._used.keys() != self._loaded.keys():
+                await self._async_save(dict(self._used))
+
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, _async_save_changed
+        )
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_used
+        )
+
+    def _load(self) -> dict[bytes, bytes]:
+        """Load the cache from disk."""
+        try:
+            with open(self._path, "rb") as fdesc:
+                version, entries = marshal.load(fdesc)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Discarding the compiled template cache: %s", err)
+            return {}
+        if version != _compiled_template_cache_version():
+            return {}
+        return entries  # type: ignore[no-any-return]
+
+    async def _async_save(self, entries: dict[bytes, bytes]) -> None:
+        """Save entries to disk."""
+        self._changed = False
+        try:
+            await self.hass.async_add_executor_job(self._save, entries)
+        except OSError as err:
+            _LOGGER.warning("Saving the compiled template cache failed: %s", err)
+
+    def _save(self, entries: dict[bytes, bytes]) -> None:
+        """Write entries to disk."""
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with AtomicWriter(self._path, mode="wb", overwrite=True).open() as fdesc:
+            marshal.dump((_compiled_template_cache_version(), entries), fdesc)
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -2365,6 +2501,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
+        self.compiled_template_cache = (
+            _get_compiled_template_cache(hass) if hass is not None else None
+        )
+        self._compiled_template_mode = (
+            "limited" if limited else "strict" if strict else "default"
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2655,9 +2797,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        if (cached := self.template_cache.get(source)) is not None:
+            return cached
 
+        if self.compiled_template_cache is None or not isinstance(source, str):
+            cached = self.template_cache[source] = super().compile(source)
+            return cached
+
+        # Templates compiled during a previous run skip parsing and compiling
+        mode = self._compiled_template_mode
+        if (cached := self.compiled_template_cache.get(mode, source)) is None:
+            cached = super().compile(source)
+            self.compiled_template_cache.set(mode, source, cached)
+        self.template_cache[source] = cached
         return cached
 
 
@@ -41,12 +41,15 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables
+            or (last_variables[key] is not value and last_variables[key] != value)
         }
+        # The copy of the variables is only replaced when they have changed
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
     def __repr__(self) -> str:
@@ -115,6 +118,14 @@ script_execution_cv: ContextVar[StopReason | None] = ContextVar(
 )
 
 
+def trace_enabled() -> bool:
+    """Return if a trace is being recorded.
+
+    A trace is recorded after trace_get or trace_clear has been called.
+    """
+    return trace_cv.get() is not None
+
+
 def trace_id_set(trace_id: tuple[str, str]) -> None:
     """Set id of the current trace."""
     trace_id_cv.set(trace_id)
@@ -196,6 +207,15 @@ def trace_clear() -> None:
     script_execution_cv.set(StopReason())
 
 
+def trace_disable() -> None:
+    """Stop recording the trace of the current context."""
+    trace_cv.set(None)
+    trace_stack_cv.set(None)
+    trace_path_stack_cv.set(None)
+    variables_cv.set(None)
+    script_execution_cv.set(StopReason())
+
+
 def trace_set_child_id(child_key: str, child_run_id: str) -> None:
     """Set child trace_id of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
@@ -206,13 +226,15 @@ def trace_set_child_id(child_key: str, child_run_id: str) -> None:
 def trace_set_result(**kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
-    node.set_result(**kwargs)
+    if node:
+        node.set_result(**kwargs)
 
 
 def trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
-    node.update_result(**kwargs)
+    if node:
+        node.update_result(**kwargs)
 
 
 class StopReason:
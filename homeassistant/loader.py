@@ -9,11 +9,13 @@ import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import timedelta
 import functools as ft
 import importlib
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +27,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import Platform, __version__ as HA_VERSION
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -48,6 +51,10 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+# DATA_IMPORT_TIME is a dict [str, timedelta], indicating how much time was
+# spent importing the component and platforms of an integration.
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,6 +68,12 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 10
+
+ENTITY_PLATFORMS = {platform.value for platform in Platform}
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -173,6 +186,72 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+async def async_load_manifest_index(hass: HomeAssistant) -> None:
+    """Load the index of the manifests of the built-in integrations.
+
+    The index is built from the manifest files once per version of Home
+    Assistant, after that the built-in integrations are resolved without
+    reading their manifest files. The index is rebuilt when a manifest file
+    is added, removed or modified.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from . import components
+
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    components_path = components.__path__[0]
+    store = Store[dict[str, Any]](
+        hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+    )
+    data = await store.async_load()
+    manifest_stat = await hass.async_add_executor_job(_stat_manifests, components_path)
+    if (
+        data
+        and data["ha_version"] == HA_VERSION
+        and data["path"] == components_path
+        and data.get("manifest_stat") == manifest_stat
+    ):
+        hass.data[DATA_MANIFEST_INDEX] = data["manifests"]
+        return
+
+    manifests = await hass.async_add_executor_job(
+        _build_manifest_index, components_path
+    )
+    hass.data[DATA_MANIFEST_INDEX] = manifests
+    store.async_delay_save(
+        lambda: {
+            "ha_version": HA_VERSION,
+            "path": components_path,
+            "manifest_stat": manifest_stat,
+            "manifests": manifests,
+        },
+        MANIFEST_INDEX_SAVE_DELAY,
+    )
+
+
+def _stat_manifests(components_path: str) -> list[int]:
+    """Return the number and the latest modification time of the manifests."""
+    mtimes = [
+        manifest_path.stat().st_mtime_ns
+        for manifest_path in pathlib.Path(components_path).glob("*/manifest.json")
+    ]
+    return [len(mtimes), max(mtimes, default=0)]
+
+
+def _build_manifest_index(components_path: str) -> dict[str, Manifest]:
+    """Read the manifests of the integrations in a directory."""
+    manifests: dict[str, Manifest] = {}
+    for manifest_path in pathlib.Path(components_path).glob("*/manifest.json"):
+        try:
+            manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        except JSON_DECODE_EXCEPTIONS:
+            # Reported when the integration is resolved from its manifest file
+            continue
+        manifests[manifest_path.parent.name] = manifest
+    return manifests
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -809,6 +888,7 @@ class Integration:
         if self.domain in cache:
             return cache[self.domain]
 
+        start = time.perf_counter()
         try:
             cache[self.domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -820,6 +900,8 @@ class Integration:
                 "Unexpected exception importing component %s", self.pkg_path
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
+        finally:
+            self._add_import_time(timedelta(seconds=time.perf_counter() - start))
 
         return cache[self.domain]
 
@@ -830,6 +912,7 @@ class Integration:
         if full_name in cache:
             return cache[full_name]
 
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ImportError:
@@ -843,6 +926,8 @@ class Integration:
             raise ImportError(
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
+        finally:
+            self._add_import_time(timedelta(seconds=time.perf_counter() - start))
 
         return cache[full_name]
 
@@ -850,6 +935,40 @@ class Integration:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def warm_import(self) -> timedelta:
+        """Import the component and its entity platforms ahead of the setup.
+
+        Runs in the executor and returns the time spent importing. Import
+        errors are ignored, they are raised again when the integration is
+        set up.
+        """
+        import_time = timedelta()
+        modules = [self.pkg_path]
+        # Mocked integrations in tests have no files
+        with suppress(OSError, AttributeError):
+            modules.extend(
+                f"{self.pkg_path}.{path.stem}"
+                for path in self.file_path.iterdir()
+                if path.suffix == ".py" and path.stem in ENTITY_PLATFORMS
+            )
+        for module in modules:
+            if module in sys.modules:
+                continue
+            start = time.perf_counter()
+            try:
+                importlib.import_module(module)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Unable to warm import %s: %s", module, err)
+                break
+            finally:
+                import_time += timedelta(seconds=time.perf_counter() - start)
+        return import_time
+
+    def _add_import_time(self, import_time: timedelta) -> None:
+        """Add to the import time of the integration."""
+        data: dict[str, timedelta] = self.hass.data.setdefault(DATA_IMPORT_TIME, {})
+        data[self.domain] = data.get(self.domain, timedelta()) + import_time
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -860,7 +979,18 @@ def _resolve_integrations_from_root(
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
+    manifest_index: dict[str, Manifest] | None = None
+    if root_module.__name__ == PACKAGE_BUILTIN:
+        manifest_index = hass.data.get(DATA_MANIFEST_INDEX)
     for domain in domains:
+        if manifest_index and (manifest := manifest_index.get(domain)):
+            integrations[domain] = Integration(
+                hass,
+                f"{PACKAGE_BUILTIN}.{domain}",
+                pathlib.Path(root_module.__path__[0]) / domain,
+                cast(Manifest, dict(manifest)),
+            )
+            continue
         try:
             integration = Integration.resolve_from_root(hass, root_module, domain)
         except Exception:  # pylint: disable=broad-except
@@ -969,6 +1099,30 @@ async def async_get_integrations(
     return results
 
 
+async def async_warm_import_integrations(
+    hass: HomeAssistant, integrations: Iterable[Integration]
+) -> None:
+    """Import integrations in the executor ahead of setting them up.
+
+    The integrations are imported in dependency order, so the setup of
+    an integration finds its modules and the modules of its dependencies
+    imported instead of importing them in the event loop.
+    """
+    ordered = sorted(
+        (itg for itg in integrations if itg.all_dependencies_resolved),
+        key=lambda itg: len(itg.all_dependencies),
+    )
+
+    def _warm_import() -> list[tuple[Integration, timedelta]]:
+        return [(integration, integration.warm_import()) for integration in ordered]
+
+    for integration, import_time in await hass.async_add_executor_job(_warm_import):
+        if import_time:
+            integration._add_import_time(  # pylint: disable=protected-access
+                import_time
+            )
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -6,19 +6,26 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+import gc
 import json
 import logging
+import os
+import resource
+import tempfile
+import threading
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfEnergy
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util.unit_conversion import EnergyConverter
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +234,545 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_filtered_listeners(hass):
+    """Fire 100k state changed events at 5k listeners using event filters."""
+    count = 0
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(5000)]
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def _make_filter(entity_id):
+        @core.callback
+        def event_filter(event):
+            """Filter event."""
+            return event.data["entity_id"] == entity_id
+
+        return event_filter
+
+    for entity_id in entity_ids:
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, listener, event_filter=_make_filter(entity_id)
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(
+            EVENT_STATE_CHANGED, {"entity_id": entity_ids[idx % len(entity_ids)]}
+        )
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_indexed_listeners(hass):
+    """Fire 100k state changed events at 5k listeners indexed by entity_id."""
+    count = 0
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(5000)]
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for entity_id in entity_ids:
+        hass.bus.async_listen_indexed(
+            EVENT_STATE_CHANGED, core.EVENT_INDEX_ENTITY_ID, entity_id, listener
+        )
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(
+            EVENT_STATE_CHANGED, {"entity_id": entity_ids[idx % len(entity_ids)]}
+        )
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+def _reconnect_entities_attributes(idx):
+    """Return realistic attributes for a reconnecting entity."""
+    return {
+        "friendly_name": f"Sensor {idx}",
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+    }
+
+
+def _reconnect_entities_listen(hass, entity_ids):
+    """Listen to the state changes like the recorder and a few automations."""
+    counts = collections.Counter()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        counts["all"] += 1
+
+    @core.callback
+    def event_filter(event):
+        """Filter the events of sensors."""
+        return event.data["entity_id"].startswith("sensor.")
+
+    @core.callback
+    def filtered_listener(_):
+        """Handle filtered event."""
+        counts["filtered"] += 1
+
+    @core.callback
+    def tracked_listener(_):
+        """Handle event of a tracked entity."""
+        counts["tracked"] += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        filtered_listener,
+        event_filter=event_filter,
+        run_immediately=True,
+    )
+    for idx in range(10):
+        async_track_state_change_event(hass, entity_ids[idx::10], tracked_listener)
+
+    return counts
+
+
+@benchmark
+async def reconnect_entities_async_set(hass):
+    """Reconnect 3k entities 10 times with a state write per entity."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(3000)]
+    attributes = [_reconnect_entities_attributes(idx) for idx in range(3000)]
+    counts = _reconnect_entities_listen(hass, entity_ids)
+
+    start = timer()
+
+    for _ in range(10):
+        for state in ("unavailable", "on"):
+            for entity_id, attrs in zip(entity_ids, attributes):
+                hass.states.async_set(entity_id, state, attrs)
+            await hass.async_block_till_done()
+
+    assert set(counts.values()) == {10 * 2 * len(entity_ids)}
+
+    return timer() - start
+
+
+@benchmark
+async def reconnect_entities_async_set_many(hass):
+    """Reconnect 3k entities 10 times with a single batched state write."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(3000)]
+    attributes = [_reconnect_entities_attributes(idx) for idx in range(3000)]
+    counts = _reconnect_entities_listen(hass, entity_ids)
+
+    start = timer()
+
+    for _ in range(10):
+        for state in ("unavailable", "on"):
+            hass.states.async_set_many(
+                [
+                    core.StateWrite(entity_id, state, attrs)
+                    for entity_id, attrs in zip(entity_ids, attributes)
+                ]
+            )
+            await hass.async_block_till_done()
+
+    assert set(counts.values()) == {10 * 2 * len(entity_ids)}
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Report the memory used by 10k entities with realistic attributes."""
+    gc.collect()
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = timer()
+
+    for state in ("1.0", "2.0", "3.0", "4.0", "5.0"):
+        for idx in range(10000):
+            hass.states.async_set(
+                f"sensor.power_{idx}",
+                state,
+                {
+                    "friendly_name": f"Power {idx}",
+                    "unit_of_measurement": "W",
+                    "device_class": "power",
+                    "state_class": "measurement",
+                    "icon": "mdi:flash",
+                    "attribution": "Data provided by benchmark",
+                },
+            )
+        await hass.async_block_till_done()
+
+    runtime = timer() - start
+
+    # ru_maxrss is reported in KiB on Linux
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_start
+    print(f"RSS grew by {rss_growth / 1024:.1f} MiB")
+
+    return runtime
+
+
+async def _recorder_write_events(hass, bulk_insert):
+    """Write 100k events into a SQLite database and report events/sec."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder
+    from homeassistant.helpers import (  # pylint: disable=import-outside-toplevel
+        entity,
+        recorder as recorder_helper,
+    )
+
+    # pylint: disable=protected-access
+    entity.async_setup(hass)
+    recorder_helper.async_initialize_recorder(hass)
+    commit_every = 1000
+    events = []
+    for round_ in range(50):
+        for idx in range(1000):
+            entity_id = f"sensor.power_{idx}"
+            old_state = core.State(entity_id, str(round_ - 1), {"unit": "W"})
+            new_state = core.State(entity_id, str(round_), {"unit": "W"})
+            events.append(
+                core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                )
+            )
+        for idx in range(1000):
+            events.append(core.Event("benchmark_event", {"idx": idx % 10}))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=1,
+            commit_interval=1,
+            uri=f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}",
+            db_max_retries=1,
+            db_retry_wait=1,
+            entity_filter=lambda entity_id: True,
+            exclude_event_types=set(),
+            bulk_insert=bulk_insert,
+            partition_interval=None,
+            statistics_buffer=False,
+            read_db_url=None,
+            read_pool_size=0,
+            read_query_timeout=0,
+            downsampled_history=False,
+        )
+
+        def _write_events():
+            instance._setup_recorder()
+            instance._setup_run()
+            instance.event_type_manager.active = True
+            instance.states_meta_manager.active = True
+            start = timer()
+            for idx, event in enumerate(events, 1):
+                instance._process_one_event(event)
+                if not idx % commit_every:
+                    instance._commit_event_session_or_retry()
+            instance._commit_event_session_or_retry()
+            runtime = timer() - start
+            instance._close_event_session()
+            instance._close_connection()
+            return runtime
+
+        # The recorder pool only hands out connections to the
+        # recorder thread and the database executor
+        instance.async_start_executor()
+        runtime = await instance.async_add_executor_job(_write_events)
+        await hass.async_add_executor_job(instance._stop_executor)
+
+    print(f"Recorded {len(events) / runtime:.0f} events/sec")
+    return runtime
+
+
+@benchmark
+async def recorder_write_events(hass):
+    """Record 100k events with the regular session inserts."""
+    return await _recorder_write_events(hass, False)
+
+
+@benchmark
+async def recorder_write_events_bulk_insert(hass):
+    """Record 100k events with bulk inserts."""
+    return await _recorder_write_events(hass, True)
+
+
+async def _recorder_concurrent_history(hass, read_pool_size):
+    """Run 20 concurrent history queries while events are recorded."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import Recorder, history
+    from homeassistant.components.recorder.const import DATA_INSTANCE
+    from homeassistant.helpers import entity, recorder as recorder_helper
+    import homeassistant.util.dt as dt_util
+
+    # pylint: enable=import-outside-toplevel
+    # pylint: disable=protected-access
+    entity.async_setup(hass)
+    recorder_helper.async_initialize_recorder(hass)
+    history_requests = 20
+    entity_ids = [f"sensor.power_{idx}" for idx in range(100)]
+
+    def _state_changed_events(round_):
+        """Return a state changed event for every entity."""
+        return [
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": core.State(entity_id, str(round_ - 1)),
+                    "new_state": core.State(entity_id, str(round_)),
+                },
+            )
+            for entity_id in entity_ids
+        ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = hass.data[DATA_INSTANCE] = Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=1,
+            commit_interval=1,
+            uri=f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}",
+            db_max_retries=1,
+            db_retry_wait=1,
+            entity_filter=lambda entity_id: True,
+            exclude_event_types=set(),
+            bulk_insert=False,
+            partition_interval=None,
+            statistics_buffer=False,
+            read_db_url=None,
+            read_pool_size=read_pool_size,
+            read_query_timeout=0,
+            downsampled_history=False,
+        )
+
+        def _write_events(recorded, stop):
+            # The event session is bound to the thread that created it
+            instance._setup_recorder()
+            instance._setup_run()
+            instance.event_type_manager.active = True
+            instance.states_meta_manager.active = True
+            round_ = 0
+            while round_ < 100 or not stop.is_set():
+                for event in _state_changed_events(round_):
+                    instance._process_one_event(event)
+                # Commit every 1000 events
+                if not round_ % 10:
+                    instance._commit_event_session_or_retry()
+                if round_ == 100:
+                    recorded.set()
+                round_ += 1
+            instance._commit_event_session_or_retry()
+            instance._close_event_session()
+
+        history_start = dt_util.utcnow()
+        recorded = threading.Event()
+        stop = threading.Event()
+        instance.async_start_executor()
+        writer = instance.async_add_executor_job(_write_events, recorded, stop)
+        await hass.async_add_executor_job(recorded.wait)
+
+        start = timer()
+        await asyncio.gather(
+            *(
+                instance.async_add_executor_job(
+                    history.get_significant_states,
+                    hass,
+                    history_start,
+                    None,
+                    entity_ids,
+                )
+                for _ in range(history_requests)
+            )
+        )
+        runtime = timer() - start
+
+        stop.set()
+        await writer
+        await instance.async_add_executor_job(instance._close_connection)
+        await hass.async_add_executor_job(instance._stop_executor)
+
+    print(f"Answered {history_requests / runtime:.1f} history requests/sec")
+    return runtime
+
+
+@benchmark
+async def recorder_concurrent_history(hass):
+    """Run 20 concurrent history queries while events are recorded."""
+    return await _recorder_concurrent_history(hass, 0)
+
+
+@benchmark
+async def recorder_concurrent_history_read_pool(hass):
+    """Run 20 concurrent history queries on the read pool while recording."""
+    return await _recorder_concurrent_history(hass, 8)
+
+
+@benchmark
+async def subscribe_entities_fanout(hass):
+    """Forward 10k state changes to 50 subscribe_entities subscriptions.
+
+    The changes are fired in rounds of 200, as a second of an install
+    with 200 state changes per second.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+    from homeassistant.components.websocket_api import commands, const
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    hass.data[const.DOMAIN] = {}
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    refresh_token = RefreshToken(
+        user=user,
+        client_id=None,
+        token_type="normal",
+        access_token_expiration=timedelta(minutes=30),
+    )
+    sent = 0
+
+    @core.callback
+    def send_message(_):
+        """Count the sent messages."""
+        nonlocal sent
+        sent += 1
+
+    for idx in range(200):
+        hass.states.async_set(f"sensor.power_{idx}", "0", {"unit": "W"})
+    for msg_id in range(50):
+        connection = ActiveConnection(
+            logging.getLogger(__name__), hass, send_message, user, refresh_token
+        )
+        commands.handle_subscribe_entities(
+            hass, connection, {"id": msg_id, "type": "subscribe_entities"}
+        )
+    sent = 0
+
+    start = timer()
+    for round_ in range(1, 51):
+        for idx in range(200):
+            hass.states.async_set(f"sensor.power_{idx}", str(round_), {"unit": "W"})
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    assert sent == 50 * 200 * 50
+
+    return timer() - start
+
+
+@benchmark
+async def sensor_state_writes(hass):
+    """Write the states of 5k sensors once a second for 10 seconds."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity,
+        entity_registry as er,
+    )
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    entity.async_setup(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    description = SensorEntityDescription(
+        key="power",
+        device_class="power",
+        icon="mdi:flash",
+        native_unit_of_measurement="W",
+        state_class="measurement",
+    )
+    sensors = []
+    for idx in range(5000):
+        sensor = SensorEntity()
+        sensor.entity_description = description
+        sensor._attr_name = f"Power {idx}"  # pylint: disable=protected-access
+        sensor._attr_should_poll = False  # pylint: disable=protected-access
+        sensors.append(sensor)
+    await platform.async_add_entities(sensors)
+
+    start = timer()
+    for second in range(10):
+        for sensor in sensors:
+            sensor._attr_native_value = second  # pylint: disable=protected-access
+            sensor.async_write_ha_state()
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def script_static_service_calls(hass):
+    """Run a script calling a service without templates 50k times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        config_validation as cv,
+        entity_registry as er,
+        script,
+    )
+
+    await er.async_load(hass)
+    calls = 0
+
+    @core.callback
+    def service_handler(call):
+        nonlocal calls
+        calls += 1
+
+    hass.services.async_register("test", "turn_on", service_handler)
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "service": "test.turn_on",
+            "target": {"entity_id": ["light.kitchen", "light.hall"]},
+            "data": {"brightness": 100, "transition": 2},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Benchmark", "script")
+    context = core.Context()
+
+    start = timer()
+    for _ in range(50000):
+        await script_obj.async_run(context=context)
+    await hass.async_block_till_done()
+
+    assert calls == 50000
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -292,6 +838,32 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def unit_conversion(hass):
+    """Convert a million values a value at a time."""
+    values = [float(value) for value in range(10**6)]
+    convert = EnergyConverter.converter_factory_allow_none(
+        UnitOfEnergy.WATT_HOUR, UnitOfEnergy.KILO_WATT_HOUR
+    )
+
+    start = timer()
+    list(map(convert, values))
+    return timer() - start
+
+
+@benchmark
+async def unit_conversion_many(hass):
+    """Convert a million values at once."""
+    values = [float(value) for value in range(10**6)]
+    convert_many = EnergyConverter.converter_factory_many_allow_none(
+        UnitOfEnergy.WATT_HOUR, UnitOfEnergy.KILO_WATT_HOUR
+    )
+
+    start = timer()
+    convert_many(values)
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
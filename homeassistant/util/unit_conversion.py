@@ -1,7 +1,7 @@
 """Typing Helpers for Home Assistant."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -107,6 +107,40 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    def convert_many(
+        cls, values: Iterable[float], from_unit: str | None, to_unit: str | None
+    ) -> list[float]:
+        """Convert a sequence of values from one unit of measurement to another."""
+        return cls.converter_factory_many(from_unit, to_unit)(values)
+
+    @classmethod
+    @lru_cache
+    def converter_factory_many(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float]], list[float]]:
+        """Return a function to convert a sequence of values to another unit.
+
+        Converting a whole column at once avoids a function call per value.
+        """
+        if from_unit == to_unit:
+            return list
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [(val / from_ratio) * to_ratio for val in values]
+
+    @classmethod
+    @lru_cache
+    def converter_factory_many_allow_none(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert a sequence of values which allows None."""
+        if from_unit == to_unit:
+            return list
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [
+            None if val is None else (val / from_ratio) * to_ratio for val in values
+        ]
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -388,6 +422,59 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache(maxsize=8)
+    def converter_factory_many(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float]], list[float]]:
+        """Return a function to convert a sequence of temperatures to another unit."""
+        if from_unit == to_unit:
+            return list
+        in_offset, divisor, factor, out_offset = cls._get_offsets_and_ratios(
+            from_unit, to_unit
+        )
+        return lambda values: [
+            ((val + in_offset) / divisor) * factor + out_offset for val in values
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def converter_factory_many_allow_none(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert a sequence of temperatures which allows None."""
+        if from_unit == to_unit:
+            return list
+        in_offset, divisor, factor, out_offset = cls._get_offsets_and_ratios(
+            from_unit, to_unit
+        )
+        return lambda values: [
+            None if val is None else ((val + in_offset) / divisor) * factor + out_offset
+            for val in values
+        ]
+
+    @classmethod
+    def _get_offsets_and_ratios(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float, float, float]:
+        """Return the offsets and ratios to convert a temperature to another unit.
+
+        A temperature is converted as ((value + in_offset) / divisor) * factor
+        + out_offset, the values are chosen so the result is identical to the
+        result of converter_factory.
+        """
+        # Raise for unknown units
+        cls._converter_factory(from_unit, to_unit)
+        in_offset = -32.0 if from_unit == UnitOfTemperature.FAHRENHEIT else 0.0
+        if from_unit == UnitOfTemperature.KELVIN:
+            in_offset = -273.15
+        divisor = 1.8 if from_unit == UnitOfTemperature.FAHRENHEIT else 1.0
+        factor = 1.8 if to_unit == UnitOfTemperature.FAHRENHEIT else 1.0
+        out_offset = 32.0 if to_unit == UnitOfTemperature.FAHRENHEIT else 0.0
+        if to_unit == UnitOfTemperature.KELVIN:
+            out_offset = 273.15
+        return in_offset, divisor, factor, out_offset
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
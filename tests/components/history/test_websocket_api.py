@@ -4,11 +4,13 @@ from datetime import timedelta
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.websocket_api.live_stream import DATA_LIVE_STREAMS
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -18,6 +20,7 @@ from tests.common import async_fire_time_changed
 from tests.components.recorder.common import (
     async_recorder_block_till_done,
     async_wait_recording_done,
+    do_adhoc_statistics,
 )
 from tests.typing import WebSocketGenerator
 
@@ -171,6 +174,53 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+@pytest.mark.freeze_time("2023-03-01 11:50:00+00:00")
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period returns long periods downsampled."""
+    zero = dt_util.parse_datetime("2023-03-01 10:00:00+00:00")
+    recorder_mock.downsampled_history = True
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for minute in range(120):
+        freezer.move_to(zero + timedelta(minutes=minute, seconds=1))
+        hass.states.async_set("sensor.power", str(minute % 10))
+    await async_wait_recording_done(hass)
+    freezer.move_to(zero + timedelta(hours=2, minutes=6))
+    for bucket in range(24):
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * bucket))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    message = {
+        "type": "history/history_during_period",
+        "start_time": zero.isoformat(),
+        "end_time": (zero + timedelta(hours=2)).isoformat(),
+        "entity_ids": ["sensor.power"],
+        "include_start_time_state": False,
+        "minimal_response": True,
+        "no_attributes": True,
+        "max_points": 2,
+    }
+    await client.send_json({"id": 1, **message})
+    response = await client.receive_json()
+    assert response["success"]
+    assert [
+        (state["s"], state["lu"] - zero.timestamp())
+        for state in response["result"]["sensor.power"]
+    ] == [("0.0", 0), ("9.0", 1800), ("0.0", 3600), ("9.0", 5400)]
+
+    # Attributes are not downsampled
+    await client.send_json({"id": 2, **message, "no_attributes": False})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]) == 120
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -983,6 +1033,117 @@ async def test_history_stream_live(
     }
 
 
+@patch("homeassistant.components.history.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_history_stream_live_shared(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history streams of the same entities share their live stream."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    for msg_id, entity_ids in (
+        (1, ["sensor.one", "sensor.two"]),
+        (2, ["sensor.two", "sensor.one"]),
+    ):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/stream",
+                "entity_ids": entity_ids,
+                "start_time": now.isoformat(),
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["id"] == msg_id
+        assert response["event"]["states"]["sensor.one"][0]["s"] == "on"
+
+    await async_recorder_block_till_done(hass)
+    assert len(hass.data[DATA_LIVE_STREAMS]) == 1
+
+    hass.states.async_set("sensor.one", "off")
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    responses = [await client.receive_json(), await client.receive_json()]
+    assert sorted(responses, key=lambda response: response["id"]) == [
+        {
+            "event": {
+                "states": {
+                    "sensor.one": [
+                        {"lu": sensor_one_last_updated.timestamp(), "s": "off"}
+                    ]
+                }
+            },
+            "id": msg_id,
+            "type": "event",
+        }
+        for msg_id in (1, 2)
+    ]
+
+    for msg_id in (1, 2):
+        await client.send_json(
+            {"id": msg_id + 2, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+    assert not hass.data[DATA_LIVE_STREAMS]
+
+
+async def test_history_stream_historical_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history streams of the same period share the historical query."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api.history,
+        "get_significant_states",
+        wraps=websocket_api.history.get_significant_states,
+    ) as get_significant_states:
+        for msg_id in (1, 2):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "history/stream",
+                    "entity_ids": ["sensor.one"],
+                    "start_time": now.isoformat(),
+                    "end_time": end_time.isoformat(),
+                    "no_attributes": True,
+                    "minimal_response": True,
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            response = await client.receive_json()
+            assert response == {
+                "event": {
+                    "end_time": sensor_one_last_updated.timestamp(),
+                    "start_time": now.timestamp(),
+                    "states": {
+                        "sensor.one": [
+                            {"lu": sensor_one_last_updated.timestamp(), "s": "on"}
+                        ]
+                    },
+                },
+                "id": msg_id,
+                "type": "event",
+            }
+
+    assert get_significant_states.call_count == 1
+
+
 async def test_history_stream_live_minimal_response(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
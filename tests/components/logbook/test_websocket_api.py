@@ -11,10 +11,12 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.websocket_api.const import TYPE_RESULT
+from homeassistant.components.websocket_api.live_stream import DATA_LIVE_STREAMS
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
@@ -295,6 +297,101 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_cached(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events of all entities is answered from the cache."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("light.kitchen", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(
+        EventProcessor,
+        "get_events",
+        autospec=True,
+        side_effect=EventProcessor.get_events,
+    ) as get_events:
+        for msg_id in (1, 2):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "logbook/get_events",
+                    "start_time": now.isoformat(),
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            assert [
+                (entry["entity_id"], entry["state"]) for entry in response["result"]
+            ] == [("light.kitchen", "on")]
+
+        # Events are cached as they are recorded
+        context = core.Context(user_id="b400facee45711eaa9308bfd3d19e474")
+        hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+        await async_wait_recording_done(hass)
+        await client.send_json(
+            {"id": 3, "type": "logbook/get_events", "start_time": now.isoformat()}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"][1] == {
+            "context_user_id": "b400facee45711eaa9308bfd3d19e474",
+            "entity_id": "light.kitchen",
+            "state": "off",
+            "when": hass.states.get("light.kitchen").last_updated.timestamp(),
+        }
+
+    # The cache was only filled in from the database once
+    assert get_events.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"exclude": {"entities": ["light.excluded"]}}],
+)
+async def test_get_events_cached_recorder_excluded(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the cache only has the events the recorder recorded."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    async def _get_entity_ids(msg_id: int) -> list[str | None]:
+        await client.send_json(
+            {"id": msg_id, "type": "logbook/get_events", "start_time": now.isoformat()}
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return [entry.get("entity_id") for entry in response["result"]]
+
+    # Fill in the cache from the database
+    assert await _get_entity_ids(1) == []
+
+    for entity_id in ("light.excluded", "light.kitchen"):
+        hass.states.async_set(entity_id, STATE_OFF)
+        hass.states.async_set(entity_id, STATE_ON)
+    await async_wait_recording_done(hass)
+
+    assert await _get_entity_ids(2) == ["light.kitchen"]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1566,6 +1663,72 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_logbook_stream_shared(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook streams of the same entities share their live stream."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_ON)
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.small"],
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        # The historical events and the events not committed yet
+        for _ in range(2):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            assert msg["id"] == msg_id
+            assert msg["type"] == "event"
+
+    assert len(hass.data[DATA_LIVE_STREAMS]) == 1
+
+    hass.states.async_set("light.small", STATE_OFF)
+    await hass.async_block_till_done()
+    msgs = [
+        await asyncio.wait_for(websocket_client.receive_json(), 2) for _ in range(2)
+    ]
+    assert sorted(msgs, key=lambda msg: msg["id"]) == [
+        {
+            "event": {
+                "events": [{"entity_id": "light.small", "state": "off", "when": ANY}]
+            },
+            "id": msg_id,
+            "type": "event",
+        }
+        for msg_id in (7, 8)
+    ]
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {"id": msg_id + 2, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+
+    assert not hass.data[DATA_LIVE_STREAMS]
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -2399,9 +2562,7 @@ async def test_stream_consumer_stop_processing(
 
     after_ws_created_listeners = hass.bus.async_listeners()
 
-    with patch.object(websocket_api, "MAX_PENDING_LOGBOOK_EVENTS", 5), patch.object(
-        websocket_api, "_async_events_consumer"
-    ):
+    with patch.object(websocket_api, "MAX_PENDING_LOGBOOK_EVENTS", 5):
         await websocket_client.send_json(
             {
                 "id": 7,
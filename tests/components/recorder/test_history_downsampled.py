@@ -0,0 +1,162 @@
+"""Test the downsampled history tiers."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder, get_instance, history
+from homeassistant.components.recorder.db_schema import StatesDownsampled
+from homeassistant.components.recorder.history.downsampled import (
+    TIER_5MINUTE,
+    TIER_HOUR,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done, do_adhoc_statistics
+
+ZERO = datetime(2023, 3, 1, 10, 0, tzinfo=dt_util.UTC)
+ENTITY_IDS = ["sensor.power", "binary_sensor.door", "climate.test"]
+
+
+async def _async_record_history(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, buckets: int
+) -> None:
+    """Record two hours of states and downsample the first buckets."""
+    get_instance(hass).downsampled_history = True
+    freezer.move_to(ZERO - timedelta(minutes=1))
+    hass.states.async_set("sensor.power", "100")
+    hass.states.async_set("binary_sensor.door", "off")
+    hass.states.async_set("climate.test", "heat")
+    for minute in range(120):
+        freezer.move_to(ZERO + timedelta(minutes=minute, seconds=1))
+        hass.states.async_set("sensor.power", str(minute % 10))
+        if minute in (2, 62):
+            hass.states.async_set("binary_sensor.door", "on")
+        elif minute == 3:
+            hass.states.async_set("binary_sensor.door", "off")
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(ZERO + timedelta(hours=2))
+    for bucket in range(buckets):
+        do_adhoc_statistics(hass, start=ZERO + timedelta(minutes=5 * bucket))
+    await async_wait_recording_done(hass)
+
+
+def _states(states: list[dict]) -> list[tuple[str, float]]:
+    """Return the states and the offsets to ZERO in seconds."""
+    return [(state["s"], round(state["lu"] - ZERO.timestamp())) for state in states]
+
+
+@pytest.mark.freeze_time(ZERO - timedelta(hours=1))
+async def test_compile_downsampled_states(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states are downsampled to 5-minute and hourly buckets."""
+    await _async_record_history(hass, freezer, 24)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        buckets = [
+            (bucket.tier, round(bucket.start_ts - ZERO.timestamp()), bucket.state)
+            + (bucket.min, bucket.max)
+            for bucket in session.query(StatesDownsampled).order_by(
+                StatesDownsampled.tier,
+                StatesDownsampled.metadata_id,
+                StatesDownsampled.start_ts,
+            )
+        ]
+
+    # Numeric states keep their range, other states the last state
+    assert buckets[:3] == [
+        (TIER_5MINUTE, 0, "4", 0.0, 4.0),
+        (TIER_5MINUTE, 300, "9", 5.0, 9.0),
+        (TIER_5MINUTE, 600, "4", 0.0, 4.0),
+    ]
+    assert buckets[24:26] == [
+        (TIER_5MINUTE, 0, "off", None, None),
+        (TIER_5MINUTE, 3600, "on", None, None),
+    ]
+    assert buckets[26:] == [
+        (TIER_HOUR, 0, "9", 0.0, 9.0),
+        (TIER_HOUR, 3600, "9", 0.0, 9.0),
+        (TIER_HOUR, 0, "off", None, None),
+        (TIER_HOUR, 3600, "on", None, None),
+    ]
+
+
+@pytest.mark.freeze_time(ZERO - timedelta(hours=1))
+async def test_get_downsampled_states(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the history of long periods is returned from the matching tier."""
+    # The last 5 minutes are not downsampled yet
+    await _async_record_history(hass, freezer, 23)
+    end = ZERO + timedelta(hours=2)
+
+    def _get_downsampled_states(start: datetime, max_points: int):
+        return history.get_downsampled_states(
+            hass, start, end, ENTITY_IDS, True, max_points
+        )
+
+    states = await recorder_mock.async_add_executor_job(
+        _get_downsampled_states, ZERO, 24
+    )
+    power = _states(states["sensor.power"])
+    assert power[:5] == [
+        ("100", 0),
+        ("0.0", 0),
+        ("4.0", 150),
+        ("5.0", 300),
+        ("9.0", 450),
+    ]
+    # The newest states are not downsampled
+    assert len(power) == 1 + 23 * 2 + 5
+    assert power[-5:] == [(str(value), 6601 + value * 60) for value in range(5, 10)]
+    assert _states(states["binary_sensor.door"]) == [("off", 0), ("on", 3600)]
+    # Entities that need their attributes are not downsampled
+    assert [state["s"] for state in states["climate.test"]] == ["heat"]
+
+    states = await recorder_mock.async_add_executor_job(
+        _get_downsampled_states, ZERO, 2
+    )
+    power = _states(states["sensor.power"])
+    assert power[:3] == [("100", 0), ("0.0", 0), ("9.0", 1800)]
+    assert len(power) == 3 + 60
+    assert _states(states["binary_sensor.door"]) == [("off", 0), ("on", 3721)]
+
+    # Short periods are not downsampled
+    assert (
+        await recorder_mock.async_add_executor_job(_get_downsampled_states, ZERO, 200)
+        is None
+    )
+    # Periods before the oldest bucket are not downsampled
+    assert (
+        await recorder_mock.async_add_executor_job(
+            _get_downsampled_states, ZERO - timedelta(minutes=10), 24
+        )
+        is None
+    )
+
+
+@pytest.mark.freeze_time(ZERO - timedelta(hours=1))
+async def test_purge_downsampled_states(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test purging removes the buckets before the purge cutoff."""
+    await _async_record_history(hass, freezer, 24)
+
+    def _purge() -> bool:
+        return purge_old_data(recorder_mock, ZERO + timedelta(hours=1), repack=False)
+
+    assert not await recorder_mock.async_add_executor_job(_purge)
+    assert await recorder_mock.async_add_executor_job(_purge)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert {
+            bucket.start_ts - ZERO.timestamp()
+            for bucket in session.query(StatesDownsampled)
+        } == {3600 + 300 * bucket for bucket in range(12)}
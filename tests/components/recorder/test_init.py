@@ -18,6 +18,7 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -67,6 +68,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -119,6 +121,13 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        bulk_insert=False,
+        partition_interval=None,
+        statistics_buffer=False,
+        read_db_url=None,
+        read_pool_size=0,
+        read_query_timeout=0,
+        downsampled_history=False,
     )
 
 
@@ -270,6 +279,38 @@ async def test_saving_state(recorder_mock: Recorder, hass: HomeAssistant) -> Non
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+@pytest.mark.parametrize(
+    "recorder_config", [{"exclude": {"entities": ["test.excluded"]}}]
+)
+async def test_committed_events_listener(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test listening for the events committed to the database."""
+    committed: list[Event] = []
+
+    @callback
+    def _async_committed_events(events: list[Event]) -> None:
+        committed.extend(events)
+
+    unsub = recorder_mock.async_listen_committed_events(_async_committed_events)
+
+    hass.states.async_set("test.excluded", "on")
+    hass.states.async_set("test.recorder", "on")
+    hass.bus.async_fire("test_event", {"key": "value"})
+    await async_wait_recording_done(hass)
+
+    assert [(event.event_type, event.data.get("entity_id")) for event in committed] == [
+        (EVENT_STATE_CHANGED, "test.recorder"),
+        ("test_event", None),
+    ]
+
+    unsub()
+    committed.clear()
+    hass.states.async_set("test.recorder", "off")
+    await async_wait_recording_done(hass)
+    assert committed == []
+
+
 @pytest.mark.parametrize(
     ("dialect_name", "expected_attributes"),
     (
@@ -1390,6 +1431,107 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+def test_bulk_insert_sets_old_state(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test bulk inserts link old states inside and across commits."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+    assert get_instance(hass).bulk_insert_manager.active
+
+    hass.states.set("test.one", "s1", {"same": "attrs"})
+    hass.states.set("test.two", "s2", {"same": "attrs"})
+    hass.states.set("test.one", "s3", {"same": "attrs"})
+    hass.states.set("test.one", "s4", {"other": "attrs"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "s5", {})
+    hass.states.set("test.two", "s6", {})
+    hass.states.remove("test.one")
+    hass.states.set("test.one", "s7", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.attributes_id,
+                States.state,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 8
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s7"].entity_id == "test.one"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state["s6"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s5"].state_id
+        assert states_by_state["s7"].old_state_id is None
+
+        assert (
+            states_by_state["s1"].attributes_id
+            == states_by_state["s2"].attributes_id
+            == states_by_state["s3"].attributes_id
+        )
+        assert (
+            states_by_state["s4"].attributes_id != states_by_state["s1"].attributes_id
+        )
+
+
+def test_bulk_insert_saving_events(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test bulk inserts save events and share their event data."""
+    hass = hass_recorder({CONF_BULK_INSERT: True})
+    assert get_instance(hass).bulk_insert_manager.active
+
+    for _ in range(5):
+        hass.bus.fire("this_event", {"de": "dupe"})
+    hass.bus.fire("this_event")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        events = list(
+            session.query(Events.data_id, EventData.shared_data)
+            .filter(Events.event_type_id.in_(select_event_type_ids(("this_event",))))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            .order_by(Events.event_id)
+        )
+        assert len(events) == 6
+        assert events[0].shared_data == '{"de":"dupe"}'
+        assert all(event.data_id == events[0].data_id for event in events[:5])
+        assert events[5].data_id is None
+
+
+def test_bulk_insert_not_supported(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test bulk inserts fall back to the session when not supported."""
+    with patch(
+        "sqlalchemy.dialects.sqlite.base.SQLiteDialect"
+        ".insert_executemany_returning_sort_by_parameter_order",
+        False,
+    ):
+        hass = hass_recorder({CONF_BULK_INSERT: True})
+    assert not get_instance(hass).bulk_insert_manager.active
+    assert "Bulk inserts are not supported" in caplog.text
+
+    hass.states.set("test.one", "s1", {})
+    hass.states.set("test.one", "s2", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 2
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
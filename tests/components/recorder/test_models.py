@@ -25,6 +25,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 
 def test_from_event_to_db_event() -> None:
@@ -464,3 +465,35 @@ def test_bytes_to_ulid_or_none(caplog: pytest.LogCaptureFixture) -> None:
     assert bytes_to_ulid_or_none(b"invalid") is None
     assert "invalid" in caplog.text
     assert bytes_to_ulid_or_none(None) is None
+
+
+async def test_lazy_state_json_and_compressed_state() -> None:
+    """Test the JSON and the compressed state of a LazyState."""
+    now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    row = PropertyMock(
+        entity_id="sensor.valid",
+        state="off",
+        attributes='{"shared":true}',
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=now.timestamp(),
+    )
+    lstate = LazyState(
+        row, {}, None, row.entity_id, row.state, row.last_updated_ts, False
+    )
+    assert json_loads(lstate.as_dict_json) == {
+        "attributes": {"shared": True},
+        "entity_id": "sensor.valid",
+        "last_changed": "2021-06-12T03:04:01.000323+00:00",
+        "last_updated": "2021-06-12T03:04:01.000323+00:00",
+        "state": "off",
+    }
+    compressed_state = {
+        "s": "off",
+        "a": {"shared": True},
+        "c": lstate.context.id,
+        "lc": now.timestamp(),
+    }
+    assert lstate.as_compressed_state == compressed_state
+    assert json_loads("{" + lstate.as_compressed_state_json + "}") == {
+        "sensor.valid": compressed_state
+    }
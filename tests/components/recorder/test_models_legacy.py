@@ -6,6 +6,7 @@ import pytest
 
 from homeassistant.components.recorder.models.legacy import LegacyLazyState
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 
 async def test_legacy_lazy_state_prefers_shared_attrs_over_attrs(
@@ -96,3 +97,19 @@ async def test_legacy_lazy_state_handles_same_last_updated_and_last_changed(
         "last_updated": "2020-06-12T03:04:01.000323+00:00",
         "state": "off",
     }
+
+
+async def test_legacy_lazy_state_json_and_compressed_state() -> None:
+    """Test the JSON and the compressed state of a LegacyLazyState."""
+    now = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC)
+    row = PropertyMock(
+        entity_id="sensor.valid",
+        state="off",
+        shared_attrs='{"shared":true}',
+        last_updated_ts=now.timestamp(),
+        last_changed_ts=now.timestamp(),
+    )
+    lstate = LegacyLazyState(row, {}, None)
+    assert json_loads(lstate.as_dict_json)["state"] == "off"
+    assert lstate.as_compressed_state["a"] == {"shared": True}
+    assert lstate.as_compressed_state_json.startswith('"sensor.valid":')
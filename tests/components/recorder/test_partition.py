@@ -0,0 +1,213 @@
+"""Test partitioned states and events tables."""
+from datetime import timedelta
+import time
+from unittest.mock import patch
+
+from sqlalchemy import MetaData
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.schema import CreateTable
+
+from homeassistant.components.recorder import partition
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import (
+    Base,
+    EventData,
+    Events,
+    StateAttributes,
+    States,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_partitioned_table_copy() -> None:
+    """Test the partitioned tables do not have foreign keys."""
+    states = Base.metadata.tables["states"]
+
+    table = partition._partitioned_table_copy(
+        states, MetaData(), SupportedDialect.POSTGRESQL
+    )
+    ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+    assert "PARTITION BY RANGE (state_id)" in ddl
+    assert "FOREIGN KEY" not in ddl
+    assert {index.name for index in table.indexes} == {
+        index.name for index in states.indexes
+    }
+
+    table = partition._partitioned_table_copy(
+        states, MetaData(), SupportedDialect.MYSQL
+    )
+    ddl = str(CreateTable(table).compile(dialect=mysql.dialect()))
+    assert "PARTITION BY" not in ddl
+    assert "FOREIGN KEY" not in ddl
+
+
+def test_partition_name() -> None:
+    """Test partition names are unique per table on PostgreSQL."""
+    assert (
+        partition._partition_name(SupportedDialect.POSTGRESQL, "states", 1, 1001)
+        == "states_p1_1001"
+    )
+    assert (
+        partition._partition_name(SupportedDialect.MYSQL, "states", 1, 1001)
+        == "p1_1001"
+    )
+
+
+async def test_allocate_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test partitions are allocated from the write rate."""
+    await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    now = time.time()
+
+    with session_scope(hass=hass) as session:
+        for state_id in range(1001, 1004):
+            session.add(
+                States(
+                    state_id=state_id,
+                    entity_id="test.partition",
+                    state="on",
+                    last_updated_ts=now - 7200,
+                )
+            )
+
+    partitions = {
+        "states": [partition.Partition("p1001_2001", 1001, 2001)],
+        "events": [],
+    }
+    added: list[tuple[str, int, int]] = []
+
+    with patch.object(
+        partition,
+        "list_partitions",
+        side_effect=lambda session, dialect, table: partitions[table.name],
+    ), patch.object(
+        partition,
+        "_add_partition",
+        side_effect=lambda session, dialect, table, start, end: added.append(
+            (table.name, start, end)
+        ),
+    ), session_scope(hass=hass) as session:
+        partition.allocate_partitions(
+            session, SupportedDialect.MYSQL, timedelta(days=1), now
+        )
+
+    # Too few rows were written to estimate from for the events
+    rows = partition.MIN_PARTITION_ROWS
+    events_rows = partition.DEFAULT_PARTITION_ROWS
+    assert added[:2] == [
+        ("states", 2001, 2001 + rows),
+        ("states", 2001 + rows, 2001 + 2 * rows),
+    ]
+    assert added[2:4] == [
+        ("events", 1, 1 + events_rows),
+        ("events", 1 + events_rows, 1 + 2 * events_rows),
+    ]
+
+
+async def test_purge_drops_expired_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging drops partitions once all their rows are expired."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    instance.use_partitions = True
+
+    now = dt_util.utcnow()
+    old_ts = dt_util.utc_to_timestamp(now - timedelta(days=11))
+    new_ts = dt_util.utc_to_timestamp(now)
+
+    with session_scope(hass=hass) as session:
+        session.add_all(
+            (
+                StateAttributes(attributes_id=1001, shared_attrs="{}", hash=1),
+                StateAttributes(attributes_id=1002, shared_attrs="{}", hash=2),
+                EventData(data_id=1001, shared_data="{}", hash=1),
+                EventData(data_id=1002, shared_data="{}", hash=2),
+            )
+        )
+        session.add_all(
+            States(
+                state_id=state_id,
+                entity_id="test.partition",
+                state="on",
+                last_updated_ts=timestamp,
+                attributes_id=attributes_id,
+                old_state_id=old_state_id,
+            )
+            for state_id, timestamp, attributes_id, old_state_id in (
+                (1001, old_ts, 1001, None),
+                (1002, old_ts, 1002, 1001),
+                (1003, old_ts, 1002, 1002),
+                (1004, new_ts, 1002, 1003),
+            )
+        )
+        session.add_all(
+            Events(event_id=event_id, time_fired_ts=timestamp, data_id=data_id)
+            for event_id, timestamp, data_id in (
+                (1001, old_ts, 1001),
+                (1002, old_ts, 1002),
+                (1003, new_ts, 1002),
+            )
+        )
+
+    partitions = {
+        "states": [
+            partition.Partition("p1001_1004", 1001, 1004),
+            partition.Partition("p1004_2001", 1004, 2001),
+        ],
+        "events": [
+            partition.Partition("p1001_1003", 1001, 1003),
+            partition.Partition("p1003_2001", 1003, 2001),
+        ],
+    }
+
+    def _drop_partition(session, dialect_name, table, expired):
+        """Drop a partition by deleting the rows in it."""
+        session.execute(
+            table.id_column.table.delete().where(
+                table.id_column >= expired.start, table.id_column < expired.end
+            )
+        )
+        partitions[table.name].remove(expired)
+
+    with patch.object(
+        partition,
+        "list_partitions",
+        side_effect=lambda session, dialect, table: list(partitions[table.name]),
+    ), patch.object(partition, "drop_partition", side_effect=_drop_partition):
+        purge_before = now - timedelta(days=4)
+        assert not purge_old_data(instance, purge_before, repack=False)
+        # The partitions of the newest rows are never dropped
+        assert purge_old_data(instance, purge_before, repack=False)
+
+    assert partitions["states"] == [partition.Partition("p1004_2001", 1004, 2001)]
+    assert partitions["events"] == [partition.Partition("p1003_2001", 1003, 2001)]
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States).filter(States.state_id > 1000).all()
+        assert [(state.state_id, state.old_state_id) for state in states] == [
+            (1004, None)
+        ]
+        assert [
+            attributes.attributes_id
+            for attributes in session.query(StateAttributes).filter(
+                StateAttributes.attributes_id > 1000
+            )
+        ] == [1002]
+        assert [
+            event.event_id
+            for event in session.query(Events).filter(Events.event_id > 1000)
+        ] == [1003]
+        assert [
+            data.data_id
+            for data in session.query(EventData).filter(EventData.data_id > 1000)
+        ] == [1002]
@@ -0,0 +1,92 @@
+"""Test the read pool of the recorder."""
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+# Counts forever unless the query is interrupted
+ENDLESS_QUERY = (
+    "WITH RECURSIVE counter(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM counter) "
+    "SELECT count(*) FROM counter"
+)
+
+
+async def test_read_pool(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read-only sessions use the read pool."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # The query timeout is checked by SQLite
+        return
+
+    if recorder_db_url == "sqlite://":
+        # The read pool needs a file database
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: recorder_db_url,
+            recorder.CONF_READ_POOL_SIZE: 2,
+            recorder.CONF_READ_QUERY_TIMEOUT: 1,
+        },
+    )
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    def _get_history():
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance._read_engine
+        return history.get_significant_states(hass, start, entity_ids=["sensor.test"])
+
+    states = await instance.async_add_executor_job(_get_history)
+    assert [state.state for state in states["sensor.test"]] == ["1"]
+
+    def _execute(statement: str) -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            session.execute(text(statement))
+
+    with pytest.raises(OperationalError, match="readonly"):
+        await instance.async_add_executor_job(
+            _execute, "DELETE FROM states WHERE state_id = 1"
+        )
+    with pytest.raises(OperationalError, match="interrupted"):
+        await instance.async_add_executor_job(_execute, ENDLESS_QUERY)
+
+    # Other sessions still use the recorder connection
+    with session_scope(hass=hass) as session:
+        assert session.get_bind() is instance.engine
+
+
+async def test_read_pool_in_memory_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test read-only sessions use the recorder connection without a read pool."""
+    if recorder_db_url != "sqlite://":
+        return
+
+    await async_setup_recorder_instance(
+        hass, {recorder.CONF_READ_POOL_SIZE: 2, recorder.CONF_DB_URL: "sqlite://"}
+    )
+    instance = get_instance(hass)
+    assert "The read pool is not supported" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.get_bind() is instance.engine
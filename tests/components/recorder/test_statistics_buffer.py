@@ -0,0 +1,85 @@
+"""Test the statistics buffer."""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from freezegun import freeze_time
+
+from homeassistant.components.recorder.statistics_buffer import StatisticsBuffer
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+
+def _state(value: str, last_changed: datetime, last_updated: datetime) -> State:
+    """Return a sensor state."""
+    return State(
+        "sensor.test", value, last_changed=last_changed, last_updated=last_updated
+    )
+
+
+def test_get_states() -> None:
+    """Test states are returned once every state since the start is buffered."""
+    statistics_buffer = StatisticsBuffer()
+    zero = dt_util.utcnow()
+    one = zero + timedelta(minutes=5)
+    two = one + timedelta(minutes=5)
+    three = two + timedelta(minutes=5)
+
+    with freeze_time(zero):
+        assert statistics_buffer.get_states("sensor.test", zero, one, False) is None
+    changed = zero + timedelta(minutes=1)
+    first = _state("1", changed, changed)
+    statistics_buffer.add_state("sensor.test", changed, first)
+    # Other entities are not buffered
+    statistics_buffer.add_state("sensor.other", changed, first)
+
+    statistics_buffer.compiled(MagicMock(), MagicMock(), one)
+    assert statistics_buffer.get_states("sensor.test", zero, one, False) is None
+    assert statistics_buffer.get_states("sensor.test", one, two, False) == [first]
+
+    changed = one + timedelta(minutes=1)
+    second = _state("2", changed, changed)
+    statistics_buffer.add_state("sensor.test", changed, second)
+    updated = one + timedelta(minutes=2)
+    attributes_changed = _state("2", changed, updated)
+    statistics_buffer.add_state("sensor.test", updated, attributes_changed)
+    statistics_buffer.add_state("sensor.test", two + timedelta(minutes=1), None)
+
+    assert statistics_buffer.get_states("sensor.test", one, two, False) == [
+        first,
+        second,
+        attributes_changed,
+    ]
+    assert statistics_buffer.get_states("sensor.test", one, two, True) == [
+        first,
+        second,
+    ]
+    assert statistics_buffer.get_states("sensor.test", two, three, True) == [
+        attributes_changed
+    ]
+
+    statistics_buffer.compiled(MagicMock(), MagicMock(), two)
+    assert statistics_buffer.get_states("sensor.test", one, two, False) is None
+    assert statistics_buffer.get_states("sensor.test", two, three, False) == [
+        attributes_changed
+    ]
+
+    # The entity is no longer buffered once it was removed
+    statistics_buffer.compiled(MagicMock(), MagicMock(), three)
+    assert statistics_buffer.get_states("sensor.test", three, three, False) is None
+
+
+def test_reset() -> None:
+    """Test states are no longer returned after a reset."""
+    statistics_buffer = StatisticsBuffer()
+    zero = dt_util.utcnow()
+    one = zero + timedelta(minutes=5)
+
+    with freeze_time(zero):
+        statistics_buffer.get_states("sensor.test", zero, one, False)
+    changed = zero + timedelta(minutes=1)
+    statistics_buffer.add_state("sensor.test", changed, _state("1", changed, changed))
+    statistics_buffer.compiled(MagicMock(), MagicMock(), one)
+    assert statistics_buffer.get_states("sensor.test", one, one, False) is not None
+
+    statistics_buffer.reset()
+    assert statistics_buffer.get_states("sensor.test", one, one, False) is None
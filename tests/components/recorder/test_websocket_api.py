@@ -217,6 +217,66 @@ async def test_statistics_during_period(
     }
 
 
+@pytest.mark.parametrize("period", ["hour", "day"])
+@pytest.mark.parametrize("units", [None, {"energy": "Wh"}])
+async def test_statistics_during_period_columns(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    period: str,
+    units: dict[str, str] | None,
+) -> None:
+    """Test statistics_during_period returns the same data as columns."""
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    last_reset = start - timedelta(days=1)
+    await async_recorder_block_till_done(hass)
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "last_reset": None if hour < 30 else last_reset,
+                "state": hour,
+                "sum": None if hour == 3 else hour * 2,
+            }
+            for hour in range(48)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    message = {
+        "type": "recorder/statistics_during_period",
+        "start_time": (start + timedelta(hours=1)).isoformat(),
+        "statistic_ids": ["test:total_energy"],
+        "period": period,
+        "types": ["change", "last_reset", "state"],
+    }
+    if units:
+        message["units"] = units
+    await client.send_json({"id": 1, **message})
+    response = await client.receive_json()
+    assert response["success"]
+    rows = response["result"]["test:total_energy"]
+    assert len(rows) == (47 if period == "hour" else 2)
+
+    await client.send_json({"id": 2, **message, "columns": True})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "test:total_energy": {key: [row[key] for row in rows] for key in rows[0]}
+    }
+    assert "sum" not in response["result"]["test:total_energy"]
+
+
 @pytest.mark.freeze_time(datetime.datetime(2022, 10, 21, 7, 25, tzinfo=datetime.UTC))
 @pytest.mark.parametrize("offset", (0, 1, 2))
 async def test_statistic_during_period(
@@ -5193,3 +5193,68 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+@pytest.mark.parametrize("statistics_buffer", [False, True])
+def test_compile_statistics_from_buffer(
+    hass_recorder: Callable[..., HomeAssistant], statistics_buffer: bool
+) -> None:
+    """Test compiling statistics from buffered states matches the database."""
+    now = dt_util.utcnow()
+    zero = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    zero += timedelta(minutes=10)
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        hass = hass_recorder({"statistics_buffer": statistics_buffer})
+        setup_component(hass, "sensor", {})
+        wait_recording_done(hass)
+        assert get_instance(hass).statistics_buffer.active == statistics_buffer
+
+        hass.states.set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+        hass.states.set("sensor.static", "5", POWER_SENSOR_ATTRIBUTES)
+        hass.states.set("sensor.energy", "100", ENERGY_SENSOR_ATTRIBUTES)
+        wait_recording_done(hass)
+
+        spy = patch(
+            "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        )
+        for period in range(4):
+            start = zero + timedelta(minutes=5 * period)
+            freezer.move_to(start + timedelta(minutes=1))
+            hass.states.set("sensor.power", str(20 + period), POWER_SENSOR_ATTRIBUTES)
+            freezer.move_to(start + timedelta(minutes=2))
+            # Attribute changes are not significant for mean, min and max
+            hass.states.set(
+                "sensor.power",
+                str(20 + period),
+                {**POWER_SENSOR_ATTRIBUTES, "period": period},
+            )
+            freezer.move_to(start + timedelta(minutes=3))
+            energy = 1 if period == 3 else 105 + 5 * period
+            hass.states.set("sensor.energy", str(energy), ENERGY_SENSOR_ATTRIBUTES)
+            wait_recording_done(hass)
+
+            freezer.move_to(start + timedelta(minutes=5, seconds=10))
+            if period < 2:
+                do_adhoc_statistics(hass, start=start)
+                wait_recording_done(hass)
+                continue
+            # The states were buffered since the first two periods were compiled
+            with spy as history_spy:
+                do_adhoc_statistics(hass, start=start)
+                wait_recording_done(hass)
+            assert history_spy.call_count == (0 if statistics_buffer else 2)
+
+    stats = statistics_during_period(
+        hass, zero + timedelta(minutes=10), period="5minute"
+    )
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.power"]
+    ] == [(pytest.approx(21.8), 21.0, 22.0), (pytest.approx(22.8), 22.0, 23.0)]
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.static"]
+    ] == [(5.0, 5.0, 5.0), (5.0, 5.0, 5.0)]
+    assert [(stat["state"], stat["sum"]) for stat in stats["sensor.energy"]] == [
+        (115.0, 15.0),
+        (1.0, -99.0),
+    ]
@@ -9,13 +9,13 @@ import pytest
 from pytest_unordered import unordered
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import DATA_TRACE, DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
-from tests.common import load_fixture
+from tests.common import async_capture_events, load_fixture
 from tests.typing import WebSocketGenerator
 
 
@@ -38,7 +38,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -53,14 +53,15 @@ async def _setup_automation_or_script(
             configs = {**configs, **script_config}
 
     if stored_traces is not None:
+        trace_config = {**(trace_config or {}), "stored_traces": stored_traces}
+
+    if trace_config is not None:
         if domain == "script":
             for config in configs.values():
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
         else:
             for config in configs:
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
 
     assert await async_setup_component(hass, domain, {domain: configs})
 
@@ -407,9 +408,7 @@ async def test_get_trace(
         )
         response = await client.receive_json()
         assert response["success"]
-        traces[f"{domain}.{item_id}"].append(
-            {"short_dict": trace, "extended_dict": response["result"]}
-        )
+        traces[f"{domain}.{item_id}"].append(response["result"])
 
     # Fake stop
     assert "trace.saved_traces" not in hass_storage
@@ -465,16 +464,15 @@ async def test_restore_traces(
         )
         response = await client.receive_json()
         assert response["success"]
-        traces[f"{domain}.{item_id}"].append(
-            {"short_dict": trace, "extended_dict": response["result"]}
-        )
+        traces[f"{domain}.{item_id}"].append(response["result"])
         contexts[response["result"]["context"]["id"]] = {
             "run_id": trace["run_id"],
             "domain": domain,
             "item_id": trace["item_id"],
         }
 
-    # Check that loaded data is same as the serialized traces
+    # Check that loaded data is same as the serialized traces, migrated to
+    # version 2 which only stores the extended dict
     assert hass_storage["trace.saved_traces"]["data"] == traces
 
     # Check restored contexts
@@ -486,9 +484,17 @@ async def test_restore_traces(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
     await hass.async_block_till_done()
 
-    # Check that saved data is same as the serialized traces
+    # Check that saved data is same as the serialized traces, in the compact format
     assert "trace.saved_traces" in hass_storage
-    assert hass_storage["trace.saved_traces"] == saved_traces
+    assert hass_storage["trace.saved_traces"] == {
+        **saved_traces,
+        "version": 2,
+        "minor_version": 1,
+        "data": {
+            key: [trace["extended_dict"] for trace in key_traces]
+            for key, key_traces in saved_traces["data"].items()
+        },
+    }
 
 
 @pytest.mark.parametrize("domain", ["automation", "script"])
@@ -587,6 +593,166 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_sample_every(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test only every sample_every-th run of a script or automation is traced."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"sample_every": 3}
+    )
+
+    client = await hass_ws_client()
+
+    events = async_capture_events(hass, "some_event")
+    for _ in range(7):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+    assert len(events) == 7
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == 3
+    assert all(trace["script_execution"] == "finished" for trace in sun_traces)
+
+
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+async def test_trace_sample_every_breakpoint(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain, prefix
+) -> None:
+    """Test every run is traced while a breakpoint is set."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"event": "event0"}, {"event": "event1"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"sample_every": 3}
+    )
+
+    client = await hass_ws_client()
+
+    # The first run is traced
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/debug/breakpoint/subscribe"})
+    response = await client.receive_json()
+    assert response["success"]
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/debug/breakpoint/set",
+            "domain": domain,
+            "item_id": "sun",
+            "node": f"{prefix}/1",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    # The second run would not be sampled, but stops at the breakpoint
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    response = await client.receive_json()
+    assert response["event"]["node"] == f"{prefix}/1"
+    run_id = response["event"]["run_id"]
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "trace/debug/continue",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 4, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == 2
+    assert sun_traces[-1]["run_id"] == run_id
+    assert sun_traces[-1]["state"] == "stopped"
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_errors_only(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test only failed runs are traced with errors_only."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config], trace_config={"errors_only": True}
+    )
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == 1
+    assert sun_traces[0]["script_execution"] == "error"
+    assert _find_traces(response["result"], domain, "moon") == []
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_max_stored_size(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test the oldest traces are dropped when exceeding max_stored_size."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"max_stored_size": 1}
+    )
+
+    client = await hass_ws_client()
+
+    for _ in range(3):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    # The newest trace is kept even if it exceeds max_stored_size
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 1
+
+    # The size of the trace was worked out when it finished
+    (trace,) = hass.data[DATA_TRACE][f"{domain}.sun"].values()
+    assert trace.size > 1
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -17,7 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -691,6 +691,56 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+@pytest.mark.parametrize("compress", [0, 15])
+async def test_get_states_streamed(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+    compress: int,
+) -> None:
+    """Test large get_states and subscribe_entities responses are streamed."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    for index in range(100):
+        hass.states.async_set(f"light.test_{index}", "on", {"data": f"{index}" * 2000})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(URL, compress=compress) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        # Messages sent after the streamed messages continue the compression
+        await ws.send_json({"id": 5, "type": "get_states"})
+        await ws.send_json({"id": 6, "type": "subscribe_entities"})
+        await ws.send_json({"id": 7, "type": "get_states"})
+        await ws.send_json({"id": 8, "type": "ping"})
+
+        states = [state.as_dict() for state in hass.states.async_all()]
+        msg = await ws.receive_json()
+        assert msg["id"] == 5
+        assert msg["result"] == states
+
+        msg = await ws.receive_json()
+        assert msg["id"] == 6
+        assert msg["success"]
+        msg = await ws.receive_json()
+        assert msg["id"] == 6
+        assert msg["event"]["a"] == {
+            state.entity_id: state.as_compressed_state
+            for state in hass.states.async_all()
+        }
+
+        msg = await ws.receive_json()
+        assert msg["id"] == 7
+        assert msg["result"] == states
+
+        msg = await ws.receive_json()
+        assert msg["id"] == 8
+        assert msg["type"] == "pong"
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1260,6 +1310,84 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the subscriptions of all connections share a single listener."""
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    hass.states.async_set("light.one", "off")
+    clients = [await hass_ws_client() for _ in range(3)]
+    await clients[0].send_json({"id": 5, "type": "subscribe_entities"})
+    await clients[1].send_json(
+        {"id": 6, "type": "subscribe_entities", "entity_ids": ["light.two"]}
+    )
+    await clients[2].send_json({"id": 7, "type": "subscribe_entities"})
+    for client in clients:
+        assert (await client.receive_json())["success"]
+        assert (await client.receive_json())["type"] == "event"
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    for client, msg_id, entity_ids in (
+        (clients[0], 5, ["light.one", "light.two"]),
+        (clients[1], 6, ["light.two"]),
+        (clients[2], 7, ["light.one", "light.two"]),
+    ):
+        for entity_id in entity_ids:
+            msg = await client.receive_json()
+            assert msg["id"] == msg_id
+            assert entity_id in msg["event"]["c" if entity_id == "light.one" else "a"]
+
+    for client, msg_id in zip(clients, (5, 6, 7)):
+        await client.send_json(
+            {"id": 8, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        assert (await client.receive_json())["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
+async def test_subscribe_entities_merges_pending_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test queued changes of an entity are merged when the client falls behind."""
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_set("light.two", "off")
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    assert (await websocket_client.receive_json())["success"]
+    assert (await websocket_client.receive_json())["type"] == "event"
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.const.MERGE_PENDING_MSG", 0
+    ):
+        hass.states.async_set("light.one", "on", {"color": "red"})
+        hass.states.async_set("light.two", "on")
+        hass.states.async_set("light.one", "on", {"color": "blue"})
+        hass.states.async_remove("light.two")
+        # Merged changes replace the state
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {
+            "a": {
+                "light.one": {
+                    "a": {"color": "blue"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "lu": ANY,
+                    "s": "on",
+                }
+            }
+        }
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"r": ["light.two"]}
+
+        # A change which is not merged is sent as a diff
+        hass.states.async_set("light.one", "off", {"color": "blue"})
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {
+            "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+        }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
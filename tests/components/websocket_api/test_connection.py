@@ -10,6 +10,7 @@ import voluptuous as vol
 
 from homeassistant import exceptions
 from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.connection import SendStats
 from homeassistant.components.websocket_api.const import DOMAIN
 from homeassistant.core import HomeAssistant
 
@@ -131,3 +132,17 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+def test_send_stats() -> None:
+    """Test the statistics of the sent messages."""
+    stats = SendStats()
+    assert stats.average_latency == 0
+
+    stats.record(10.0, [9.0])
+    stats.record(12.0, [10.0, 11.0, 12.0])
+    assert stats.messages == 4
+    assert stats.frames == 2
+    assert stats.average_latency == 1.0
+    assert stats.max_latency == 2.0
+    assert "messages=4 frames=2" in repr(stats)
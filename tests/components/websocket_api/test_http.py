@@ -2,9 +2,11 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.base_protocol import BaseProtocol
+from aiohttp.http_websocket import WebSocketWriter
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -503,3 +505,32 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_aiohttp_supports_fragments(hass: HomeAssistant) -> None:
+    """Test the aiohttp websocket writer has the internals to send fragments.
+
+    This fails once aiohttp is upgraded. Check _async_send_fragment still
+    works with the new version before adding it to _FRAGMENT_AIOHTTP_VERSIONS.
+    """
+    writer = WebSocketWriter(BaseProtocol(hass.loop), Mock(), compress=15)
+    assert http._supports_fragments(writer)
+
+
+async def test_streamed_message_without_fragments(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test streamed messages are sent whole without support for fragments."""
+    for index in range(100):
+        hass.states.async_set(f"light.test_{index}", "on", {"data": f"{index}" * 2000})
+
+    with patch.object(http, "_FRAGMENT_AIOHTTP_VERSIONS", ()), patch.object(
+        http, "_async_send_fragment"
+    ) as mock_send_fragment:
+        websocket_client = await hass_ws_client(hass)
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+    assert not mock_send_fragment.called
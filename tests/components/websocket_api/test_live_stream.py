@@ -0,0 +1,74 @@
+"""Tests for the live streams of websocket subscriptions."""
+import asyncio
+
+import pytest
+
+from homeassistant.components.websocket_api.live_stream import BackfillCache
+from homeassistant.core import HomeAssistant
+
+
+async def test_backfill_cache_shares_running_query(hass: HomeAssistant) -> None:
+    """Test queries wait for the result of the same running query."""
+    cache = BackfillCache[int](hass)
+    release = asyncio.Event()
+    calls = 0
+
+    async def query() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first = hass.async_create_task(cache.async_get("key", query))
+    second = hass.async_create_task(cache.async_get("key", query))
+    await asyncio.sleep(0)
+    release.set()
+    assert await first == 1
+    assert await second == 1
+    assert await cache.async_get("key", query) == 1
+    assert calls == 1
+
+
+async def test_backfill_cache_query_error(hass: HomeAssistant) -> None:
+    """Test waiting queries get the error of the running query."""
+    cache = BackfillCache[int](hass)
+    release = asyncio.Event()
+
+    async def query() -> int:
+        await release.wait()
+        raise ValueError("Boom")
+
+    first = hass.async_create_task(cache.async_get("key", query))
+    second = hass.async_create_task(cache.async_get("key", query))
+    await asyncio.sleep(0)
+    release.set()
+    with pytest.raises(ValueError):
+        await first
+    with pytest.raises(ValueError):
+        await second
+
+
+async def test_backfill_cache_query_cancelled(hass: HomeAssistant) -> None:
+    """Test waiting queries run the query again when the running one is cancelled."""
+    cache = BackfillCache[int](hass)
+    release = asyncio.Event()
+    calls = 0
+
+    async def query() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first = hass.async_create_task(cache.async_get("key", query))
+    second = hass.async_create_task(cache.async_get("key", query))
+    third = hass.async_create_task(cache.async_get("key", query))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == 2
+    assert await third == 2
+    assert calls == 2
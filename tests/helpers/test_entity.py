@@ -11,17 +11,27 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import pytest
 import voluptuous as vol
 
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    UnitOfTemperature,
+)
+from homeassistant.core import Context, HomeAssistant, HomeAssistantError, callback
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    significant_change,
 )
-from homeassistant.core import Context, HomeAssistant, HomeAssistantError
-from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
@@ -29,8 +39,11 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_integration,
+    mock_platform,
     mock_registry,
 )
 
@@ -1657,3 +1670,206 @@ async def test_change_entity_id(
     assert len(result) == 2
     assert len(ent.added_calls) == 3
     assert len(ent.remove_calls) == 2
+
+
+async def test_static_attributes_cached(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the attributes which do not change between state writes are cached."""
+    icon_calls = []
+
+    class StaticIconEntity(entity.Entity):
+        _static_attribute_properties = frozenset({"icon"})
+
+        @property
+        def icon(self) -> str | None:
+            icon_calls.append(None)
+            return self._attr_icon
+
+    class DynamicIconEntity(StaticIconEntity):
+        @property
+        def icon(self) -> str | None:
+            icon_calls.append(None)
+            return f"mdi:numeric-{self._attr_state}"
+
+    entry = entity_registry.async_get_or_create("test", "test", "1234")
+    platform = MockEntityPlatform(hass, domain="test", platform_name="test")
+    ent = StaticIconEntity()
+    ent._attr_unique_id = "1234"
+    ent._attr_icon = "mdi:one"
+    ent._attr_name = "One"
+    await platform.async_add_entities([ent])
+    icon_calls.clear()
+
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert len(icon_calls) == 0
+    state = hass.states.get(entry.entity_id)
+    assert state.state == "on"
+    assert state.attributes == {"friendly_name": "One", "icon": "mdi:one"}
+
+    # Changing an input of the cached attributes recalculates them
+    ent._attr_icon = "mdi:two"
+    ent.async_write_ha_state()
+    assert len(icon_calls) == 1
+    assert hass.states.get(entry.entity_id).attributes["icon"] == "mdi:two"
+
+    # Updating the entity registry entry recalculates them
+    entity_registry.async_update_entity(entry.entity_id, name="Renamed")
+    await hass.async_block_till_done()
+    assert len(icon_calls) == 2
+    state = hass.states.get(entry.entity_id)
+    assert state.attributes == {"friendly_name": "Renamed", "icon": "mdi:two"}
+
+    # The overriding property is called on every state write
+    icon_calls.clear()
+    ent = DynamicIconEntity()
+    ent.entity_id = "test.dynamic"
+    ent._attr_state = 1
+    await platform.async_add_entities([ent])
+    icon_calls.clear()
+    ent._attr_state = 2
+    ent.async_write_ha_state()
+    ent.async_write_ha_state()
+    assert len(icon_calls) == 2
+    assert hass.states.get("test.dynamic").attributes["icon"] == "mdi:numeric-2"
+
+
+async def test_min_state_write_interval(hass: HomeAssistant) -> None:
+    """Test state writes within the min_state_write_interval are coalesced."""
+    platform = MockEntityPlatform(hass, domain="test", platform_name="test")
+    ent = entity.Entity()
+    ent.entity_id = "test.power"
+    ent._attr_min_state_write_interval = timedelta(seconds=10)
+    ent._attr_state = 100
+    await platform.async_add_entities([ent])
+    assert hass.states.get("test.power").state == "100"
+
+    @callback
+    def async_check_significant_change(
+        hass: HomeAssistant, old_state: str, old_attrs, new_state: str, new_attrs
+    ) -> bool | None:
+        if abs(float(new_state) - float(old_state)) >= 50:
+            return True
+        return None
+
+    functions = hass.data[significant_change.DATA_FUNCTIONS]
+    functions["test"] = async_check_significant_change
+
+    # The last state write within the interval wins
+    for state in (101, 102, 103):
+        ent._attr_state = state
+        ent.async_write_ha_state()
+    assert hass.states.get("test.power").state == "100"
+    assert ent.state_writes_suppressed == 2
+    assert platform.state_writes_suppressed == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass.states.get("test.power").state == "103"
+
+    # A significant change is written right away and drops the delayed state
+    ent._attr_state = 104
+    ent.async_write_ha_state()
+    ent._attr_state = 160
+    ent.async_write_ha_state()
+    assert hass.states.get("test.power").state == "160"
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass.states.get("test.power").state == "160"
+
+    # Changes are compared against the written state
+    ent._attr_state = 120
+    platform.async_write_ha_states([ent])
+    assert hass.states.get("test.power").state == "160"
+
+    # A delayed state write is dropped when the entity is removed
+    await ent.async_remove()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass.states.get("test.power") is None
+
+
+@pytest.fixture
+async def temperature_sensor(hass: HomeAssistant) -> SensorEntity:
+    """Set up a temperature sensor platform with a min state write interval."""
+    ent = SensorEntity()
+    ent.entity_id = "sensor.temperature"
+    ent._attr_device_class = SensorDeviceClass.TEMPERATURE
+    ent._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    ent._attr_native_value = 20.0
+
+    async def async_setup_platform(hass, config, async_add_entities, *args):
+        async_add_entities([ent])
+
+    platform = MockPlatform(async_setup_platform=async_setup_platform)
+    platform.MIN_STATE_WRITE_INTERVAL = timedelta(seconds=10)
+    mock_platform(hass, "test.sensor", platform)
+    assert await async_setup_component(hass, "sensor", {"sensor": {"platform": "test"}})
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "20.0"
+    return ent
+
+
+async def test_min_state_write_interval_coalesced(
+    hass: HomeAssistant, temperature_sensor: SensorEntity
+) -> None:
+    """Test insignificant state writes are coalesced into one state write."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for value in (20.1, 20.2, 20.3):
+        temperature_sensor._attr_native_value = value
+        temperature_sensor.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "20.0"
+    assert temperature_sensor.state_writes_suppressed == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "20.3"
+    assert [event.data["new_state"].state for event in events] == ["20.3"]
+
+
+async def test_min_state_write_interval_significant_change(
+    hass: HomeAssistant, temperature_sensor: SensorEntity
+) -> None:
+    """Test a significant change is written right away."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    temperature_sensor._attr_native_value = 20.1
+    temperature_sensor.async_write_ha_state()
+    # Significant compared to the written state, not to the delayed state
+    temperature_sensor._attr_native_value = 20.5
+    temperature_sensor.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == "20.5"
+
+    # The delayed state write was dropped
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in events] == ["20.5"]
+
+    # The entity turning unavailable is significant
+    temperature_sensor._attr_available = False
+    temperature_sensor.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.temperature").state == STATE_UNAVAILABLE
+
+
+async def test_min_state_write_interval_cancelled_on_remove(
+    hass: HomeAssistant, temperature_sensor: SensorEntity
+) -> None:
+    """Test the delayed state write is cancelled when the entity is removed."""
+    temperature_sensor._attr_native_value = 20.1
+    temperature_sensor.async_write_ha_state()
+    assert temperature_sensor._pending_state_write_handle is not None
+
+    await temperature_sensor.async_remove()
+    assert temperature_sensor._pending_state_write_handle is None
+    assert hass.states.get("sensor.temperature") is None
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert events == []
+    assert hass.states.get("sensor.temperature") is None
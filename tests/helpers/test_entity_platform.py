@@ -3,12 +3,18 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import threading
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import (
     CoreState,
     HomeAssistant,
@@ -42,6 +48,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_platform,
     mock_registry,
@@ -125,6 +132,148 @@ async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> N
     assert len(update_err) == 1
 
 
+async def test_polling_backs_off_failing_entities(hass: HomeAssistant) -> None:
+    """Test entities which repeatedly fail to update skip polls."""
+    ent_platform = MockEntityPlatform(hass)
+
+    updates = []
+
+    class PollEntity(MockEntity):
+        """Mock entity which polls."""
+
+        async def async_update(self) -> None:
+            updates.append(self.entity_id)
+
+    ok_ent = PollEntity(should_poll=True)
+    failing_ent = PollEntity(should_poll=True, available=False)
+    await ent_platform.async_add_entities([ok_ent, failing_ent])
+
+    for _ in range(entity_platform.POLL_BACKOFF_THRESHOLD):
+        await ent_platform._update_entity_states(dt_util.utcnow())
+    assert updates.count(ok_ent.entity_id) == entity_platform.POLL_BACKOFF_THRESHOLD
+    assert (
+        updates.count(failing_ent.entity_id) == entity_platform.POLL_BACKOFF_THRESHOLD
+    )
+
+    # The failing entity skips one poll, and two polls after the next failure
+    updates.clear()
+    for _ in range(4):
+        await ent_platform._update_entity_states(dt_util.utcnow())
+    assert updates.count(ok_ent.entity_id) == 4
+    assert updates.count(failing_ent.entity_id) == 1
+
+    stats = ent_platform.poll_stats[failing_ent.entity_id].as_dict()
+    assert stats["polls"] == entity_platform.POLL_BACKOFF_THRESHOLD + 1
+    assert stats["failed_polls"] == entity_platform.POLL_BACKOFF_THRESHOLD + 1
+    assert stats["skipped_polls"] == 3
+    assert stats["backoff"] == 0
+
+    # The entity is polled again on every poll once it updates successfully
+    failing_ent._values["available"] = True
+    updates.clear()
+    for _ in range(3):
+        await ent_platform._update_entity_states(dt_util.utcnow())
+    assert updates.count(failing_ent.entity_id) == 3
+
+
+async def test_polling_records_poll_stats(hass: HomeAssistant) -> None:
+    """Test the poll durations of entities are recorded per config entry."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    ent_platform = MockEntityPlatform(hass)
+    ent_platform.config_entry = config_entry
+
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.update = Mock()
+    no_poll_ent = MockEntity(should_poll=False)
+    await ent_platform.async_add_entities([poll_ent, no_poll_ent])
+
+    await ent_platform._update_entity_states(dt_util.utcnow())
+    await ent_platform._update_entity_states(dt_util.utcnow())
+    assert len(poll_ent.update.mock_calls) == 2
+
+    assert entity_platform.async_get_entity_poll_stats(hass, config_entry.entry_id) == {
+        poll_ent.entity_id: {
+            "polls": 2,
+            "failed_polls": 0,
+            "skipped_polls": 0,
+            "backoff": 0,
+            "max_duration": ANY,
+            "duration_histogram": {
+                "0.1": 2,
+                "0.5": 0,
+                "1": 0,
+                "2.5": 0,
+                "5": 0,
+                "10": 0,
+                "30": 0,
+                "+Inf": 0,
+            },
+        }
+    }
+    assert entity_platform.async_get_entity_poll_stats(hass, "other_entry") == {}
+
+    await ent_platform.async_remove_entity(poll_ent.entity_id)
+    assert ent_platform.poll_stats == {}
+
+
+async def test_polling_executor_budget(hass: HomeAssistant) -> None:
+    """Test the executor budget is only taken by running updates."""
+    platform = MockPlatform()
+    platform.PARALLEL_UPDATES = 1
+    ent_platform = MockEntityPlatform(hass, platform=platform)
+    started = threading.Event()
+    release = threading.Event()
+
+    class SyncEntity(MockEntity):
+        """Mock entity with a sync update."""
+
+        def update(self) -> None:
+            started.set()
+            release.wait(5)
+
+    first_ent = SyncEntity(should_poll=True)
+    second_ent = SyncEntity(should_poll=True)
+    await ent_platform.async_add_entities([first_ent, second_ent])
+    assert first_ent.executor_budget is second_ent.executor_budget
+    executor_budget = first_ent.executor_budget
+
+    polls = asyncio.gather(
+        ent_platform._async_poll_entity(first_ent),
+        ent_platform._async_poll_entity(second_ent),
+    )
+    await hass.async_add_executor_job(started.wait, 5)
+    # The second entity waits for the platform without taking the budget
+    await asyncio.sleep(0.2)
+    assert executor_budget._value == entity_platform.POLL_EXECUTOR_BUDGET - 1
+    release.set()
+    await polls
+    assert executor_budget._value == entity_platform.POLL_EXECUTOR_BUDGET
+
+    # Waiting for the platform is not part of the poll duration
+    stats = ent_platform.poll_stats[second_ent.entity_id].as_dict()
+    assert stats["duration_histogram"]["0.1"] == 1
+
+
+def test_poll_scheduler_allocates_slots() -> None:
+    """Test polls are moved to the next poll slot which is not full."""
+    scheduler = entity_platform.EntityPollScheduler()
+    capacity = entity_platform.POLL_SLOT_CAPACITY
+
+    assert scheduler.async_reserve_slot(100.5, capacity - 1) == 0
+    assert scheduler.async_reserve_slot(100.5, 1) == 0
+
+    # The slot is full, the poll is moved to a random time in the next slot
+    delay = scheduler.async_reserve_slot(100.5, 1)
+    assert 0.5 <= delay <= 1.5
+    # A platform with more updates than fit a slot gets a slot of its own
+    delay = scheduler.async_reserve_slot(100.5, capacity + 1)
+    assert 1.5 <= delay <= 2.5
+
+    # Past slots are released
+    assert scheduler.async_reserve_slot(103, capacity) == 0
+
+
 async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -560,6 +709,40 @@ async def test_async_remove_with_platform(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_async_write_ha_states(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test writing the states of multiple entities at once."""
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(name="test_1", unique_id="1")
+    entity2 = MockEntity(name="test_2", unique_id="2")
+    entity3 = MockEntity(name="test_3", unique_id="3")
+    await platform.async_add_entities([entity1, entity2, entity3])
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    entity1._values["state"] = "on"
+    entity2._values["state"] = "x" * 256
+    entity3._values["state"] = "off"
+
+    platform.async_write_ha_states()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity1.entity_id).state == "on"
+    assert hass.states.get(entity2.entity_id).state == STATE_UNKNOWN
+    assert hass.states.get(entity3.entity_id).state == "off"
+    assert len(events) == 3
+    # The states are written in a single batch
+    assert len({event.time_fired for event in events}) == 1
+    assert f"Failed to set state for {entity2.entity_id}" in caplog.text
+
+    entity1._values["state"] = "off"
+    platform.async_write_ha_states([entity1])
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity1.entity_id).state == "off"
+    assert len(events) == 4
+
+
 async def test_async_remove_with_platform_update_finishes(hass: HomeAssistant) -> None:
     """Remove an entity when an update finishes after its been removed."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
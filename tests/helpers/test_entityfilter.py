@@ -3,6 +3,8 @@ from homeassistant.helpers.entityfilter import (
     FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA,
     EntityFilter,
+    EntityFilterCase,
+    entity_filter_case,
     generate_filter,
 )
 
@@ -478,3 +480,42 @@ def test_complex_include_exclude_filter() -> None:
     }
     filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt("switch.espresso_keuken") is True
+
+
+def test_entity_filter_case() -> None:
+    """Test the case of a filter is determined from its configuration."""
+    assert entity_filter_case([], [], [], [], [], []) is EntityFilterCase.ALL
+    assert (
+        entity_filter_case(["light"], ["switch.a"], [], [], ["fan.*"], [])
+        is EntityFilterCase.INCLUDE
+    )
+    assert (
+        entity_filter_case([], [], ["light"], ["switch.a"], [], ["fan.*"])
+        is EntityFilterCase.EXCLUDE
+    )
+    assert (
+        entity_filter_case([], [], [], ["switch.a"], ["fan.*"], [])
+        is EntityFilterCase.DOMAIN_OR_GLOB_INCLUDE
+    )
+    assert (
+        entity_filter_case([], ["switch.a"], ["light"], [], [], [])
+        is EntityFilterCase.DOMAIN_OR_GLOB_EXCLUDE
+    )
+    assert (
+        entity_filter_case([], ["switch.a"], [], ["switch.b"], [], [])
+        is EntityFilterCase.ENTITIES_INCLUDE
+    )
+
+
+def test_filter_decisions_cached() -> None:
+    """Test the decisions of a filter are cached per entity_id."""
+    testfilter = generate_filter(
+        [], ["light.included"], ["light"], [], exclude_entity_globs=["switch.*"]
+    )
+
+    for _ in range(2):
+        assert testfilter("light.included")
+        assert not testfilter("light.excluded")
+        assert not testfilter("switch.excluded")
+        assert testfilter("sensor.included")
+    assert testfilter.cache_info().hits == 4
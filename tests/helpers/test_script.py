@@ -1,6 +1,7 @@
 """The tests for the Script component."""
 import asyncio
 from contextlib import contextmanager
+from copy import deepcopy
 from datetime import timedelta
 from functools import reduce
 import logging
@@ -36,6 +37,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -5367,3 +5369,93 @@ async def test_condition_not_shorthand(
             "2": [{"result": {"event": "test_event", "event_data": {}}}],
         }
     )
+
+
+async def test_static_service_params_prepared_once(hass: HomeAssistant) -> None:
+    """Test the params of a service call without templates are prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "service": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world"},
+            },
+            {"service": "test.script", "data": {"hello": "{{ name }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        await script_obj.async_run(MappingProxyType({"name": "one"}), Context())
+        await script_obj.async_run(MappingProxyType({"name": "two"}), Context())
+        await hass.async_block_till_done()
+
+    assert mock_prepare.call_count == 3
+    assert [call.data for call in calls] == [
+        {"hello": "world", "entity_id": ["light.kitchen"]},
+        {"hello": "one"},
+        {"hello": "world", "entity_id": ["light.kitchen"]},
+        {"hello": "two"},
+    ]
+
+
+async def test_static_service_params_not_shared(hass: HomeAssistant) -> None:
+    """Test a service call modifying its data does not affect later runs."""
+    calls = []
+
+    @callback
+    def mock_service(call: ServiceCall) -> None:
+        calls.append(deepcopy(dict(call.data)))
+        call.data["items"].append("modified")
+        call.data["nested"]["key"] = "modified"
+
+    hass.services.async_register("test", "script", mock_service)
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "service": "test.script",
+            "data": {"items": ["one"], "nested": {"key": "value"}},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert calls == [
+        {"items": ["one"], "nested": {"key": "value"}},
+        {"items": ["one"], "nested": {"key": "value"}},
+    ]
+
+
+async def test_script_run_without_trace(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a script run outside of a trace does not record a trace."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": "test_event"},
+            {
+                "alias": "state condition",
+                "condition": "state",
+                "entity_id": "test.entity",
+                "state": "hello",
+            },
+            {"event": "test_event"},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    hass.states.async_set("test.entity", "hello")
+
+    trace.trace_cv.set(None)
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert "Test condition state condition: True" in caplog.text
+    assert len(events) == 2
+    assert trace.trace_cv.get() is None
@@ -18,6 +18,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
+from homeassistant.util.json import json_loads, load_json
 
 from tests.common import async_fire_time_changed, async_test_home_assistant
 
@@ -733,3 +734,239 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_storage_snapshot(tmpdir: py.path.local) -> None:
+    """Test stores are loaded from the snapshot taken on shutdown."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+
+    async def _async_start() -> HomeAssistant:
+        hass = await async_test_home_assistant(loop)
+        hass.config.config_dir = config_dir
+        await storage.async_load_snapshot(hass, [MOCK_KEY])
+        return hass
+
+    hass = await _async_start()
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_save(MOCK_DATA)
+    await hass.async_stop(force=True)
+    assert os.path.exists(os.path.join(config_dir, ".storage", storage.SNAPSHOT_FILE))
+
+    hass = await _async_start()
+    with patch("homeassistant.helpers.storage.json_util.load_json") as mock_load_json:
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == MOCK_DATA
+        )
+    assert not mock_load_json.called
+    await hass.async_stop(force=True)
+
+    # The snapshot is not used once the file of a store changed
+    hass = await _async_start()
+    await hass.async_add_executor_job(
+        storage.Store(hass, MOCK_VERSION, MOCK_KEY)._write_data,
+        os.path.join(config_dir, ".storage", MOCK_KEY),
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": MOCK_DATA2},
+    )
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == MOCK_DATA2
+    await hass.async_stop(force=True)
+
+
+async def test_journal(tmpdir: py.path.local, caplog: pytest.LogCaptureFixture) -> None:
+    """Test stores with a journal append changes and replay them on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = config_dir
+
+    def _load(store: storage.Store) -> Any:
+        return hass.async_add_executor_job(store._load_data)
+
+    data = {"items": [{"id": str(index), "name": "x" * 100} for index in range(20)]}
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save(data)
+    file_size = os.path.getsize(store.path)
+    assert store.bytes_written == file_size
+    assert not os.path.exists(store.journal_path)
+
+    # Changes are appended to the journal
+    data["items"][1]["name"] = "renamed"
+    del data["items"][5:]
+    data["items"].append({"id": "new"})
+    data["extra"] = True
+    await store.async_save(data)
+    assert os.path.getsize(store.path) == file_size
+    journal_size = os.path.getsize(store.journal_path)
+    assert store.bytes_written == file_size + journal_size
+
+    # Saving unchanged data writes nothing
+    await store.async_save(data)
+    assert store.bytes_written == file_size + journal_size
+
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+
+    # An incomplete record is ignored
+    with open(store.journal_path, "ab") as fdesc:
+        fdesc.write(b'[["s",["data","extra"],fal')
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+    assert "Ignoring the rest of the journal" in caplog.text
+
+    # The journal is compacted into the file once it grew too large
+    data["items"] = [{"id": "replaced", "name": "y" * 5000}]
+    await store.async_save(data)
+    assert not os.path.exists(store.journal_path)
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+
+    # The file holds only the data of the store
+    file_data = await hass.async_add_executor_job(load_json, store.path)
+    assert file_data == {
+        "version": MOCK_VERSION,
+        "minor_version": 1,
+        "key": MOCK_KEY,
+        "data": data,
+    }
+
+    await store.async_remove()
+    assert not os.path.exists(store.path)
+    await hass.async_stop(force=True)
+
+
+async def test_journal_interrupted_compaction(tmpdir: py.path.local) -> None:
+    """Test a journal left behind by an interrupted compaction is not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = config_dir
+
+    def _load(store: storage.Store) -> Any:
+        return hass.async_add_executor_job(store._load_data)
+
+    data = {"x": 0, "l": [1, 2, 3], "padding": "x" * 1000}
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save(data)
+
+    # Journal records which set x and l
+    data["x"] = 1
+    await store.async_save(data)
+    data["l"] = [1, 3]
+    await store.async_save(data)
+    with open(store.journal_path, "rb") as fdesc:
+        journal = fdesc.read()
+
+    # Crash between rewriting the file and removing the journal
+    data["x"] = 2
+    data["l"] = [1, 3, 4]
+    data["padding"] = "y" * 5000
+    with patch("homeassistant.helpers.storage.os.unlink"):
+        await store.async_save(data)
+    with open(store.journal_path, "wb") as fdesc:
+        fdesc.write(journal)
+
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+
+    # The stale journal is replaced once the store writes again
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_load()
+    data["x"] = 3
+    await store.async_save(data)
+    assert not os.path.exists(store.journal_path)
+    data["x"] = 4
+    await store.async_save(data)
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+
+    await store.async_remove()
+    assert not os.path.exists(store.path)
+    await hass.async_stop(force=True)
+
+
+async def test_journal_types_and_ids(tmpdir: py.path.local) -> None:
+    """Test changes of the type of a value and of lists of items with ids."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = config_dir
+
+    def _load(store: storage.Store) -> Any:
+        return hass.async_add_executor_job(store._load_data)
+
+    def _journal() -> list[Any]:
+        with open(store.journal_path, "rb") as fdesc:
+            return [json_loads(record) for record in fdesc.read().splitlines()]
+
+    data = {
+        "flag": True,
+        "flags": [True, False],
+        "items": [{"id": str(index), "name": "x" * 100} for index in range(50)],
+    }
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save(data)
+
+    # True and 1 are not the same value
+    data["flag"] = 1
+    await store.async_save(data)
+    assert _journal()[1:] == [[["s", ["data", "flag"], 1]]]
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert not isinstance(loaded["data"]["flag"], bool)
+
+    # Items of a list with ids are diffed by id, removing the first item
+    # does not change the others
+    del data["items"][0]
+    data["items"][10]["name"] = "renamed"
+    data["items"].append({"id": "new"})
+    await store.async_save(data)
+    assert _journal()[2:] == [
+        [
+            ["d", ["data", "items", {"id": "0"}]],
+            ["s", ["data", "items", {"id": "11"}, "name"], "renamed"],
+            ["s", ["data", "items", {"id": "new"}], {"id": "new"}],
+        ]
+    ]
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+
+    # Lists without ids are set as a whole, also if they only compare equal
+    data["flags"] = [1, False]
+    await store.async_save(data)
+    assert _journal()[3:] == [[["s", ["data", "flags"], [1, False]]]]
+    loaded = await _load(storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True))
+    assert loaded["data"] == data
+    assert not isinstance(loaded["data"]["flags"][0], bool)
+
+    await store.async_remove()
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compaction_unchanged_data(tmpdir: py.path.local) -> None:
+    """Test a compaction to the data of the file only removes the journal."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = config_dir
+
+    data = {"x": 0, "padding": "x" * 100}
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save(data)
+    data["x"] = 1
+    await store.async_save(data)
+    assert os.path.exists(store.journal_path)
+
+    # Reload the store, the first save after a load compacts the journal
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert (await store.async_load())["x"] == 1
+    data["x"] = 0
+    with patch("homeassistant.helpers.storage.json_helper.save_json") as save_json:
+        await store.async_save(data)
+    # The file was not rewritten, a journal left behind would be replayed
+    assert not save_json.called
+    assert not os.path.exists(store.journal_path)
+    loaded = await hass.async_add_executor_job(
+        storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)._load_data
+    )
+    assert loaded["data"] == data
+
+    await store.async_remove()
+    await hass.async_stop(force=True)
@@ -20,6 +20,8 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     VOLUME_LITERS,
@@ -4790,3 +4792,51 @@ async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     assert template.CACHED_TEMPLATE_NO_COLLECT_LRU.get_size() == int(
         round(mock_entity_count * template.ENTITY_COUNT_GROWTH_FACTOR)
     )
+
+
+async def test_compiled_template_cache(hass: HomeAssistant, tmp_path) -> None:
+    """Test compiled templates are kept between restarts."""
+    hass.config.config_dir = str(tmp_path)
+
+    async def _async_restart() -> template.CompiledTemplateCache:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        for key in (
+            "template.compiled_template_cache",
+            "template.environment",
+        ):
+            hass.data.pop(key, None)
+        await template.async_load_compiled_template_cache(hass)
+        return hass.data["template.compiled_template_cache"]
+
+    await _async_restart()
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert template.compiled_template_cache_stats(hass) == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+    }
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert (tmp_path / ".storage" / template.COMPILED_TEMPLATE_CACHE_FILE).exists()
+
+    cache = await _async_restart()
+    assert len(cache) == 1
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache = await _async_restart()
+    assert len(cache) == 2
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+
+    # Templates which were not used during the run are dropped
+    cache = await _async_restart()
+    assert len(cache) == 1
+
+    with patch(
+        "homeassistant.helpers.template._compiled_template_cache_version",
+        return_value=(b"", "0", "0"),
+    ):
+        cache = await _async_restart()
+    assert len(cache) == 0
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+import collections
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -13,6 +14,7 @@ import threading
 import time
 from typing import Any
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
+import weakref
 
 import pytest
 from pytest_unordered import unordered
@@ -826,6 +828,189 @@ async def test_eventbus_run_immediately_not_callback(hass: HomeAssistant) -> Non
         hass.bus.async_listen("test", listener, run_immediately=True)
 
 
+async def test_eventbus_indexed_listener(hass: HomeAssistant) -> None:
+    """Test indexed listeners are routed by event data key."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_ENTITY_ID, ["light.kitchen", "light.hall"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.hall",
+    ]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_eventbus_indexed_listener_domain(hass: HomeAssistant) -> None:
+    """Test indexed listeners routed by domain."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_DOMAIN, "light", listener, run_immediately=True
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    hass.bus.async_fire("test", {})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    # No async_block_till_done here
+    assert len(calls) == 1
+    assert calls[0].data["entity_id"] == "light.kitchen"
+
+    unsub()
+
+
+async def test_eventbus_indexed_listener_unhashable_key(hass: HomeAssistant) -> None:
+    """Test events with keys which are not strings skip indexed listeners."""
+    calls = []
+    regular_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def regular_listener(event):
+        """Mock regular listener."""
+        regular_calls.append(event)
+
+    unsub_entity_id = hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_ENTITY_ID, "light.kitchen", listener
+    )
+    unsub_domain = hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_DOMAIN, "light", listener
+    )
+    unsub_data_key = hass.bus.async_listen_indexed("test", "device_id", "abc", listener)
+    unsub_regular = hass.bus.async_listen("test", regular_listener)
+
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen", "light.hall"]})
+    hass.bus.async_fire("test", {"entity_id": 1, "device_id": {"id": "abc"}})
+    hass.bus.async_fire("test", {"device_id": ["abc"]})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+    assert len(regular_calls) == 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "device_id": "abc"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert len(regular_calls) == 4
+
+    unsub_entity_id()
+    unsub_domain()
+    unsub_data_key()
+    unsub_regular()
+
+
+async def test_eventbus_indexed_listener_repeated_key(hass: HomeAssistant) -> None:
+    """Test a listener is only called once when a key is repeated."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_indexed(
+        "test",
+        ha.EVENT_INDEX_ENTITY_ID,
+        ["light.kitchen", "light.kitchen", "light.hall"],
+        listener,
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_indexed_listener_with_regular_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test indexed listeners run after match all and regular listeners."""
+    calls = []
+
+    @ha.callback
+    def match_all_listener(event):
+        calls.append("match_all")
+
+    @ha.callback
+    def regular_listener(event):
+        calls.append("regular")
+
+    @ha.callback
+    def indexed_listener(event):
+        calls.append("indexed")
+
+    unsub_indexed = hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_ENTITY_ID, "light.kitchen", indexed_listener
+    )
+    unsub_regular = hass.bus.async_listen("test", regular_listener)
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert calls == ["match_all", "regular", "indexed"]
+
+    unsub_indexed()
+    unsub_regular()
+    unsub_match_all()
+
+
+async def test_eventbus_indexed_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test indexed listener validation and double removal."""
+
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(
+            "test", ha.EVENT_INDEX_ENTITY_ID, "light.kitchen", listener, True
+        )
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed(
+            MATCH_ALL, ha.EVENT_INDEX_ENTITY_ID, "light.kitchen", listener
+        )
+
+    unsub = hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_ENTITY_ID, "light.kitchen", listener
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown indexed job listener" in caplog.text
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -957,6 +1142,106 @@ async def test_eventbus_max_length_exceeded(hass: HomeAssistant) -> None:
     assert exc_info.value.value == long_evt_name
 
 
+async def test_eventbus_async_fire_many(hass: HomeAssistant) -> None:
+    """Test firing a batch of events."""
+    calls = collections.defaultdict(list)
+
+    @ha.callback
+    def match_all_listener(event):
+        if event.event_type == "test":
+            calls["match_all"].append(event.data["entity_id"])
+
+    @ha.callback
+    def listener(event):
+        calls["regular"].append(event.data["entity_id"])
+
+    @ha.callback
+    def filtered_listener(event):
+        calls["filtered"].append(event.data["entity_id"])
+
+    @ha.callback
+    def immediate_listener(event):
+        calls["immediate"].append(event.data["entity_id"])
+
+    @ha.callback
+    def indexed_listener(event):
+        calls["indexed"].append(event.data["entity_id"])
+
+    async def coroutine_listener(event):
+        calls["coroutine"].append(event.data["entity_id"])
+
+    @ha.callback
+    def light_filter(event):
+        return event.data["entity_id"].startswith("light.")
+
+    hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen(
+        "test",
+        filtered_listener,
+        event_filter=light_filter,
+    )
+    hass.bus.async_listen("test", immediate_listener, run_immediately=True)
+    hass.bus.async_listen_indexed(
+        "test", ha.EVENT_INDEX_DOMAIN, "switch", indexed_listener
+    )
+    hass.bus.async_listen("test", coroutine_listener)
+
+    context = ha.Context()
+    entity_ids = ["light.kitchen", "switch.fan", "light.bed", "switch.tv"]
+    with patch.object(hass.loop, "call_soon", wraps=hass.loop.call_soon) as call_soon:
+        hass.bus.async_fire_many(
+            "test", [({"entity_id": entity_id}, context) for entity_id in entity_ids]
+        )
+    # The immediate listener is not scheduled and the coroutine listener
+    # is run in a task per event
+    assert calls == {"immediate": entity_ids}
+    # Each callback listener is scheduled once for the whole batch
+    assert [call[0][0] for call in call_soon.call_args_list].count(
+        ha._run_callback_batch
+    ) == 4
+
+    await hass.async_block_till_done()
+    assert calls == {
+        "match_all": entity_ids,
+        "regular": entity_ids,
+        "filtered": ["light.kitchen", "light.bed"],
+        "immediate": entity_ids,
+        "indexed": ["switch.fan", "switch.tv"],
+        "coroutine": entity_ids,
+    }
+
+
+async def test_eventbus_async_fire_many_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test errors of a listener don't stop the batch."""
+    calls = []
+
+    @ha.callback
+    def event_filter(event):
+        if event.data["idx"] == 0:
+            raise ValueError("Filter error")
+        return True
+
+    @ha.callback
+    def listener(event):
+        if event.data["idx"] == 1:
+            raise ValueError("Listener error")
+        calls.append(event.data["idx"])
+
+    hass.bus.async_listen("test", listener, event_filter=event_filter)
+    hass.bus.async_fire_many("test", [({"idx": idx}, None) for idx in range(3)])
+    await hass.async_block_till_done()
+
+    assert calls == [2]
+    assert "Error in event filter" in caplog.text
+    assert "Error running job" in caplog.text
+
+    with pytest.raises(MaxLengthExceeded):
+        hass.bus.async_fire_many("t" * 65, [({}, None)])
+
+
 def test_state_init() -> None:
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
@@ -966,6 +1251,12 @@ def test_state_init() -> None:
         ha.State("domain.long_state", "t" * 256)
 
 
+def test_state_weakref() -> None:
+    """Test a state can be weakly referenced."""
+    state = ha.State("light.bedroom", "on")
+    assert weakref.ref(state)() is state
+
+
 def test_state_domain() -> None:
     """Test domain."""
     state = ha.State("some_domain.hello", "world")
@@ -1111,6 +1402,37 @@ async def test_statemachine_last_changed_not_updated_on_same_state(
     assert state.last_changed == state2.last_changed
 
 
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test unchanged attributes are shared with the previous state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.attributes is state.attributes
+
+    hass.states.async_set_many([ha.StateWrite("light.bowl", "on", {"brightness": 100})])
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    state4 = hass.states.get("light.bowl")
+    assert state4.attributes is not state.attributes
+    assert state4.attributes == {"brightness": 50}
+
+
+def test_state_shares_read_only_attributes() -> None:
+    """Test a state does not copy read only attributes."""
+    attributes = ReadOnlyDict({"brightness": 100})
+    state = ha.State("light.bowl", "on", attributes)
+    assert state.attributes is attributes
+
+    mutable_attributes = {"brightness": 100}
+    state = ha.State("light.bowl", "on", mutable_attributes)
+    assert state.attributes is not mutable_attributes
+    assert isinstance(state.attributes, ReadOnlyDict)
+
+
 async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     """Test force update option."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1125,6 +1447,92 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.unchanged", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("light.bowl", "off"),
+            ha.StateWrite("Light.New", "on", {"brightness": 50}),
+            ha.StateWrite("light.unchanged", "on"),
+            ha.StateWrite("light.new", "on", {"brightness": 60}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "off"
+    new_state = hass.states.get("light.new")
+    assert new_state.state == "on"
+    assert new_state.attributes == {"brightness": 60}
+    assert [
+        (
+            event.data["entity_id"],
+            event.data["old_state"] and event.data["old_state"].attributes,
+            event.data["new_state"].attributes,
+        )
+        for event in events
+    ] == [
+        ("light.bowl", {"brightness": 100}, {}),
+        ("light.new", None, {"brightness": 50}),
+        ("light.new", {"brightness": 50}, {"brightness": 60}),
+    ]
+    # All states in a batch share the same timestamp
+    assert len({event.time_fired for event in events}) == 1
+    assert events[0].time_fired == hass.states.get("light.bowl").last_updated
+    # The state only changed for the first write of light.new
+    assert new_state.last_changed == events[1].data["new_state"].last_changed
+
+
+async def test_statemachine_async_set_many_force_update_and_context(
+    hass: HomeAssistant,
+) -> None:
+    """Test force update and context when setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("light.bowl", "on", None, True, context),
+            ha.StateWrite("light.kitchen", "on"),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert events[0].context is context
+    assert hass.states.get("light.bowl").context is context
+    assert events[1].context is hass.states.get("light.kitchen").context
+    assert events[1].context is not context
+
+
+async def test_statemachine_async_set_many_invalid(hass: HomeAssistant) -> None:
+    """Test an invalid state leaves the state machine untouched."""
+    hass.states.async_set("light.bowl", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ha.StateWrite("light.bowl", "off"),
+                ha.StateWrite("light.kitchen", "x" * 256),
+            ]
+        )
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [ha.StateWrite("light.bowl", "off"), ha.StateWrite("invalid", "on")]
+        )
+
+    await hass.async_block_till_done()
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.kitchen") is None
+    assert len(events) == 0
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import sys
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -6,9 +9,16 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -206,6 +216,93 @@ async def test_get_integration_custom_component(
     assert integration.name == "Test Package"
 
 
+async def test_manifest_index(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test built-in integrations are resolved from the manifest index."""
+    await loader.async_load_manifest_index(hass)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == HA_VERSION
+    assert data["manifests"]["hue"]["name"] == "Philips Hue"
+
+    data["manifests"]["hue"]["name"] = "Indexed Hue"
+    await loader.async_load_manifest_index(hass)
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Indexed Hue"
+    assert integration.file_path == loader.pathlib.Path(hue.__file__).parent
+
+    # The index is rebuilt for a new version
+    data["ha_version"] = "0.1"
+    await loader.async_load_manifest_index(hass)
+    assert hass.data[loader.DATA_MANIFEST_INDEX]["hue"]["name"] == "Philips Hue"
+
+    # The index is rebuilt when a manifest is modified
+    data["ha_version"] = HA_VERSION
+    data["manifests"]["hue"]["name"] = "Indexed Hue"
+    await loader.async_load_manifest_index(hass)
+    assert hass.data[loader.DATA_MANIFEST_INDEX]["hue"]["name"] == "Indexed Hue"
+    count, mtime = data["manifest_stat"]
+    data["manifest_stat"] = [count, mtime - 1]
+    await loader.async_load_manifest_index(hass)
+    assert hass.data[loader.DATA_MANIFEST_INDEX]["hue"]["name"] == "Philips Hue"
+
+
+async def test_warm_import_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are imported in dependency order."""
+    integrations = await loader.async_get_integrations(hass, ["api", "http"])
+    for integration in integrations.values():
+        assert await integration.resolve_dependencies()
+
+    with patch.dict(sys.modules), patch(
+        "homeassistant.loader.importlib.import_module"
+    ) as mock_import:
+        for module in list(sys.modules):
+            if module.startswith(
+                ("homeassistant.components.api", "homeassistant.components.http")
+            ):
+                del sys.modules[module]
+        await loader.async_warm_import_integrations(
+            hass, [integrations["api"], integrations["http"]]
+        )
+
+    assert [call[0][0] for call in mock_import.call_args_list] == [
+        "homeassistant.components.http",
+        "homeassistant.components.api",
+    ]
+    assert set(hass.data[loader.DATA_IMPORT_TIME]) == {"api", "http"}
+
+
+async def test_warm_import_platforms(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test the entity platforms of an integration are imported."""
+    integration = await loader.async_get_integration(hass, "test")
+
+    with patch.dict(sys.modules), patch(
+        "homeassistant.loader.importlib.import_module"
+    ) as mock_import:
+        for module in list(sys.modules):
+            if module.startswith("custom_components.test"):
+                del sys.modules[module]
+        import_time = integration.warm_import()
+
+    # The import time is added in the event loop by the caller
+    assert import_time > timedelta()
+    assert loader.DATA_IMPORT_TIME not in hass.data
+
+    modules = [call[0][0] for call in mock_import.call_args_list]
+    assert modules[0] == "custom_components.test"
+    assert {"custom_components.test.light", "custom_components.test.sensor"} <= set(
+        modules
+    )
+    # Other modules of the integration are not imported
+    assert "custom_components.test.translations" not in modules
+
+
 def test_integration_properties(hass: HomeAssistant) -> None:
     """Test integration properties."""
     integration = loader.Integration(
@@ -615,6 +615,70 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "from_unit", "to_unit"),
+    [
+        # Process all items in _CONVERTED_VALUE
+        (converter, from_unit, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for _, from_unit, _, to_unit in item
+    ],
+)
+def test_unit_conversion_many(
+    converter: type[BaseUnitConverter], from_unit: str, to_unit: str
+) -> None:
+    """Test converting many values gives the same result as converting each."""
+    values = [-40.5, 0, 1, 12.3, 1000000]
+    convert = converter.converter_factory(from_unit, to_unit)
+    expected = [convert(value) for value in values]
+    assert converter.convert_many(values, from_unit, to_unit) == expected
+    assert converter.converter_factory_many(from_unit, to_unit)(values) == expected
+    assert converter.converter_factory_many_allow_none(from_unit, to_unit)(
+        [None, *values, None]
+    ) == [None, *expected, None]
+
+
+@pytest.mark.parametrize(
+    ("converter", "valid_unit"),
+    [
+        # Ensure all units are tested
+        (converter, valid_unit)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        for valid_unit in valid_units
+    ],
+)
+def test_unit_conversion_many_same_unit(
+    converter: type[BaseUnitConverter], valid_unit: str
+) -> None:
+    """Test converting many values to the same unit returns a copy."""
+    values = [1.5, None, 2]
+    converted = converter.converter_factory_many_allow_none(valid_unit, valid_unit)(
+        values
+    )
+    assert converted == values
+    assert converted is not values
+    assert converter.convert_many(iter([1.5, 2]), valid_unit, valid_unit) == [1.5, 2]
+
+
+@pytest.mark.parametrize(
+    ("converter", "valid_unit"),
+    [
+        # Ensure all units are tested
+        (converter, valid_unit)
+        for converter, valid_units in _ALL_CONVERTERS.items()
+        for valid_unit in valid_units
+    ],
+)
+def test_unit_conversion_many_invalid_unit(
+    converter: type[BaseUnitConverter], valid_unit: str
+) -> None:
+    """Test converting many values with an invalid unit raises."""
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.convert_many([1], valid_unit, INVALID_SYMBOL)
+    with pytest.raises(HomeAssistantError, match="is not a recognized .* unit"):
+        converter.convert_many([1], INVALID_SYMBOL, valid_unit)
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [